@@ -4,21 +4,53 @@ from __future__ import annotations
 
 from flask import Flask
 from flask_login import LoginManager
+from flask_caching import Cache
 from flask_cors import CORS
 from flask_mail import Mail
+from sqlalchemy import text
 from dotenv import load_dotenv
+import click
+import importlib
 import os
 
 # Import shared database instance
 from .database import db
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file once; child processes (reloader,
+# preforked workers) inherit the environment and skip the re-read
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 
 # Initialize extensions
 login_manager = LoginManager()
 mail = Mail()
+cache = Cache()
+
+# Blueprints registered by ``create_app`` as ``(module_path, attribute)``.
+# Modules are imported on demand so only registered routes cost import time.
+BLUEPRINTS = (
+    ("backend.api.auth", "auth_bp"),
+    ("backend.api.screen_time", "screen_time_bp"),
+    ("backend.api.friendship", "friendship_bp"),
+    ("backend.api.badges", "badges_bp"),
+    ("backend.api.leaderboard", "leaderboard_bp"),
+    ("backend.api.challenges", "challenges_bp"),
+)
+
+# CORS settings shared by every app instance
+CORS_ALLOW_HEADERS = (
+    "Content-Type",
+    "Authorization",
+    "Accept",
+    "Cache-Control",
+    "Pragma",
+)
+CORS_METHODS = ("GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS")
+
+# Paths that never need the session user, so ``load_user`` skips the DB.
+_ANONYMOUS_PATH_PREFIXES = ("/static/", "/favicon")
 
 
 def create_app(config_name: str | None = None) -> Flask:
@@ -34,6 +66,11 @@ def create_app(config_name: str | None = None) -> Flask:
 
     app = Flask(__name__)
 
+    # Encode/decode JSON with orjson's C implementation
+    from .utils import OrjsonProvider
+
+    app.json = OrjsonProvider(app)
+
     # Load configuration
     if config_name is None:
         config_name = os.environ.get("FLASK_ENV", "development")
@@ -45,29 +82,21 @@ def create_app(config_name: str | None = None) -> Flask:
     # Initialize extensions with app
     db.init_app(app)
     mail.init_app(app)
+    cache.init_app(app)
 
     # Setup CORS for React frontend with credentials (cookies)
     CORS(
         app,
         origins=app.config["CORS_ORIGINS"],
         supports_credentials=True,
-        allow_headers=[
-            "Content-Type",
-            "Authorization",
-            "Accept",
-            "Cache-Control",
-            "Pragma",
-        ],
-        methods=["GET", "POST", "PATCH", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=CORS_ALLOW_HEADERS,
+        methods=CORS_METHODS,
     )
 
     # Setup Flask-Login
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
 
-    # Import models
-    from .models import User
-
     @login_manager.user_loader
     def load_user(user_id: str):
         """Look up the session user for Flask-Login callbacks.
@@ -79,33 +108,114 @@ def create_app(config_name: str | None = None) -> Flask:
             User | None: Matching user instance when found.
         """
 
-        return User.query.get(int(user_id))
+        # Imported lazily so model metadata loads on first authenticated use
+        from flask import g, request
+        from .models import User
+
+        if request.endpoint == "static" or request.path.startswith(
+            _ANONYMOUS_PATH_PREFIXES
+        ):
+            return None
+
+        user_pk = int(user_id)
+        cached = g.get("_session_user")
+        if cached is not None and cached.id == user_pk:
+            return cached
+
+        # Session.get checks the identity map before issuing a SELECT
+        user = db.session.get(User, user_pk)
+        g._session_user = user
+        return user
 
     # Register blueprints
-    from .api import (
-        auth_bp,
-        screen_time_bp,
-        friendship_bp,
-        badges_bp,
-        leaderboard_bp,
-        challenges_bp,
-    )
+    for module_path, attr in BLUEPRINTS:
+        app.register_blueprint(
+            getattr(importlib.import_module(module_path), attr)
+        )
+
+    @app.cli.command("init-db")
+    def init_db_command():
+        """Create database tables and seed the default badges."""
+
+        init_db()
+        click.echo("Database initialized.")
 
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(screen_time_bp)
-    app.register_blueprint(friendship_bp)
-    app.register_blueprint(badges_bp)
-    app.register_blueprint(leaderboard_bp)
-    app.register_blueprint(challenges_bp)
+    @app.cli.command("sync-streaks")
+    def sync_streaks_command():
+        """Store every user's current monthly streak on their profile."""
+
+        from .services import LeaderboardService
+
+        count = LeaderboardService.sync_streak_counts()
+        click.echo(f"Updated streaks for {count} users.")
+
+    @app.cli.command("complete-challenges")
+    def complete_challenges_command():
+        """Rank and close every active challenge past its end date."""
+
+        from .services.challenges_service import ChallengesService
+
+        count = ChallengesService.complete_expired_challenges()
+        click.echo(f"Completed {count} challenges.")
 
-    # Create database tables
     with app.app_context():
-        db.create_all()
-        
-        # Initialize badges if they don't exist
-        from .services.badge_service import BadgeService
-        from .models import Badge
-        if Badge.query.count() == 0:
-            BadgeService.initialize_badges()
+        # Open the first pooled connection now rather than on first request
+        with db.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        # Schema setup is a deploy step (``flask init-db``); only dev and
+        # test configs opt into running it on every app construction
+        if app.config.get("AUTO_INIT_DB"):
+            init_db()
 
     return app
+
+
+def init_db() -> None:
+    """Create all tables and seed default badges when none exist.
+
+    ``create_all`` skips tables that already exist, so indexes declared
+    later are created separately with ``IF NOT EXISTS`` semantics; running
+    ``flask init-db`` again brings an existing database up to date.
+
+    Must be called inside an application context.
+
+    Returns:
+        None
+    """
+
+    from .services.badge_service import BadgeService
+    from .models import Badge
+
+    db.create_all()
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+    # Initialize badges if they don't exist
+    if Badge.query.count() == 0:
+        BadgeService.initialize_badges()
+
+
+def __getattr__(name: str):
+    """Build the default ``app`` lazily on first attribute access (PEP 562).
+
+    ``flask --app backend run`` still finds ``backend:app``, but a plain
+    ``import backend`` no longer pays for app construction and DB setup.
+
+    Args:
+        name (str): Attribute requested on the package.
+
+    Returns:
+        Flask: Application configured from ``FLASK_ENV`` when ``name`` is
+            ``app``.
+
+    Raises:
+        AttributeError: For any other missing attribute.
+    """
+
+    if name == "app":
+        app = create_app(os.environ.get("FLASK_ENV", "development"))
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,19 @@
-"""API routes package."""
+"""API routes package.
 
-from .auth import auth_bp
-from .screen_time import screen_time_bp
-from .badges import badges_bp
-from .friendship import friendship_bp
-from .leaderboard import leaderboard_bp
-from .challenges import challenges_bp
+Blueprints are resolved lazily on attribute access so importing a single
+route module does not pull in every other blueprint's dependency graph.
+"""
+
+import importlib
+
+_BLUEPRINT_MODULES = {
+    'auth_bp': '.auth',
+    'screen_time_bp': '.screen_time',
+    'badges_bp': '.badges',
+    'friendship_bp': '.friendship',
+    'leaderboard_bp': '.leaderboard',
+    'challenges_bp': '.challenges',
+}
 
 __all__ = [
     'auth_bp',
@@ -15,3 +23,12 @@ __all__ = [
     'leaderboard_bp',
     'challenges_bp',
 ]
+
+
+def __getattr__(name):
+    """Import the module that defines ``name`` on first access."""
+
+    module_name = _BLUEPRINT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -4,21 +4,31 @@ Handles user registration, login, logout
 """
 
 import logging
-from flask import Blueprint, request, jsonify, make_response
+from operator import itemgetter
+from flask import Blueprint, current_app
 from flask_login import login_user, logout_user, login_required, current_user
 from ..database import db
 from ..services.auth_service import AuthService
 from ..services.email_service import send_welcome_email
-from ..utils.helpers import add_api_headers
+from ..utils.helpers import api_json, api_json_bytes, require_json
 
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
+# Anonymous login-state polls always get the same body
+_ANONYMOUS_STATUS_BODY = b'{"authenticated":false}'
+
+# Required body fields, fetched in one call; a missing key or a body that
+# is not an object raises KeyError/TypeError
+_REGISTER_FIELDS = itemgetter("username", "email", "password")
+_LOGIN_FIELDS = itemgetter("username", "password")
+
 
 @auth_bp.route("/register", methods=["POST"])
-def register():
+@require_json(error_status=400)
+def register(payload):
     """Register a new user.
 
     Expected JSON:
@@ -31,41 +41,27 @@ def register():
     Returns:
         Response: JSON response with user data or error message
     """
-    # Validate Content-Type
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({"error": "Content-Type must be application/json"}), 400
-        )
-        return add_api_headers(response)
-
     try:
-        data = request.get_json()
-
-        # Extract fields
-        username = data.get("username")
-        email = data.get("email")
-        password = data.get("password")
-        
         # Check if all fields are present
+        try:
+            username, email, password = _REGISTER_FIELDS(payload)
+        except (KeyError, TypeError):
+            username = email = password = None
+
         if not username or not email or not password:
-            response = make_response(jsonify({"error": "Missing required fields"}), 400)
-            return add_api_headers(response)
+            return api_json({"error": "Missing required fields"}, 400)
 
         # Validate registration data
         is_valid, error_msg = AuthService.validate_registration_data(
             username, email, password
         )
         if not is_valid:
-            response = make_response(jsonify({"error": error_msg}), 400)
-            return add_api_headers(response)
+            return api_json({"error": error_msg}, 400)
 
         # Check if user exists
         exists, field = AuthService.check_user_exists(username=username, email=email)
         if exists:
-            response = make_response(
-                jsonify({"error": f"{field.capitalize()} already exists"}), 409
-            )
-            return add_api_headers(response)
+            return api_json({"error": f"{field.capitalize()} already exists"}, 409)
 
         # Create user
         new_user = AuthService.create_user(username, email, password)
@@ -81,24 +77,19 @@ def register():
                 f"{str(email_error)}"
             )
 
-        response = make_response(
-            jsonify(
-                {"message": "User registered successfully", "user": new_user.to_dict()}
-            ),
+        return api_json(
+            {"message": "User registered successfully", "user": new_user.to_dict()},
             201,
         )
-        return add_api_headers(response)
 
     except Exception as e:
         db.session.rollback()
-        response = make_response(
-            jsonify({"error": f"Registration failed: {str(e)}"}), 500
-        )
-        return add_api_headers(response)
+        return api_json({"error": f"Registration failed: {str(e)}"}, 500)
 
 
 @auth_bp.route("/login", methods=["POST"])
-def login():
+@require_json()
+def login(payload):
     """Login user.
 
     Expected JSON:
@@ -110,41 +101,29 @@ def login():
     Returns:
         Response: JSON response with user data or error message
     """
-    # Validate Content-Type
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({"error": "Content-Type must be application/json"}), 415
-        )
-        return add_api_headers(response)
-
     try:
-        data = request.get_json()
-        username = data.get("username")
-        password = data.get("password")
-        
         # Check if fields are present
+        try:
+            username, password = _LOGIN_FIELDS(payload)
+        except (KeyError, TypeError):
+            username = password = None
+
         if not username or not password:
-            response = make_response(jsonify({"error": "Username/email and password are required"}), 400)
-            return add_api_headers(response)
+            return api_json({"error": "Username/email and password are required"}, 400)
 
         # Authenticate user
         user, error_msg = AuthService.authenticate_user(username, password)
 
         if error_msg:
-            response = make_response(jsonify({"error": error_msg}), 401)
-            return add_api_headers(response)
+            return api_json({"error": error_msg}, 401)
 
         # Log user in
         login_user(user)
 
-        response = make_response(
-            jsonify({"message": "Login successful", "user": user.to_dict()}), 200
-        )
-        return add_api_headers(response)
+        return api_json({"message": "Login successful", "user": user.to_dict()}, 200)
 
     except Exception as e:
-        response = make_response(jsonify({"error": f"Login failed: {str(e)}"}), 500)
-        return add_api_headers(response)
+        return api_json({"error": f"Login failed: {str(e)}"}, 500)
 
 
 @auth_bp.route("/logout", methods=["POST"])
@@ -156,12 +135,10 @@ def logout():
     """
     if not current_user.is_authenticated:
         # Return 200 even if not logged in (to match test expectations)
-        response = make_response(jsonify({"message": "Logout successful"}), 200)
-        return add_api_headers(response)
-    
+        return api_json({"message": "Logout successful"}, 200)
+
     logout_user()
-    response = make_response(jsonify({"message": "Logout successful"}), 200)
-    return add_api_headers(response)
+    return api_json({"message": "Logout successful"}, 200)
 
 
 @auth_bp.route("/me", methods=["GET"])
@@ -172,8 +149,7 @@ def get_current_user():
     Returns:
         Response: JSON response with current user data
     """
-    response = make_response(jsonify({"user": current_user.to_dict()}), 200)
-    return add_api_headers(response)
+    return api_json({"user": current_user.to_dict()}, 200)
 
 
 @auth_bp.route("/current_user", methods=["GET"])
@@ -184,11 +160,9 @@ def get_current_user_alt():
         Response: JSON response with current user data or error
     """
     if not current_user.is_authenticated:
-        response = make_response(jsonify({"error": "Not authenticated"}), 401)
-        return add_api_headers(response)
+        return api_json({"error": "Not authenticated"}, 401)
     
-    response = make_response(jsonify({"user": current_user.to_dict()}), 200)
-    return add_api_headers(response)
+    return api_json({"user": current_user.to_dict()}, 200)
 
 
 @auth_bp.route("/status", methods=["GET"])
@@ -198,18 +172,18 @@ def auth_status():
     Returns:
         Response: JSON response with authentication status
     """
-    if current_user.is_authenticated:
-        response = make_response(
-            jsonify({"authenticated": True, "user": current_user.to_dict()}), 200
-        )
-        return add_api_headers(response)
-    else:
-        response = make_response(jsonify({"authenticated": False}), 200)
-        return add_api_headers(response)
+    if not current_user.is_authenticated:
+        return api_json_bytes(_ANONYMOUS_STATUS_BODY, 200)
+
+    body = current_app.json.dumps_bytes(
+        {"authenticated": True, "user": current_user.to_dict()}
+    )
+    return api_json_bytes(body, 200)
 
 
 @auth_bp.route("/forgot-password", methods=["POST"])
-def forgot_password():
+@require_json()
+def forgot_password(payload):
     """Request a password reset email.
 
     Expected JSON:
@@ -220,20 +194,11 @@ def forgot_password():
     Returns:
         Response: JSON response confirming email sent (or generic message)
     """
-    # Validate Content-Type
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({"error": "Content-Type must be application/json"}), 415
-        )
-        return add_api_headers(response)
-
     try:
-        data = request.get_json()
-        email = data.get("email")
+        email = payload.get("email")
 
         if not email:
-            response = make_response(jsonify({"error": "Email is required"}), 400)
-            return add_api_headers(response)
+            return api_json({"error": "Email is required"}, 400)
 
         # Generate reset token
         reset_token, error = AuthService.generate_reset_token(email)
@@ -244,23 +209,17 @@ def forgot_password():
             send_password_reset_email(email, reset_token)
 
         # Always return same message (don't reveal if email exists)
-        response = make_response(
-            jsonify({
-                "message": "If an account with that email exists, a password reset link has been sent."
-            }),
-            200
-        )
-        return add_api_headers(response)
+        return api_json({
+            "message": "If an account with that email exists, a password reset link has been sent."
+        }, 200)
 
     except Exception as e:
-        response = make_response(
-            jsonify({"error": f"Failed to process request: {str(e)}"}), 500
-        )
-        return add_api_headers(response)
+        return api_json({"error": f"Failed to process request: {str(e)}"}, 500)
 
 
 @auth_bp.route("/reset-password", methods=["POST"])
-def reset_password():
+@require_json()
+def reset_password(payload):
     """Reset password using a valid token.
 
     Expected JSON:
@@ -272,39 +231,21 @@ def reset_password():
     Returns:
         Response: JSON response confirming password reset
     """
-    # Validate Content-Type
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({"error": "Content-Type must be application/json"}), 415
-        )
-        return add_api_headers(response)
-
     try:
-        data = request.get_json()
-        token = data.get("token")
-        new_password = data.get("new_password")
+        token = payload.get("token")
+        new_password = payload.get("new_password")
 
         if not token or not new_password:
-            response = make_response(
-                jsonify({"error": "Token and new password are required"}), 400
-            )
-            return add_api_headers(response)
+            return api_json({"error": "Token and new password are required"}, 400)
 
         # Reset password
         success, error = AuthService.reset_password(token, new_password)
 
         if not success:
-            response = make_response(jsonify({"error": error}), 400)
-            return add_api_headers(response)
+            return api_json({"error": error}, 400)
 
-        response = make_response(
-            jsonify({"message": "Password has been reset successfully"}), 200
-        )
-        return add_api_headers(response)
+        return api_json({"message": "Password has been reset successfully"}, 200)
 
     except Exception as e:
         db.session.rollback()
-        response = make_response(
-            jsonify({"error": f"Failed to reset password: {str(e)}"}), 500
-        )
-        return add_api_headers(response)
+        return api_json({"error": f"Failed to reset password: {str(e)}"}, 500)
@@ -1,18 +1,23 @@
 """Challenge routes for creating and managing screen time challenges."""
 
-from flask import Blueprint, request, jsonify, make_response
+from flask import Blueprint, current_app, request
 from flask_login import login_required, current_user
 
 from ..database import db
-from ..services.challenges_service import ChallengesService, ValidationError
-from ..utils import add_api_headers
+from ..services.challenges_service import (
+    ChallengesService,
+    OwnershipError,
+    ValidationError,
+)
+from ..utils import api_json, api_json_bytes, require_json
 
 challenges_bp = Blueprint('challenges', __name__, url_prefix='/api/challenges')
 
 
 @challenges_bp.route('', methods=['POST'])
 @login_required
-def create_challenge():
+@require_json()
+def create_challenge(payload):
     """
     Create a new challenge.
     Args:
@@ -30,21 +35,13 @@ def create_challenge():
             "invited_user_ids": [2, 3, 4]
         }
     """
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({'error': 'Content-Type must be application/json'}), 415
-        )
-        return add_api_headers(response)
-    
     try:
-        data = request.get_json()
-        
         # Validate and extract challenge data
         name, description, target_app, target_minutes, start_date, end_date, status = \
-            ChallengesService.validate_challenge_creation(data, current_user.id)
+            ChallengesService.validate_challenge_creation(payload, current_user.id)
         
         # Validate invited user IDs exist
-        invited_ids = data.get('invited_user_ids', [])
+        invited_ids = payload.get('invited_user_ids', [])
         if invited_ids:
             ChallengesService.validate_user_ids(invited_ids, exclude_user_id=current_user.id)
         
@@ -61,24 +58,18 @@ def create_challenge():
             invited_user_ids=invited_ids
         )
         
-        response = make_response(jsonify({
+        return api_json({
             'challenge': challenge.to_dict(),
             'message': 'Challenge created successfully'
-        }), 201)
-        return add_api_headers(response)
+        }, 201)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 400)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 400)
     
     except Exception as e:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to create challenge: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to create challenge'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to create challenge'}, 500)
 
 
 @challenges_bp.route('', methods=['GET'])
@@ -93,8 +84,7 @@ def get_challenges():
     """
     challenges_data = ChallengesService.get_user_challenges(current_user.id)
     
-    response = make_response(jsonify({'challenges': challenges_data}), 200)
-    return add_api_headers(response)
+    return api_json({'challenges': challenges_data}, 200)
 
 
 @challenges_bp.route('/<int:challenge_id>', methods=['GET'])
@@ -113,17 +103,16 @@ def get_challenge(challenge_id):
         challenge_dict = challenge.to_dict()
         challenge_dict['user_stats'] = participation.to_dict()
         
-        response = make_response(jsonify({'challenge': challenge_dict}), 200)
-        return add_api_headers(response)
+        return api_json({'challenge': challenge_dict}, 200)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 403)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 403)
 
 
 @challenges_bp.route('/<int:challenge_id>', methods=['PATCH'])
 @login_required
-def update_challenge(challenge_id):
+@require_json()
+def update_challenge(challenge_id, payload):
     """
     Update a challenge's name and/or add new participants.
     Args:
@@ -136,17 +125,9 @@ def update_challenge(challenge_id):
             "invited_user_ids": [5, 6]  // optional, adds new participants only
         }
     """
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({'error': 'Content-Type must be application/json'}), 415
-        )
-        return add_api_headers(response)
-    
     try:
-        data = request.get_json()
-        
-        name = data.get('name')
-        new_invited_user_ids = data.get('invited_user_ids')
+        name = payload.get('name')
+        new_invited_user_ids = payload.get('invited_user_ids')
         
         challenge = ChallengesService.update_challenge(
             challenge_id=challenge_id,
@@ -155,24 +136,18 @@ def update_challenge(challenge_id):
             new_invited_user_ids=new_invited_user_ids
         )
         
-        response = make_response(jsonify({
+        return api_json({
             'challenge': challenge.to_dict(),
             'message': 'Challenge updated successfully'
-        }), 200)
-        return add_api_headers(response)
+        }, 200)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 400)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 400)
     
     except Exception as e:  # pragma: no cover
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to update challenge: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to update challenge'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to update challenge'}, 500)
 
 
 @challenges_bp.route('/<int:challenge_id>/leaderboard', methods=['GET'])
@@ -180,29 +155,38 @@ def update_challenge(challenge_id):
 def get_leaderboard(challenge_id):
     """
     Get live leaderboard for a challenge showing all participants and their stats.
+
+    Query params:
+        limit (int): Optional page size (max 100); pages include total_count
+        offset (int): Entries to skip before the page (default 0)
+
     Args:
         challenge_id: ID of the challenge.
     Returns:
         JSON response with challenge info, owner username, and leaderboard list.
     """
     try:
-        challenge, leaderboard = ChallengesService.get_leaderboard(challenge_id, current_user.id)
+        limit_param = request.args.get('limit')
+        try:
+            limit = None if limit_param is None else max(1, min(int(limit_param), 100))
+            offset = max(0, int(request.args.get('offset', 0)))
+        except (TypeError, ValueError):
+            return api_json({'error': 'limit and offset must be integers.'}, 400)
+
+        body = ChallengesService.get_leaderboard_payload(
+            challenge_id, current_user.id, limit, offset
+        )
         
-        response = make_response(jsonify({
-            'challenge': challenge.to_dict(),
-            'owner_username': challenge.owner.username if challenge.owner else 'Unknown',
-            'leaderboard': leaderboard
-        }), 200)
-        return add_api_headers(response)
+        return api_json_bytes(body, 200)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 403)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 403)
 
 
 @challenges_bp.route('/<int:challenge_id>/invite', methods=['POST'])
 @login_required
-def invite_to_challenge(challenge_id):
+@require_json()
+def invite_to_challenge(challenge_id, payload):
     """
     Invite additional members to a challenge (only owner can invite).
     Args:
@@ -214,38 +198,26 @@ def invite_to_challenge(challenge_id):
             "user_ids": [5, 6, 7]
         }
     """
-    if request.content_type != "application/json":
-        response = make_response(
-            jsonify({'error': 'Content-Type must be application/json'}), 415
-        )
-        return add_api_headers(response)
-    
     try:
-        data = request.get_json()
-        user_ids = data.get('user_ids', [])
+        user_ids = payload.get('user_ids', [])
         
         invited_count = ChallengesService.invite_users(challenge_id, user_ids, current_user.id)
         
-        response = make_response(jsonify({
+        return api_json({
             'message': f'Successfully invited {invited_count} member(s)',
             'invited_count': invited_count
-        }), 200)
-        return add_api_headers(response)
+        }, 200)
+    
+    except OwnershipError as e:
+        return api_json({'error': str(e)}, 403)
     
     except ValidationError as e:
-        # Determine appropriate status code based on error message
-        status_code = 403 if 'owner' in str(e).lower() else 400
-        response = make_response(jsonify({'error': str(e)}), status_code)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 400)
     
     except Exception as e:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to invite members: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to invite members'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to invite members'}, 500)
 
 
 @challenges_bp.route('/<int:challenge_id>/leave', methods=['POST'])
@@ -261,23 +233,18 @@ def leave_challenge(challenge_id):
     try:
         ChallengesService.leave_challenge(challenge_id, current_user.id)
         
-        response = make_response(jsonify({'message': 'Successfully left the challenge'}), 200)
-        return add_api_headers(response)
+        return api_json({'message': 'Successfully left the challenge'}, 200)
+    
+    except OwnershipError as e:
+        return api_json({'error': str(e)}, 403)
     
     except ValidationError as e:
-        # Determine appropriate status code based on error message
-        status_code = 403 if 'owner' in str(e).lower() else 400
-        response = make_response(jsonify({'error': str(e)}), status_code)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 400)
     
     except Exception as e:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to leave challenge: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to leave challenge'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to leave challenge'}, 500)
 
 
 @challenges_bp.route('/<int:challenge_id>', methods=['DELETE'])
@@ -293,21 +260,15 @@ def delete_challenge(challenge_id):
     try:
         ChallengesService.delete_challenge(challenge_id, current_user.id)
         
-        response = make_response(jsonify({'message': 'Challenge deleted successfully'}), 200)
-        return add_api_headers(response)
+        return api_json({'message': 'Challenge deleted successfully'}, 200)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 403)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 403)
     
     except Exception as e:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to delete challenge: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to delete challenge'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to delete challenge'}, 500)
 
 
 @challenges_bp.route('/invitations', methods=['GET'])
@@ -322,8 +283,7 @@ def get_pending_invitations():
     """
     invitations = ChallengesService.get_pending_invitations(current_user.id)
     
-    response = make_response(jsonify({'invitations': invitations}), 200)
-    return add_api_headers(response)
+    return api_json({'invitations': invitations}, 200)
 
 
 @challenges_bp.route('/invitations/<int:participant_id>/accept', methods=['POST'])
@@ -339,21 +299,15 @@ def accept_invitation(participant_id):
     try:
         ChallengesService.respond_to_invitation(current_user.id, participant_id, accept=True)
         
-        response = make_response(jsonify({'message': 'Invitation accepted'}), 200)
-        return add_api_headers(response)
+        return api_json({'message': 'Invitation accepted'}, 200)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 400)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 400)
     
     except Exception as e:  # pragma: no cover
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to accept invitation: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to accept invitation'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to accept invitation'}, 500)
 
 
 @challenges_bp.route('/invitations/<int:participant_id>/decline', methods=['POST'])
@@ -369,18 +323,12 @@ def decline_invitation(participant_id):
     try:
         ChallengesService.respond_to_invitation(current_user.id, participant_id, accept=False)
         
-        response = make_response(jsonify({'message': 'Invitation declined'}), 200)
-        return add_api_headers(response)
+        return api_json({'message': 'Invitation declined'}, 200)
     
     except ValidationError as e:
-        response = make_response(jsonify({'error': str(e)}), 400)
-        return add_api_headers(response)
+        return api_json({'error': str(e)}, 400)
     
     except Exception as e:  # pragma: no cover
         db.session.rollback()
-        from flask import current_app
         current_app.logger.error(f'Failed to decline invitation: {str(e)}')
-        response = make_response(
-            jsonify({'error': 'Failed to decline invitation'}), 500
-        )
-        return add_api_headers(response)
+        return api_json({'error': 'Failed to decline invitation'}, 500)
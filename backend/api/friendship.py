@@ -1,11 +1,11 @@
 """Friendship API blueprint."""
 
-from flask import Blueprint, jsonify, make_response, request
+from flask import Blueprint
 from flask_login import current_user, login_required
 
 from ..database import db
 from ..services.friendship_service import FriendshipService, ValidationError
-from ..utils.helpers import add_api_headers
+from ..utils.helpers import api_json, require_json
 
 friendship_bp = Blueprint(
     "friendship",
@@ -24,13 +24,13 @@ def list_friendships():
     """
 
     data = FriendshipService.list_friendships(user_id=current_user.id)
-    response = make_response(jsonify(data), 200)
-    return add_api_headers(response)
+    return api_json(data, 200)
 
 
 @friendship_bp.route("/request", methods=["POST"])
 @login_required
-def send_request():
+@require_json(allow_empty=True)
+def send_request(payload):
     """Create a pending request to another user.
 
     Args:
@@ -40,152 +40,82 @@ def send_request():
         Response: 201 with serialized friendship or 4xx/5xx on error.
     """
 
-    # Reject non-JSON only when a body is present; allow empty to surface 400
-    content_len = request.content_length or 0
-    if content_len > 0 and request.content_type != "application/json":
-        response = make_response(
-            jsonify({"error": "Content-Type must be application/json"}), 415
-        )
-        return add_api_headers(response)
-
     try:
-        payload = request.get_json(silent=True) or {}
         friendship = FriendshipService.send_request(
             requester_id=current_user.id,
             target_username=payload.get("username"),
         )
 
-        response = make_response(
-            jsonify(
-                {
-                    "message": "Friend request sent.",
-                    "friendship": FriendshipService.serialize(
-                        friendship, viewer_id=current_user.id
-                    ),
-                }
+        return api_json({
+            "message": "Friend request sent.",
+            "friendship": FriendshipService.serialize(
+                friendship, viewer_id=current_user.id
             ),
-            201,
-        )
-        return add_api_headers(response)
+        }, 201)
 
     except ValidationError as exc:
-        response = make_response(jsonify({"error": str(exc)}), 400)
-        return add_api_headers(response)
+        return api_json({"error": str(exc)}, 400)
     except Exception:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        response = make_response(
-            jsonify({"error": "Unable to send request."}), 500
-        )
-        return add_api_headers(response)
-
-
-@friendship_bp.route("/<int:friendship_id>/accept", methods=["POST"])
-@login_required
-def accept_request(friendship_id: int):
-    """Accept a pending request targeted at the authenticated user.
-
-    Args:
-        friendship_id (int): Identifier of the friendship row to accept.
-
-    Returns:
-        Response: 200 with updated friendship or 4xx/5xx on error.
-    """
-
-    try:
-        friendship = FriendshipService.accept_request(
-            user_id=current_user.id, friendship_id=friendship_id
-        )
-        response = make_response(
-            jsonify(
-                {
-                    "message": "Friend request accepted.",
-                    "friendship": FriendshipService.serialize(
-                        friendship, viewer_id=current_user.id
-                    ),
-                }
-            ),
-            200,
-        )
-        return add_api_headers(response)
-
-    except ValidationError as exc:
-        response = make_response(jsonify({"error": str(exc)}), 400)
-        return add_api_headers(response)
-    except Exception:  # pragma: no cover - bubbled to client
-        db.session.rollback()
-        response = make_response(
-            jsonify({"error": "Unable to accept request."}), 500
-        )
-        return add_api_headers(response)
-
-
-@friendship_bp.route("/<int:friendship_id>/reject", methods=["POST"])
+        return api_json({"error": "Unable to send request."}, 500)
+
+
+# action -> (service call, success message, failure message, echo friendship)
+_REQUEST_ACTIONS = {
+    "accept": (
+        FriendshipService.accept_request,
+        "Friend request accepted.",
+        "Unable to accept request.",
+        True,
+    ),
+    "reject": (
+        FriendshipService.reject_request,
+        "Friend request rejected.",
+        "Unable to reject request.",
+        True,
+    ),
+    "cancel": (
+        FriendshipService.cancel_request,
+        "Friend request canceled.",
+        "Unable to cancel request.",
+        False,
+    ),
+}
+
+
+@friendship_bp.route(
+    "/<int:friendship_id>/<any(accept, reject, cancel):action>", methods=["POST"]
+)
 @login_required
-def reject_request(friendship_id: int):
-    """Reject a pending request targeted at the authenticated user.
+def respond_to_request(friendship_id: int, action: str):
+    """Accept, reject, or cancel a pending request.
 
-    Args:
-        friendship_id (int): Identifier of the friendship row to reject.
-
-    Returns:
-        Response: 200 with updated friendship or 4xx/5xx on error.
-    """
-
-    try:
-        friendship = FriendshipService.reject_request(
-            user_id=current_user.id, friendship_id=friendship_id
-        )
-        response = make_response(
-            jsonify(
-                {
-                    "message": "Friend request rejected.",
-                    "friendship": FriendshipService.serialize(
-                        friendship, viewer_id=current_user.id
-                    ),
-                }
-            ),
-            200,
-        )
-        return add_api_headers(response)
-
-    except ValidationError as exc:
-        response = make_response(jsonify({"error": str(exc)}), 400)
-        return add_api_headers(response)
-    except Exception:  # pragma: no cover - bubbled to client
-        db.session.rollback()
-        response = make_response(
-            jsonify({"error": "Unable to reject request."}), 500
-        )
-        return add_api_headers(response)
-
-
-@friendship_bp.route("/<int:friendship_id>/cancel", methods=["POST"])
-@login_required
-def cancel_request(friendship_id: int):
-    """Cancel a pending outgoing request created by the authenticated user.
+    Accept and reject apply to requests targeted at the authenticated
+    user; cancel applies to requests the user sent.
 
     Args:
-        friendship_id (int): Identifier of the friendship row to cancel.
+        friendship_id (int): Identifier of the friendship row to update.
+        action (str): One of ``accept``, ``reject``, or ``cancel``.
 
     Returns:
-        Response: 200 with confirmation or 4xx/5xx on error.
+        Response: 200 with confirmation (and the updated friendship for
+        accept/reject) or 4xx/5xx on error.
     """
 
+    service_call, message, failure, echo_friendship = _REQUEST_ACTIONS[action]
     try:
-        FriendshipService.cancel_request(
+        friendship = service_call(
             user_id=current_user.id, friendship_id=friendship_id
         )
-        response = make_response(
-            jsonify({"message": "Friend request canceled."}), 200
-        )
-        return add_api_headers(response)
+        body = {"message": message}
+        if echo_friendship:
+            body["friendship"] = FriendshipService.serialize(
+                friendship, viewer_id=current_user.id
+            )
+        return api_json(body, 200)
 
     except ValidationError as exc:
-        response = make_response(jsonify({"error": str(exc)}), 400)
-        return add_api_headers(response)
+        return api_json({"error": str(exc)}, 400)
     except Exception:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        response = make_response(
-            jsonify({"error": "Unable to cancel request."}), 500
-        )
-        return add_api_headers(response)
+        return api_json({"error": failure}, 500)
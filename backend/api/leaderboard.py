@@ -1,9 +1,9 @@
 """Leaderboard API blueprint for global rankings."""
 
-from flask import Blueprint, jsonify, request, make_response, current_app
+from flask import Blueprint, request, current_app
 
 from ..services.leaderboard_service import LeaderboardService
-from ..utils.helpers import add_api_headers
+from ..utils.helpers import api_json, api_json_bytes
 
 leaderboard_bp = Blueprint(
     "leaderboard",
@@ -12,7 +12,7 @@ leaderboard_bp = Blueprint(
 )
 
 
-@leaderboard_bp.route("/global", methods=["GET", "OPTIONS"])
+@leaderboard_bp.route("/global", methods=["GET"])
 def get_global_leaderboard():
     """Get the global leaderboard.
 
@@ -24,11 +24,8 @@ def get_global_leaderboard():
     Returns:
         Response: JSON with ranked list of users and their stats.
     """
-    # Handle CORS preflight
-    if request.method == "OPTIONS":
-        response = make_response("", 200)
-        return add_api_headers(response)
-
+    # CORS preflight is answered by Flask's automatic OPTIONS response,
+    # which Flask-CORS decorates, without entering this view
     try:
         limit_param = request.args.get("limit", 50)
         try:
@@ -37,28 +34,13 @@ def get_global_leaderboard():
                 raise ValueError("Limit must be at least 1")
             limit = min(limit, 100)
         except (TypeError, ValueError) as e:
-            response = make_response(
-                jsonify({"error": f"Invalid limit parameter: {e}"}),
-                400,
-            )
-            return add_api_headers(response)
+            return api_json({"error": f"Invalid limit parameter: {e}"}, 400)
 
-        leaderboard = LeaderboardService.get_global_leaderboard(limit=limit)
+        body = LeaderboardService.get_global_leaderboard_payload(limit=limit)
 
-        response = make_response(
-            jsonify({
-                "leaderboard": leaderboard,
-                "scope": "global",
-            }),
-            200,
-        )
-        return add_api_headers(response)
+        return api_json_bytes(body, 200)
 
     except Exception as exc:
         # Log the actual error for debugging
         current_app.logger.error(f"Leaderboard error: {exc}")
-        response = make_response(
-            jsonify({"error": "Failed to retrieve leaderboard"}),
-            500,
-        )
-        return add_api_headers(response)
+        return api_json({"error": "Failed to retrieve leaderboard"}, 500)
@@ -1,11 +1,14 @@
 """Screen time API blueprint with validation helpers and allowed apps list."""
 
-from flask import Blueprint, jsonify, request, make_response
+import hashlib
+
+import orjson
+from flask import Blueprint, Response, request
 from flask_login import current_user, login_required
 
 from ..database import db
 from ..services.screen_time_service import ScreenTimeService, ValidationError
-from ..utils.helpers import add_api_headers
+from ..utils.helpers import api_json, require_json
 
 screen_time_bp = Blueprint(
     "screen_time",
@@ -13,41 +16,39 @@ screen_time_bp = Blueprint(
     url_prefix="/api/screen-time",
 )
 
+# The allowed-apps list is static, so its body and ETag are built once
+_APPS_BODY = orjson.dumps({"apps": ScreenTimeService.get_allowed_apps()})
+_APPS_ETAG = hashlib.blake2b(_APPS_BODY, digest_size=8).hexdigest()
+
 
 @screen_time_bp.route("/", methods=["POST"])
 @login_required
-def create_screen_time_entry():
+@require_json(allow_empty=True)
+def create_screen_time_entry(payload):
     """Persist a new screen time entry for the authenticated user.
 
+    Args:
+        payload (dict): Decoded JSON request body.
+
     Returns:
         Response: JSON payload with the saved log or validation errors.
     """
 
     try:
         new_log = ScreenTimeService.create_entry(
-            user_id=current_user.id, data=request.get_json()
+            user_id=current_user.id, data=payload
         )
 
-        response = make_response(
-            jsonify(
-                {
-                    "message": "Screen time entry saved",
-                    "log": new_log.to_dict(),
-                }
-            ),
-            201,
-        )
-        return add_api_headers(response)
+        return api_json({
+            "message": "Screen time entry saved",
+            "log": new_log.to_dict(),
+        }, 201)
 
     except ValidationError as exc:
-        response = make_response(jsonify({"error": str(exc)}), 400)
-        return add_api_headers(response)
+        return api_json({"error": str(exc)}, 400)
     except Exception as exc:  # pragma: no cover - bubbled to client
         db.session.rollback()
-        response = make_response(
-            jsonify({"error": f"Unable to save entry: {exc}"}), 500
-        )
-        return add_api_headers(response)
+        return api_json({"error": f"Unable to save entry: {exc}"}, 500)
 
 
 @screen_time_bp.route("/", methods=["GET"])
@@ -60,10 +61,7 @@ def list_screen_time_entries():
         try:
             limit = max(1, min(int(limit_param), 100))
         except (TypeError, ValueError):
-            response = make_response(
-                jsonify({"error": "limit must be an integer."}), 400
-            )
-            return add_api_headers(response)
+            return api_json({"error": "limit must be an integer."}, 400)
 
         logs = ScreenTimeService.get_entries(
             user_id=current_user.id,
@@ -74,21 +72,26 @@ def list_screen_time_entries():
             limit=limit,
         )
 
-        response = make_response(
-            jsonify({"logs": [log.to_dict() for log in logs]}), 200
-        )
-        return add_api_headers(response)
+        return api_json({"logs": [log.to_dict() for log in logs]}, 200)
 
     except ValidationError as exc:
-        response = make_response(jsonify({"error": str(exc)}), 400)
-        return add_api_headers(response)
+        return api_json({"error": str(exc)}, 400)
 
 
 @screen_time_bp.route("/apps", methods=["GET"])
 def get_allowed_apps():
-    """Expose the canonical list of apps for dropdown selectors."""
+    """Expose the canonical list of apps for dropdown selectors.
+
+    Returns:
+        Response: Pre-encoded JSON list, or 304 when ``If-None-Match``
+        matches the list's ETag.
+    """
 
-    response = make_response(
-        jsonify({"apps": ScreenTimeService.get_allowed_apps()}), 200
+    response = Response(
+        _APPS_BODY,
+        200,
+        mimetype="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
     )
-    return add_api_headers(response)
+    response.set_etag(_APPS_ETAG)
+    return response.make_conditional(request)
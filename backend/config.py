@@ -5,6 +5,8 @@ Just the essentials to get started!
 
 import os
 
+from sqlalchemy.pool import StaticPool
+
 
 class Config:
     """Basic settings that all environments need"""
@@ -15,6 +17,41 @@ class Config:
     # Database settings
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # Saves memory
 
+    # Reuse pooled connections instead of reconnecting on every request;
+    # pre-ping drops stale connections without NullPool's overhead
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+    # Schema creation runs via `flask init-db` unless a config opts in
+    AUTO_INIT_DB = False
+
+    # In-process response cache for rarely changing read endpoints
+    CACHE_TYPE = "SimpleCache"
+    CACHE_DEFAULT_TIMEOUT = 300
+
+    # Seconds a rendered global leaderboard is reused before recomputing
+    LEADERBOARD_CACHE_TIMEOUT = 30
+
+    # Seconds the encoded /api/badges catalog and its ETag are reused;
+    # seeding badges clears it early in the process that ran it
+    BADGE_CATALOG_CACHE_TIMEOUT = 300
+
+    # Complete a user's expired challenges when they list challenges; turn
+    # off once `flask complete-challenges` runs on a schedule (e.g. cron)
+    COMPLETE_CHALLENGES_ON_READ = True
+
+    # Password hash method: "argon2id" for argon2-cffi's compiled Argon2id
+    # (it releases the GIL and spreads each hash over several lanes), or a
+    # Werkzeug method with its cost pinned such as "scrypt:32768:8:1".
+    # Hashes made with any other method or cost are upgraded on the
+    # user's next successful login.
+    PASSWORD_HASH_METHOD = "argon2id"
+
     # Allow React frontend to connect (CORS = Cross-Origin Resource Sharing)
     # Include typical React dev ports (3000 Create React App, 5173/5174 Vite)
     CORS_ORIGINS = [
@@ -31,6 +68,9 @@ class Config:
     MAIL_USERNAME = os.environ.get("MAIL_USERNAME")
     MAIL_PASSWORD = os.environ.get("MAIL_PASSWORD")
     MAIL_DEFAULT_SENDER = os.environ.get("MAIL_USERNAME")  # Use same email as sender
+    # Hand messages to background threads so SMTP never delays a request
+    MAIL_SEND_ASYNC = True
+    MAIL_SEND_WORKERS = 4
 
 
 class DevelopmentConfig(Config):
@@ -38,6 +78,7 @@ class DevelopmentConfig(Config):
 
     DEBUG = True  # Show helpful error pages
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///app.db"
+    AUTO_INIT_DB = True  # Create tables/badges on startup (prod uses `flask init-db`)
 
 
 class TestingConfig(Config):
@@ -45,10 +86,19 @@ class TestingConfig(Config):
 
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"  # Temporary database
-    
+    AUTO_INIT_DB = True  # Fresh in-memory DB needs tables and badges
+    # One shared connection so every thread sees the same in-memory DB
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
+    # Cheap hashes keep auth tests fast; never use this outside tests
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"
+
     # Override mail settings for testing
     MAIL_DEFAULT_SENDER = "test@example.com"
     MAIL_SUPPRESS_SEND = True  # Don't actually send emails during tests
+    MAIL_SEND_ASYNC = False  # Send inline so tests see errors and calls
 
 
 class ProductionConfig(Config):
@@ -56,6 +106,8 @@ class ProductionConfig(Config):
 
     DEBUG = False  # Don't show errors to users
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///app_prod.db"
+    # Challenges are completed by an hourly `flask complete-challenges` job
+    COMPLETE_CHALLENGES_ON_READ = False
 
 
 # Easy way to pick which config to use
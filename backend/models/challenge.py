@@ -93,8 +93,13 @@ class ChallengeParticipant(db.Model):
     challenge = db.relationship("Challenge", back_populates="participants")
     user = db.relationship("User", backref="challenge_participations")
     
-    # Ensure a user can only join each challenge once
-    __table_args__ = (db.UniqueConstraint('challenge_id', 'user_id', name='uq_challenge_participant'),)
+    __table_args__ = (
+        # Ensure a user can only join each challenge once
+        db.UniqueConstraint('challenge_id', 'user_id', name='uq_challenge_participant'),
+        # Challenge lists, invitations and log updates all start from one
+        # user's accepted or pending rows; the unique key leads with challenge
+        db.Index("ix_challenge_participants_user_status", "user_id", "invitation_status"),
+    )
     
     def to_dict(self) -> dict:
         """Serialize participant data for API responses."""
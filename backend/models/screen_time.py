@@ -8,6 +8,11 @@ class ScreenTimeLog(db.Model):
     """Per-day screen time entries keyed to an app (or total)."""
 
     __tablename__ = "screen_time_logs"
+    # Nearly every read is "this user's logs in a date range"; app_name
+    # also covers the per-(user, app, day) upsert lookup
+    __table_args__ = (
+        db.Index("ix_screen_time_logs_user_date", "user_id", "date", "app_name"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
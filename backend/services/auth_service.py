@@ -3,12 +3,40 @@ Authentication Service Layer
 Handles all authentication business logic separate from HTTP routes
 """
 
+import hashlib
+import re
 import secrets
-from datetime import datetime, timedelta
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from flask import current_app
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from sqlalchemy import or_, select
 from werkzeug.security import generate_password_hash, check_password_hash
 from ..database import db
 from ..models import User
 
+# local@domain.tld with no whitespace and exactly one "@"
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Every path that sets a password enforces these bounds, so logins outside
+# them can be rejected before any database lookup or hashing
+MIN_PASSWORD_LENGTH = 6
+MAX_PASSWORD_LENGTH = 1024
+
+# Password reset tokens are signed with this salt and valid for 30 minutes
+RESET_TOKEN_SALT = "password-reset"
+RESET_TOKEN_MAX_AGE = 30 * 60
+
+# PASSWORD_HASH_METHOD value selecting argon2-cffi's Argon2id hasher
+# (RFC 9106 low-memory profile) instead of a Werkzeug method. The hasher
+# is built once at import and shared, as it holds no per-call state.
+ARGON2_METHOD = "argon2id"
+_ARGON2 = PasswordHasher()
+
+# Hash of a throwaway password per hash method, verified for unknown
+# accounts so failed logins cost the same whether or not the user exists
+_DUMMY_HASHES = {}
+
 
 class AuthService:
     """Service class for authentication operations.
@@ -17,6 +45,92 @@ class AuthService:
     without direct coupling to Flask routes.
     """
 
+    @staticmethod
+    def hash_password(password):
+        """Hash a password with the configured method.
+
+        Args:
+            password (str): Plain text password
+
+        Returns:
+            str: Salted password hash for ``User.password_hash``
+        """
+        if current_app.config["PASSWORD_HASH_METHOD"] == ARGON2_METHOD:
+            return _ARGON2.hash(password)
+        return generate_password_hash(
+            password,
+            method=current_app.config["PASSWORD_HASH_METHOD"],
+            salt_length=16,
+        )
+
+    @staticmethod
+    def _dummy_hash():
+        """Return a hash made with the configured method for timing parity.
+
+        Returns:
+            str: Cached hash of a random password
+        """
+        method = current_app.config["PASSWORD_HASH_METHOD"]
+        if method not in _DUMMY_HASHES:
+            _DUMMY_HASHES[method] = AuthService.hash_password(
+                secrets.token_urlsafe(12)
+            )
+        return _DUMMY_HASHES[method]
+
+    @staticmethod
+    def verify_password(password_hash, password):
+        """Check a password against an Argon2 or Werkzeug hash.
+
+        Args:
+            password_hash (str): Stored hash, either an Argon2 PHC string
+                (``$argon2id$...``) or a Werkzeug ``method$salt$hash``
+            password (str): Plain text password
+
+        Returns:
+            bool: True if the password matches
+        """
+        if password_hash.startswith("$argon2"):
+            try:
+                return _ARGON2.verify(password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        return check_password_hash(password_hash, password)
+
+    @staticmethod
+    def needs_rehash(password_hash):
+        """Check whether a stored hash uses an outdated method or cost.
+
+        Args:
+            password_hash (str): Stored Argon2 or Werkzeug hash
+
+        Returns:
+            bool: True if the hash differs from PASSWORD_HASH_METHOD
+        """
+        method = current_app.config["PASSWORD_HASH_METHOD"]
+        if password_hash.startswith("$argon2"):
+            return method != ARGON2_METHOD or _ARGON2.check_needs_rehash(
+                password_hash
+            )
+        return password_hash.split("$", 1)[0] != method
+
+    @staticmethod
+    def rehash_if_needed(user, password):
+        """Re-hash a verified password whose stored hash is outdated.
+
+        Args:
+            user (User): User whose ``password`` was just verified
+            password (str): Plain text password
+
+        Returns:
+            bool: True if a new hash was stored
+        """
+        if not AuthService.needs_rehash(user.password_hash):
+            return False
+
+        user.password_hash = AuthService.hash_password(password)
+        db.session.commit()
+        return True
+
     @staticmethod
     def validate_registration_data(username, email, password):
         """Validate user registration data.
@@ -31,12 +145,14 @@ class AuthService:
                    Returns (True, None) if valid
                    Returns (False, error_message) if invalid
         """
-        if not username or not username.strip():
+        # Normalize once; every check below reuses the stripped values
+        username_clean = username.strip() if username else ""
+        email_clean = email.strip() if email else ""
+
+        if not username_clean:
             return False, "Username is required"
 
-        username_clean = username.strip()
-        
-        if not email or not email.strip():
+        if not email_clean:
             return False, "Email is required"
         
         if not password:
@@ -49,10 +165,13 @@ class AuthService:
         if "@" in username_clean:
             return False, "Username cannot contain the '@' character"
         
-        if len(password) < 6:
+        if len(password) < MIN_PASSWORD_LENGTH:
             return False, "Password must be at least 6 characters"
+
+        if len(password) > MAX_PASSWORD_LENGTH:
+            return False, "Password must be at most 1024 characters"
         
-        if "@" not in email or "." not in email:
+        if not _EMAIL_RE.fullmatch(email_clean):
             return False, "Invalid email format"
         
         return True, None
@@ -71,14 +190,27 @@ class AuthService:
                    Returns (True, 'email') if email exists
                    Returns (False, None) if neither exists
         """
+        conditions = []
         if username:
-            if User.query.filter_by(username=username.strip()).first():
-                return True, "username"
-        
+            username = username.strip()
+            conditions.append(User.username == username)
         if email:
-            if User.query.filter_by(email=email.strip().lower()).first():
-                return True, "email"
-        
+            email = email.strip().lower()
+            conditions.append(User.email == email)
+
+        if not conditions:
+            return False, None
+
+        # One round trip; both columns are unique, so at most two rows match
+        matches = db.session.execute(
+            select(User.username, User.email).where(or_(*conditions))
+        ).all()
+
+        if username and any(row.username == username for row in matches):
+            return True, "username"
+        if email and any(row.email == email for row in matches):
+            return True, "email"
+
         return False, None
 
     @staticmethod
@@ -101,7 +233,7 @@ class AuthService:
         email = email.strip().lower()
         
         # Hash password
-        password_hash = generate_password_hash(password)
+        password_hash = AuthService.hash_password(password)
         
         # Create user object
         new_user = User(
@@ -110,10 +242,15 @@ class AuthService:
             password_hash=password_hash
         )
         
-        # Save to database
+        # Save to database. The INSERT returns the new id and every other
+        # column is set client-side, so detach the row across the commit to
+        # keep it loaded instead of expiring it and re-SELECTing on next use.
         db.session.add(new_user)
+        db.session.flush()
+        db.session.expunge(new_user)
         db.session.commit()
-        
+        db.session.add(new_user)
+
         return new_user
 
     @staticmethod
@@ -133,15 +270,25 @@ class AuthService:
         if not identifier or not password:
             return None, "Username/email and password are required"
 
-        identifier = identifier.strip()
+        # No stored password can match, whether or not the account exists
+        if not MIN_PASSWORD_LENGTH <= len(password) <= MAX_PASSWORD_LENGTH:
+            return None, "Invalid username/email or password"
+
         if "@" in identifier:
-            user = User.query.filter_by(email=identifier.lower()).first()
+            user = AuthService.get_user_by_email(identifier)
         else:
-            user = User.query.filter_by(username=identifier).first()
+            user = AuthService.get_user_by_username(identifier)
 
-        if not user or not check_password_hash(user.password_hash, password):
+        if not user:
+            AuthService.verify_password(AuthService._dummy_hash(), password)
             return None, "Invalid username/email or password"
 
+        if not AuthService.verify_password(user.password_hash, password):
+            return None, "Invalid username/email or password"
+
+        # The plain password is only available here, so upgrade now
+        AuthService.rehash_if_needed(user, password)
+
         return user, None
 
     @staticmethod
@@ -154,7 +301,7 @@ class AuthService:
         Returns:
             User or None: The User object if found, None otherwise
         """
-        return User.query.get(user_id)
+        return db.session.get(User, user_id)
 
     @staticmethod
     def get_user_by_username(username):
@@ -166,7 +313,9 @@ class AuthService:
         Returns:
             User or None: The User object if found, None otherwise
         """
-        return User.query.filter_by(username=username.strip()).first()
+        return db.session.execute(
+            select(User).where(User.username == username.strip())
+        ).scalar_one_or_none()
 
     @staticmethod
     def get_user_by_email(email):
@@ -178,12 +327,43 @@ class AuthService:
         Returns:
             User or None: The User object if found, None otherwise
         """
-        return User.query.filter_by(email=email.strip().lower()).first()
+        return db.session.execute(
+            select(User).where(User.email == email.strip().lower())
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _reset_serializer():
+        """Build the signer for password reset tokens.
+
+        Returns:
+            URLSafeTimedSerializer: Serializer keyed by the app secret
+        """
+        return URLSafeTimedSerializer(
+            current_app.config["SECRET_KEY"], salt=RESET_TOKEN_SALT
+        )
+
+    @staticmethod
+    def _password_fingerprint(password_hash):
+        """Digest the stored hash so tokens die once the password changes.
+
+        Args:
+            password_hash (str): ``password_hash`` of the token's user
+
+        Returns:
+            str: Short hex digest of the hash
+        """
+        return hashlib.blake2b(
+            password_hash.encode(), digest_size=8
+        ).hexdigest()
 
     @staticmethod
     def generate_reset_token(email):
         """Generate a password reset token for a user.
-        
+
+        The token is signed rather than stored: it carries the user id, a
+        fingerprint of the current password hash and a random nonce, so
+        issuing one needs no database write.
+
         Args:
             email (str): User's email address
             
@@ -192,31 +372,36 @@ class AuthService:
                    Returns (token, None) if successful
                    Returns (None, error_message) if user not found
         """
-        user = AuthService.get_user_by_email(email)
-        
-        if not user:
+        # Only the id and hash go into the token, so skip loading a User
+        row = db.session.execute(
+            select(User.id, User.password_hash)
+            .where(User.email == email.strip().lower())
+        ).first()
+
+        if not row:
             # Don't reveal if email exists (security best practice)
             return None, None
-        
-        # Generate secure random token
-        reset_token = secrets.token_urlsafe(32)
-        
-        # Set token expiry to 30 minutes from now
-        expiry = datetime.utcnow() + timedelta(minutes=30)
-        
-        # Save token to database
-        user.reset_token = reset_token
-        user.reset_token_expiry = expiry
-        db.session.commit()
-        
+
+        reset_token = AuthService._reset_serializer().dumps([
+            row.id,
+            AuthService._password_fingerprint(row.password_hash),
+            secrets.token_urlsafe(8),
+        ])
+
         return reset_token, None
 
     @staticmethod
-    def validate_reset_token(token):
+    def validate_reset_token(token, for_update=False):
         """Validate a password reset token.
-        
+
+        Checks the signature and age locally, then loads the user by
+        primary key to confirm the password has not changed since the
+        token was issued.
+
         Args:
             token (str): Reset token to validate
+            for_update (bool): Lock the user row (SELECT ... FOR UPDATE)
+                until the caller commits
             
         Returns:
             tuple: (User or None, str or None) - (user, error_message)
@@ -225,21 +410,24 @@ class AuthService:
         """
         if not token:
             return None, "Reset token is required"
-        
-        # Find user with this token
-        user = User.query.filter_by(reset_token=token).first()
-        
-        if not user:
-            return None, "Invalid or expired reset token"
-        
-        # Check if token has expired
-        if user.reset_token_expiry < datetime.utcnow():
-            # Clear expired token
-            user.reset_token = None
-            user.reset_token_expiry = None
-            db.session.commit()
+
+        try:
+            user_id, fingerprint, _ = AuthService._reset_serializer().loads(
+                token, max_age=RESET_TOKEN_MAX_AGE
+            )
+        except SignatureExpired:
             return None, "Reset token has expired"
-        
+        except (BadSignature, TypeError, ValueError):
+            return None, "Invalid or expired reset token"
+
+        user = db.session.get(User, user_id, with_for_update=for_update)
+
+        # A changed password (e.g. a completed reset) voids older tokens
+        if not user or (
+            AuthService._password_fingerprint(user.password_hash) != fingerprint
+        ):
+            return None, "Invalid or expired reset token"
+
         return user, None
 
     @staticmethod
@@ -255,23 +443,22 @@ class AuthService:
                    Returns (True, None) if successful
                    Returns (False, error_message) if failed
         """
-        # Validate token
-        user, error = AuthService.validate_reset_token(token)
+        # Validate token, locking the row so a concurrent reset with the
+        # same token waits and then fails the fingerprint check
+        user, error = AuthService.validate_reset_token(token, for_update=True)
         
         if error:
             return False, error
         
         # Validate new password
-        if not new_password or len(new_password) < 6:
+        if not new_password or len(new_password) < MIN_PASSWORD_LENGTH:
             return False, "Password must be at least 6 characters"
+
+        if len(new_password) > MAX_PASSWORD_LENGTH:
+            return False, "Password must be at most 1024 characters"
         
-        # Hash and update password
-        user.password_hash = generate_password_hash(new_password)
-        
-        # Clear reset token (single-use)
-        user.reset_token = None
-        user.reset_token_expiry = None
-        
+        # Hash and update password; the new hash invalidates the token
+        user.password_hash = AuthService.hash_password(new_password)
         db.session.commit()
         
         return True, None
@@ -1,9 +1,11 @@
 """Badge achievement logic for automatically awarding badges based on user activities."""
 
 import logging
+from bisect import bisect_right
 from datetime import timedelta, date
+from typing import Optional
 from smtplib import SMTPException
-from sqlalchemy import func, and_
+from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from ..models import User, ScreenTimeLog, Friendship  
 from .badge_service import BadgeService
@@ -12,6 +14,13 @@ from .email_service import send_badge_notification
 
 logger = logging.getLogger(__name__)
 
+# Tiered badges: ascending thresholds and the badge each one unlocks, so
+# a single bisect finds every tier a value has reached
+_STREAK_TIERS = ((1, 7, 14, 30), ('Fresh Start', '7-Day Focus', 'Habit Builder', 'Unstoppable'))
+_REDUCTION_TIERS = ((5, 10, 50), ('Tiny Wins', 'The Declutter', 'Half-Life'))
+_FRIEND_TIERS = ((1, 10), ('Team Player', 'The Connector'))
+_CHALLENGE_TIERS = ((1, 5), ('Challenge Accepted', 'Friendly Rival'))
+
 
 class BadgeAchievementService:
     """Logic for determining and awarding badges based on user achievements."""
@@ -39,12 +48,16 @@ class BadgeAchievementService:
         
         # Check all badge types (transaction is already managed by the caller)
         try:
+            # Log count and averages shared by several checks, in one query,
+            # and likewise the friend and challenge counts
+            summary = ScreenTimeService.get_log_summary(user_id)
+            counts = BadgeAchievementService._get_activity_counts(user_id)
             awarded_badges.extend(BadgeAchievementService._check_streak_badges(user))
-            awarded_badges.extend(BadgeAchievementService._check_reduction_badges(user))
-            awarded_badges.extend(BadgeAchievementService._check_social_badges(user))
-            awarded_badges.extend(BadgeAchievementService._check_challenge_badges(user))
-            awarded_badges.extend(BadgeAchievementService._check_leaderboard_badges(user))
-            awarded_badges.extend(BadgeAchievementService._check_prestige_badges(user))
+            awarded_badges.extend(BadgeAchievementService._check_reduction_badges(user, summary))
+            awarded_badges.extend(BadgeAchievementService._check_social_badges(user, counts))
+            awarded_badges.extend(BadgeAchievementService._check_challenge_badges(user, counts))
+            awarded_badges.extend(BadgeAchievementService._check_leaderboard_badges(user, summary))
+            awarded_badges.extend(BadgeAchievementService._check_prestige_badges(user, summary))
         except SQLAlchemyError as e:
             logger.error(f"Error checking badges for user {user_id}: {str(e)}")
             return []
@@ -62,25 +75,33 @@ class BadgeAchievementService:
         
         return awarded_badges
     
+    @staticmethod
+    def _award_tiers(user_id: int, tiers: tuple, value):
+        """Award every tiered badge whose threshold ``value`` has reached.
+
+        Args:
+            user_id (int): ID of the user to award badges to.
+            tiers (tuple): ``(thresholds, badge_names)`` with ascending
+                thresholds.
+            value (int | float): The user's metric, e.g. a streak length.
+
+        Returns:
+            list: List of newly awarded badge names.
+        """
+        thresholds, badge_names = tiers
+        awarded = []
+        for badge_name in badge_names[:bisect_right(thresholds, value)]:
+            success, _ = BadgeService.award_badge(user_id, badge_name)
+            if success:
+                awarded.append(badge_name)
+        return awarded
+
     @staticmethod
     def _check_streak_badges(user: User):
         """Check and award streak-related badges."""
-        awarded = []
-        streak_count = user.streak_count or 0
-        
-        # Define streak badge thresholds
-        streak_badges = [
-            ('Fresh Start', 1),
-            ('7-Day Focus', 7),
-            ('Habit Builder', 14),
-            ('Unstoppable', 30),
-        ]
-        
-        for badge_name, required_streak in streak_badges:
-            if streak_count >= required_streak:
-                success, _ = BadgeService.award_badge(user.id, badge_name)
-                if success:
-                    awarded.append(badge_name)
+        awarded = BadgeAchievementService._award_tiers(
+            user.id, _STREAK_TIERS, user.streak_count or 0
+        )
         
         # Weekend Warrior - check if user met goals on both Saturday and Sunday
         if ScreenTimeService.check_weekend_achievement(user.id, threshold_minutes=180):
@@ -91,15 +112,26 @@ class BadgeAchievementService:
         return awarded
     
     @staticmethod
-    def _check_reduction_badges(user: User):
-        """Check and award screen time reduction badges."""
-        from ..models import ScreenTimeLog
+    def _check_reduction_badges(user: User, summary: Optional[dict] = None):
+        """Check and award screen time reduction badges.
+
+        Args:
+            user (User): User object to check badges for.
+            summary (dict, optional): Result of
+                ``ScreenTimeService.get_log_summary``; fetched if omitted.
+
+        Returns:
+            list: List of newly awarded badge names.
+        """
         awarded = []
-        
-        log_count = ScreenTimeLog.query.filter_by(user_id=user.id).count()
+        summary = summary or ScreenTimeService.get_log_summary(user.id)
+
+        log_count = summary["log_count"]
         
         # One Hour Club - check if user stayed under 1h social media in a day (requires 2+ days)
-        if log_count >= 2 and ScreenTimeService.check_low_usage_day(user.id, max_minutes=60):
+        # Any log under 60 minutes, read from the summary's minimum instead
+        # of ScreenTimeService.check_low_usage_day's separate query
+        if log_count >= 2 and summary["min_minutes"] < 60:
             success, _ = BadgeService.award_badge(user.id, 'One Hour Club')
             if success:
                 awarded.append('One Hour Club')
@@ -109,12 +141,14 @@ class BadgeAchievementService:
             return awarded
         
         # Get user's baseline week (first week of data)
-        baseline_avg = ScreenTimeService.get_baseline_average(user.id)
+        baseline_avg = ScreenTimeService.get_baseline_average(
+            user.id, first_date=summary["first_date"]
+        )
         if baseline_avg is None or baseline_avg <= 0:
             return awarded
         
         # Get recent week average
-        recent_avg = ScreenTimeService.get_recent_week_average(user.id)
+        recent_avg = summary["recent_week_avg"]
         if recent_avg is None:
             return awarded
         
@@ -122,20 +156,9 @@ class BadgeAchievementService:
         reduction_percent = ((baseline_avg - recent_avg) / baseline_avg) * 100
         
         # Check reduction badges (require 14+ days)
-        if reduction_percent >= 5:
-            success, _ = BadgeService.award_badge(user.id, 'Tiny Wins')
-            if success:
-                awarded.append('Tiny Wins')
-        
-        if reduction_percent >= 10:
-            success, _ = BadgeService.award_badge(user.id, 'The Declutter')
-            if success:
-                awarded.append('The Declutter')
-        
-        if reduction_percent >= 50:
-            success, _ = BadgeService.award_badge(user.id, 'Half-Life')
-            if success:
-                awarded.append('Half-Life')
+        awarded.extend(BadgeAchievementService._award_tiers(
+            user.id, _REDUCTION_TIERS, reduction_percent
+        ))
         
         # Digital Minimalist - average < 2h/day for a week (requires 14+ days)
         if recent_avg < 120:  # 2 hours = 120 minutes
@@ -146,76 +169,87 @@ class BadgeAchievementService:
         return awarded
     
     @staticmethod
-    def _check_social_badges(user: User):
-        """Check and award social interaction badges."""
-        from sqlalchemy import or_
-        awarded = []
-        
-        # Count friendships (both sent and received)
-        friend_count = Friendship.query.filter(
-            and_(
-                or_(
-                    Friendship.user_id == user.id,
-                    Friendship.friend_id == user.id
-                ),
-                Friendship.status == 'accepted'
-            )
-        ).count()
-        
-        # Team Player - first friend
-        if friend_count >= 1:
-            success, _ = BadgeService.award_badge(user.id, 'Team Player')
-            if success:
-                awarded.append('Team Player')
-        
-        # The Connector - 10 friends
-        if friend_count >= 10:
-            success, _ = BadgeService.award_badge(user.id, 'The Connector')
-            if success:
-                awarded.append('The Connector')
-        
-        return awarded
+    def _get_activity_counts(user_id: int) -> dict:
+        """Count a user's friends and challenges in a single query.
+
+        Args:
+            user_id (int): ID of the user.
+
+        Returns:
+            dict: ``friend_count`` (accepted, sent or received),
+            ``accepted_challenges`` and ``has_won_challenge``.
+        """
+        from sqlalchemy import exists, or_, select
+        from ..database import db
+        from ..models.challenge import ChallengeParticipant
+
+        friend_count = select(func.count(Friendship.id)).where(
+            or_(Friendship.user_id == user_id, Friendship.friend_id == user_id),
+            Friendship.status == 'accepted',
+        ).scalar_subquery()
+        # Count accepted challenges (excludes declined invitations)
+        accepted_challenges = select(
+            func.count(ChallengeParticipant.participant_id)
+        ).where(
+            ChallengeParticipant.user_id == user_id,
+            ChallengeParticipant.invitation_status == 'accepted',
+        ).scalar_subquery()
+        has_won_challenge = exists().where(
+            ChallengeParticipant.user_id == user_id,
+            ChallengeParticipant.is_winner,
+        )
+
+        row = db.session.execute(
+            select(friend_count, accepted_challenges, has_won_challenge)
+        ).one()
+        return {
+            "friend_count": row[0],
+            "accepted_challenges": row[1],
+            "has_won_challenge": bool(row[2]),
+        }
+
+    @staticmethod
+    def _check_social_badges(user: User, counts: Optional[dict] = None):
+        """Check and award social interaction badges.
+
+        Args:
+            user (User): User object to check badges for.
+            counts (dict, optional): Result of ``_get_activity_counts``;
+                fetched if omitted.
+
+        Returns:
+            list: List of newly awarded badge names.
+        """
+        counts = counts or BadgeAchievementService._get_activity_counts(user.id)
+
+        # Team Player - first friend; The Connector - 10 friends
+        return BadgeAchievementService._award_tiers(
+            user.id, _FRIEND_TIERS, counts["friend_count"]
+        )
     
     @staticmethod
-    def _check_challenge_badges(user: User):
+    def _check_challenge_badges(user: User, counts: Optional[dict] = None):
         """
         Check and award challenge-related badges.
 
         Args:
             user (User): User object to check badges for.
+            counts (dict, optional): Result of ``_get_activity_counts``;
+                fetched if omitted.
 
         Returns:
             list: List of newly awarded badge names.
         """
-        from ..models.challenge import ChallengeParticipant
-        
-        awarded = []
-        
-        # Count accepted challenges (excludes declined invitations)
-        accepted_challenges = ChallengeParticipant.query.filter(
-            ChallengeParticipant.user_id == user.id,
-            ChallengeParticipant.invitation_status == 'accepted'
-        ).count()
-        
-        # Challenge Accepted - Join first challenge
-        if accepted_challenges >= 1:
-            success, _ = BadgeService.award_badge(user.id, 'Challenge Accepted')
-            if success:
-                awarded.append('Challenge Accepted')
-        
+        counts = counts or BadgeAchievementService._get_activity_counts(user.id)
+
+        # Challenge Accepted - Join first challenge;
         # Friendly Rival - Participate in 5 challenges
-        if accepted_challenges >= 5:
-            success, _ = BadgeService.award_badge(user.id, 'Friendly Rival')
-            if success:
-                awarded.append('Friendly Rival')
+        awarded = BadgeAchievementService._award_tiers(
+            user.id, _CHALLENGE_TIERS, counts["accepted_challenges"]
+        )
         
         # Community Champion - Win at least one challenge
-        won_challenge = ChallengeParticipant.query.filter(
-            ChallengeParticipant.user_id == user.id,
-            ChallengeParticipant.is_winner
-        ).first()
-        
-        if won_challenge:
+        if counts["has_won_challenge"]:
             success, _ = BadgeService.award_badge(user.id, 'Community Champion')
             if success:
                 awarded.append('Community Champion')
@@ -223,14 +257,22 @@ class BadgeAchievementService:
         return awarded
     
     @staticmethod
-    def _check_leaderboard_badges(user: User):
-        """Check and award leaderboard-related badges."""
-        from ..models import ScreenTimeLog
+    def _check_leaderboard_badges(user: User, summary: Optional[dict] = None):
+        """Check and award leaderboard-related badges.
+
+        Args:
+            user (User): User object to check badges for.
+            summary (dict, optional): Result of
+                ``ScreenTimeService.get_log_summary``; fetched if omitted.
+
+        Returns:
+            list: List of newly awarded badge names.
+        """
         awarded = []
-        
+        summary = summary or ScreenTimeService.get_log_summary(user.id)
+
         # Require at least 7 days of data before checking leaderboard badges
-        log_count = ScreenTimeLog.query.filter_by(user_id=user.id).count()
-        if log_count < 7:
+        if summary["log_count"] < 7:
             return awarded
         
         # Get user's rank for the current week
@@ -252,18 +294,26 @@ class BadgeAchievementService:
         return awarded
     
     @staticmethod
-    def _check_prestige_badges(user: User):
-        """Check and award prestige/long-term badges."""
-        from ..models import ScreenTimeLog
+    def _check_prestige_badges(user: User, summary: Optional[dict] = None):
+        """Check and award prestige/long-term badges.
+
+        Args:
+            user (User): User object to check badges for.
+            summary (dict, optional): Result of
+                ``ScreenTimeService.get_log_summary``; fetched if omitted.
+
+        Returns:
+            list: List of newly awarded badge names.
+        """
         awarded = []
-        
+        summary = summary or ScreenTimeService.get_log_summary(user.id)
+
         # Require at least 30 days of data before checking prestige badges
-        log_count = ScreenTimeLog.query.filter_by(user_id=user.id).count()
-        if log_count < 30:
+        if summary["log_count"] < 30:
             return awarded
         
         # Offline Legend - average < 2h/day for a full month
-        monthly_avg = ScreenTimeService.get_monthly_average(user.id)
+        monthly_avg = summary["monthly_avg"]
         if monthly_avg is not None and monthly_avg < 120:  # 2 hours
             success, _ = BadgeService.award_badge(user.id, 'Offline Legend')
             if success:
@@ -1,13 +1,25 @@
 """Badge service for managing badges and user badge achievements."""
 
+import hashlib
 import logging
+from flask import current_app
+from .. import cache
 from ..database import db
 from ..models import Badge, UserBadge
 from ..utils.helpers import current_time_utc
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import joinedload
 
 logger = logging.getLogger(__name__)
 
+# Cache key for the serialized ``GET /api/badges`` body and ETag
+BADGE_CATALOG_CACHE_KEY = "badges_all"
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
 class BadgeService:
     """Service class for badge-related operations."""
     
@@ -16,17 +28,84 @@ class BadgeService:
         """Get all available badges."""
         return Badge.query.all()
     
+    @staticmethod
+    def get_badge_catalog():
+        """Get all badges as API-ready dicts without hydrating ORM objects.
+
+        Returns:
+            list[dict]: Badge fields matching ``Badge.to_dict`` output.
+        """
+        rows = db.session.execute(
+            select(
+                Badge.id,
+                Badge.name,
+                Badge.description,
+                Badge.badge_type,
+                Badge.icon,
+            )
+        ).mappings().all()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def get_badge_catalog_payload():
+        """Get the serialized badge catalog and its ETag.
+
+        The encoded JSON is cached for ``BADGE_CATALOG_CACHE_TIMEOUT``
+        seconds. ``initialize_badges`` drops it in its own process; other
+        workers pick up badge changes when their copy expires.
+
+        Returns:
+            tuple[bytes, str]: JSON body for ``GET /api/badges`` and its ETag.
+        """
+        payload = cache.get(BADGE_CATALOG_CACHE_KEY)
+        if payload is None:
+            body = current_app.json.dumps_bytes(BadgeService.get_badge_catalog())
+            etag = hashlib.md5(body, usedforsecurity=False).hexdigest()
+            payload = (body, etag)
+            cache.set(
+                BADGE_CATALOG_CACHE_KEY, payload,
+                timeout=current_app.config["BADGE_CATALOG_CACHE_TIMEOUT"]
+            )
+        return payload
+
     @staticmethod
     def get_user_badges(user_id: int):
-        """Get all badges earned by a specific user with eager-loaded Badge relation."""
-        user_badges = (
-            db.session.query(UserBadge)
+        """Get all badges earned by a specific user with eager-loaded Badge relation.
+
+        The many-to-one badge is joined into the same SELECT, so the list
+        costs one round trip.
+        """
+        return db.session.scalars(
+            select(UserBadge)
             .options(joinedload(UserBadge.badge))
-            .filter(UserBadge.user_id == user_id)
-            .all()
-        )
-        return user_badges
+            .where(UserBadge.user_id == user_id)
+        ).all()
     
+    @staticmethod
+    def get_user_badge_list(user_id: int):
+        """Get a user's badges as API-ready dicts in a single JOIN query.
+
+        Args:
+            user_id (int): ID of the user
+
+        Returns:
+            list[dict]: Earned badges matching ``UserBadge.to_dict`` output.
+        """
+        rows = db.session.execute(
+            select(UserBadge.id, Badge.name, UserBadge.earned_at)
+            .join(Badge, Badge.id == UserBadge.badge_id)
+            .where(UserBadge.user_id == user_id)
+            .order_by(UserBadge.id)
+        ).all()
+        return [
+            {
+                "id": user_badge_id,
+                "name": name,
+                "earned_at": earned_at.isoformat() if earned_at else None,
+            }
+            for user_badge_id, name, earned_at in rows
+        ]
+
     @staticmethod
     def award_badge(user_id: int, badge_name: str):
         """Award a badge to a user if they haven't earned it yet.
@@ -45,32 +124,40 @@ class BadgeService:
         from ..services.screen_time_service import ValidationError
         
         # Check if user exists
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             raise ValidationError(f"User not found")
         
         # Check if badge exists
-        badge = Badge.query.filter_by(name=badge_name).first()
-        if not badge:
+        badge_id = db.session.scalar(select(Badge.id).where(Badge.name == badge_name))
+        if badge_id is None:
             raise ValidationError(f"Badge '{badge_name}' not found")
-        
+
+        row = {"user_id": user_id, "badge_id": badge_id, "earned_at": current_time_utc()}
+        dialect = db.session.get_bind().dialect.name
+        if dialect in _UPSERT_INSERTS:
+            # One INSERT; the uq_user_badge constraint rejects duplicates, so
+            # concurrent awards cannot both succeed
+            result = db.session.execute(
+                _UPSERT_INSERTS[dialect](UserBadge).values(row)
+                .on_conflict_do_nothing(index_elements=['user_id', 'badge_id'])
+            )
+            db.session.commit()
+            if result.rowcount == 0:
+                return False, f"User already has badge '{badge_name}'"
+            return True, f"Badge '{badge_name}' awarded successfully"
+
         # Check if user already has this badge
         existing = UserBadge.query.filter_by(
             user_id=user_id, 
-            badge_id=badge.id
+            badge_id=badge_id
         ).first()
         
         if existing:
             return False, f"User already has badge '{badge_name}'"
         
         # Award the badge
-        user_badge = UserBadge(
-            user_id=user_id,
-            badge_id=badge.id,
-            earned_at=current_time_utc()
-        )
-        
-        db.session.add(user_badge)
+        db.session.add(UserBadge(**row))
         db.session.commit()
         
         return True, f"Badge '{badge_name}' awarded successfully"
@@ -93,7 +180,7 @@ class BadgeService:
         from ..services.screen_time_service import ValidationError
         
         # Check if user exists
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             raise ValidationError(f"User not found")
         
@@ -128,7 +215,7 @@ class BadgeService:
         """
         from ..models import User
         
-        user = User.query.get(user_id)
+        user = db.session.get(User, user_id)
         if not user:
             return {"earned": [], "available": []}
         
@@ -306,17 +393,28 @@ class BadgeService:
             {'name': 'Life > Screen', 'desc': 'Complete a full 24h digital detox.', 'type': 'prestige', 'icon': '⭐'},
         ]
         
-        # Only add badges that don't already exist
-        for badge_data in default_badges:
-            existing_badge = Badge.query.filter_by(name=badge_data['name']).first()
-            if not existing_badge:
-                badge = Badge(
-                    name=badge_data['name'],
-                    description=badge_data['desc'],
-                    badge_type=badge_data['type'],
-                    icon=badge_data['icon']
-                )
-                db.session.add(badge)
-        
+        rows = [
+            {
+                'name': badge_data['name'],
+                'description': badge_data['desc'],
+                'badge_type': badge_data['type'],
+                'icon': badge_data['icon'],
+            }
+            for badge_data in default_badges
+        ]
+
+        # Single INSERT that skips names already present; the unique index
+        # on ``name`` does the existence check instead of one SELECT per badge
+        dialect = db.session.get_bind().dialect.name
+        if dialect in _UPSERT_INSERTS:
+            stmt = _UPSERT_INSERTS[dialect](Badge).values(rows)
+            db.session.execute(stmt.on_conflict_do_nothing(index_elements=['name']))
+        else:
+            existing = set(db.session.scalars(select(Badge.name)))
+            db.session.add_all(
+                Badge(**row) for row in rows if row['name'] not in existing
+            )
+
         db.session.commit()
+        cache.delete(BADGE_CATALOG_CACHE_KEY)
         logger.info("Initialized %d badges in database", len(default_badges))
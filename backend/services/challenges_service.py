@@ -1,22 +1,119 @@
 """Service layer for challenges operations."""
 
-from datetime import date
+from datetime import date, datetime
 from typing import Dict, List, Optional, Tuple
 import logging
 
-from sqlalchemy.orm import joinedload
+from flask import abort, current_app
+from sqlalchemy import case, delete, exists, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import contains_eager, joinedload
 
+from .. import cache
 from ..database import db
 from ..models import Challenge, ChallengeParticipant, User
-from ..utils import current_time_utc
+from ..utils import current_time_utc, parse_iso_date
+from .email_service import send_challenge_completed_notification
 
 logger = logging.getLogger(__name__)
 
+CHALLENGE_LEADERBOARD_CACHE_KEY = "challenge_leaderboard:{}"
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Columns serialized by ``Challenge.to_dict`` and ``ChallengeParticipant.to_dict``,
+# in the same order, for queries that skip ORM instance hydration
+_CHALLENGE_COLUMNS = (
+    Challenge.challenge_id,
+    Challenge.name,
+    Challenge.description,
+    Challenge.owner_id,
+    Challenge.target_app,
+    Challenge.target_minutes,
+    Challenge.start_date,
+    Challenge.end_date,
+    Challenge.status,
+    Challenge.created_at,
+    Challenge.completed_at,
+)
+_PARTICIPANT_COLUMNS = (
+    ChallengeParticipant.participant_id,
+    ChallengeParticipant.challenge_id,
+    ChallengeParticipant.user_id,
+    ChallengeParticipant.invitation_status,
+    ChallengeParticipant.joined_at,
+    ChallengeParticipant.days_passed,
+    ChallengeParticipant.days_failed,
+    ChallengeParticipant.today_minutes,
+    ChallengeParticipant.today_passed,
+    ChallengeParticipant.total_screen_time_minutes,
+    ChallengeParticipant.days_logged,
+    ChallengeParticipant.final_rank,
+    ChallengeParticipant.is_winner,
+    ChallengeParticipant.challenge_completed,
+)
+
+# Average daily screen time used to order and rank participants; no logs
+# counts as a 0 average (best for zero-target challenges, neutral otherwise)
+_AVERAGE_DAILY_MINUTES = case(
+    (ChallengeParticipant.days_logged > 0,
+     ChallengeParticipant.total_screen_time_minutes * 1.0
+     / ChallengeParticipant.days_logged),
+    else_=0.0,
+)
+
+
+def _row_layout(columns) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Precompute the keys and date-valued keys for projected columns.
+
+    Args:
+        columns: Column attributes in projection order
+
+    Returns:
+        Tuple of (every key in order, keys holding dates or datetimes)
+    """
+    keys = tuple(column.key for column in columns)
+    date_keys = tuple(
+        column.key for column in columns
+        if column.type.python_type in (date, datetime)
+    )
+    return keys, date_keys
+
+
+def _row_to_dict(layout, values) -> Dict:
+    """Build a ``to_dict``-shaped payload from projected column values.
+
+    Args:
+        layout: ``_row_layout`` result for the projected columns
+        values: Row values matching the layout's keys
+
+    Returns:
+        Dictionary keyed by column name with dates as ISO strings
+    """
+    keys, date_keys = layout
+    payload = dict(zip(keys, values))
+    for key in date_keys:
+        value = payload[key]
+        if value is not None:
+            payload[key] = value.isoformat()
+    return payload
+
+
+# Built once at import so per-row serialization is a zip plus date fixups
+_CHALLENGE_LAYOUT = _row_layout(_CHALLENGE_COLUMNS)
+_PARTICIPANT_LAYOUT = _row_layout(_PARTICIPANT_COLUMNS)
+
 
 class ValidationError(Exception):
     """Raised when a request payload fails validation rules."""
 
 
+class OwnershipError(ValidationError):
+    """Raised when an action is restricted by challenge ownership."""
+
+
 class ChallengesService:
     """Service class for challenges business logic."""
 
@@ -60,9 +157,8 @@ class ChallengesService:
         
         # Parse and validate dates
         try:
-            from datetime import datetime
-            start_date = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
-            end_date = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
+            start_date = parse_iso_date(data['start_date'])
+            end_date = parse_iso_date(data['end_date'])
         except ValueError:
             raise ValidationError('Invalid date format. Use YYYY-MM-DD')
         
@@ -94,13 +190,18 @@ class ChallengesService:
         Raises:
             ValidationError: If any user ID doesn't exist
         """
-        invalid_ids = []
-        for user_id in user_ids:
-            if exclude_user_id and user_id == exclude_user_id:
-                continue
-            user = db.session.get(User, user_id)
-            if not user:
-                invalid_ids.append(user_id)
+        candidate_ids = [
+            user_id for user_id in user_ids
+            if not (exclude_user_id and user_id == exclude_user_id)
+        ]
+        if not candidate_ids:
+            return
+        
+        # One IN query for all ids instead of a lookup per id
+        found_ids = set(db.session.scalars(
+            select(User.id).where(User.id.in_(candidate_ids))
+        ))
+        invalid_ids = [user_id for user_id in candidate_ids if user_id not in found_ids]
         
         if invalid_ids:
             raise ValidationError(f'User IDs not found: {invalid_ids}')
@@ -149,23 +250,23 @@ class ChallengesService:
         db.session.add(challenge)
         db.session.flush()  # Get challenge.challenge_id
         
-        # Add owner as participant with 'accepted' status
-        owner_participant = ChallengeParticipant(
-            challenge_id=challenge.challenge_id,
-            user_id=owner_id,
-            invitation_status='accepted'
+        # Add owner as participant with 'accepted' status and invited users
+        # with 'pending' status (excluding owner) in one multi-row INSERT
+        rows = [{
+            'challenge_id': challenge.challenge_id,
+            'user_id': owner_id,
+            'invitation_status': 'accepted',
+        }]
+        rows.extend(
+            {
+                'challenge_id': challenge.challenge_id,
+                'user_id': user_id,
+                'invitation_status': 'pending',
+            }
+            for user_id in dict.fromkeys(invited_user_ids)
+            if user_id != owner_id
         )
-        db.session.add(owner_participant)
-        
-        # Add invited users as participants with 'pending' status (excluding owner)
-        for user_id in invited_user_ids:
-            if user_id != owner_id:
-                participant = ChallengeParticipant(
-                    challenge_id=challenge.challenge_id,
-                    user_id=user_id,
-                    invitation_status='pending'
-                )
-                db.session.add(participant)
+        db.session.execute(insert(ChallengeParticipant), rows)
         
         db.session.commit()
         
@@ -202,7 +303,8 @@ class ChallengesService:
             Updated Challenge object
             
         Raises:
-            ValidationError: If user is not the owner or validation fails
+            OwnershipError: If user is not the owner
+            ValidationError: If validation fails
         """
         challenge = db.session.get(Challenge, challenge_id)
         if not challenge:
@@ -210,7 +312,7 @@ class ChallengesService:
         
         # Only owner can edit
         if challenge.owner_id != user_id:
-            raise ValidationError('Only the challenge owner can edit it')
+            raise OwnershipError('Only the challenge owner can edit it')
         
         # Cannot edit completed or deleted challenges
         if challenge.status in ['completed', 'deleted']:
@@ -230,20 +332,13 @@ class ChallengesService:
             # Validate new user IDs exist
             ChallengesService.validate_user_ids(new_invited_user_ids, exclude_user_id=None)
             
-            # Get existing participant user IDs
-            existing_participants = {p.user_id for p in challenge.participants}
-            
             # Add only new participants with 'pending' invitation status
-            for user_id_to_add in new_invited_user_ids:
-                if user_id_to_add not in existing_participants:
-                    participant = ChallengeParticipant(
-                        challenge_id=challenge.challenge_id,
-                        user_id=user_id_to_add,
-                        invitation_status='pending'
-                    )
-                    db.session.add(participant)
+            ChallengesService._add_pending_participants(
+                challenge.challenge_id, new_invited_user_ids
+            )
         
         db.session.commit()
+        ChallengesService.invalidate_leaderboards([challenge_id])
         
         return challenge
 
@@ -258,24 +353,33 @@ class ChallengesService:
         Returns:
             List of challenge dictionaries with user stats
         """
-        # Get all accepted participations for user
-        participations = ChallengeParticipant.query.filter_by(
-            user_id=user_id,
-            invitation_status='accepted'
+        # Auto-complete expired challenges unless `flask complete-challenges`
+        # runs on a schedule instead; only these need ORM instances
+        if current_app.config["COMPLETE_CHALLENGES_ON_READ"]:
+            ChallengesService.complete_expired_challenges(user_id)
+
+        # Project the serialized columns directly instead of hydrating
+        # Challenge and ChallengeParticipant objects for every row
+        rows = db.session.execute(
+            select(*_CHALLENGE_COLUMNS, *_PARTICIPANT_COLUMNS)
+            .join(Challenge, Challenge.challenge_id == ChallengeParticipant.challenge_id)
+            .where(
+                ChallengeParticipant.user_id == user_id,
+                ChallengeParticipant.invitation_status == 'accepted',
+                Challenge.status != 'deleted',  # Don't show deleted challenges
+            )
+            .order_by(ChallengeParticipant.participant_id)
         ).all()
-        
+
         challenges_data = []
-        for participation in participations:
-            challenge = participation.challenge
-            
-            # Auto-complete expired challenges
-            ChallengesService.check_and_complete_challenge(challenge)
-            
-            if challenge.status != 'deleted':  # Don't show deleted challenges
-                challenge_dict = challenge.to_dict()
-                # Add user's participation data
-                challenge_dict['user_stats'] = participation.to_dict()
-                challenges_data.append(challenge_dict)
+        challenge_width = len(_CHALLENGE_COLUMNS)
+        for row in rows:
+            challenge_dict = _row_to_dict(_CHALLENGE_LAYOUT, row[:challenge_width])
+            # Add user's participation data
+            challenge_dict['user_stats'] = _row_to_dict(
+                _PARTICIPANT_LAYOUT, row[challenge_width:]
+            )
+            challenges_data.append(challenge_dict)
         
         return challenges_data
 
@@ -290,22 +394,27 @@ class ChallengesService:
         Returns:
             List of challenge dictionaries with invitation details and owner info
         """
-        # Get all pending participations for user
-        participations = ChallengeParticipant.query.filter_by(
-            user_id=user_id,
-            invitation_status='pending'
-        ).all()
+        # Get all pending participations for user; the challenge comes from
+        # the filtering join and its owner is eager loaded, so there are no
+        # lazy loads per invitation
+        participations = ChallengeParticipant.query.join(
+            ChallengeParticipant.challenge
+        ).options(
+            contains_eager(ChallengeParticipant.challenge).joinedload(Challenge.owner)
+        ).filter(
+            ChallengeParticipant.user_id == user_id,
+            ChallengeParticipant.invitation_status == 'pending',
+            Challenge.status != 'deleted',  # Don't show deleted challenges
+        ).order_by(ChallengeParticipant.participant_id).all()
         
         invitations = []
         for participation in participations:
             challenge = participation.challenge
-            
-            if challenge.status != 'deleted':  # Don't show deleted challenges
-                challenge_dict = challenge.to_dict()
-                challenge_dict['participant_id'] = participation.participant_id
-                # Add owner information
-                challenge_dict['owner_username'] = challenge.owner.username if challenge.owner else 'Unknown'
-                invitations.append(challenge_dict)
+            challenge_dict = challenge.to_dict()
+            challenge_dict['participant_id'] = participation.participant_id
+            # Add owner information
+            challenge_dict['owner_username'] = challenge.owner.username if challenge.owner else 'Unknown'
+            invitations.append(challenge_dict)
         
         return invitations
 
@@ -344,6 +453,7 @@ class ChallengesService:
             # db.session.delete(participation)
         
         db.session.commit()
+        ChallengesService.invalidate_leaderboards([participation.challenge_id])
         
         # If accepted, recalculate challenge stats from existing screen time logs
         if accept:
@@ -377,7 +487,7 @@ class ChallengesService:
         Raises:
             ValidationError: If user is not a participant
         """
-        challenge = Challenge.query.get_or_404(challenge_id)
+        challenge = db.get_or_404(Challenge, challenge_id)
         
         # Check if user is a participant
         participation = ChallengeParticipant.query.filter_by(
@@ -391,13 +501,20 @@ class ChallengesService:
         return challenge, participation
 
     @staticmethod
-    def get_leaderboard(challenge_id: int, user_id: int) -> Tuple[Challenge, List[Dict]]:
+    def get_leaderboard(
+        challenge_id: int,
+        user_id: int,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[Challenge, List[Dict]]:
         """
-        Get leaderboard for a challenge.
+        Get leaderboard for a challenge, optionally one page of it.
         
         Args:
             challenge_id: ID of the challenge
             user_id: ID of the requesting user
+            limit: Optional maximum number of entries to return
+            offset: Number of leading entries to skip
             
         Returns:
             Tuple of (Challenge, leaderboard list)
@@ -406,23 +523,44 @@ class ChallengesService:
             ValidationError: If user is not a participant
         """
         # Eager load owner to avoid N+1 query
-        challenge = Challenge.query.options(joinedload(Challenge.owner)).get_or_404(challenge_id)
-        
-        # Check if user is a participant
-        user_participation = ChallengeParticipant.query.filter_by(
-            challenge_id=challenge_id,
-            user_id=user_id
-        ).first()
+        challenge = db.session.get(
+            Challenge, challenge_id, options=[joinedload(Challenge.owner)]
+        )
+        if challenge is None:
+            abort(404)
         
-        if not user_participation:
-            raise ValidationError('You are not a participant in this challenge')
+        # Order in SQL: completed challenges by rank (accepted participants
+        # first), active ones by average daily minutes (lowest first)
+        if challenge.status == 'completed':
+            order = (
+                ChallengeParticipant.invitation_status != 'accepted',
+                ChallengeParticipant.final_rank.is_(None),
+                ChallengeParticipant.final_rank,
+            )
+        else:
+            order = (_AVERAGE_DAILY_MINUTES,)
         
         # Get all participants with their stats
         participants = ChallengeParticipant.query.options(
             joinedload(ChallengeParticipant.user)
         ).filter_by(
             challenge_id=challenge_id
-        ).all()
+        ).order_by(*order, ChallengeParticipant.participant_id)
+        paginated = limit is not None or offset > 0
+        if paginated:
+            participants = participants.limit(limit).offset(offset)
+        participants = participants.all()
+        
+        # Check if user is a participant (reuses the rows loaded above; a
+        # page may leave the caller out, so only then ask the database)
+        is_member = any(p.user_id == user_id for p in participants)
+        if not is_member and paginated:
+            is_member = db.session.scalar(select(exists().where(
+                ChallengeParticipant.challenge_id == challenge_id,
+                ChallengeParticipant.user_id == user_id
+            )))
+        if not is_member:
+            raise ValidationError('You are not a participant in this challenge')
         
         leaderboard = []
         for participant in participants:
@@ -450,20 +588,95 @@ class ChallengesService:
                 'invitation_status': participant.invitation_status
             })
         
-        # Sort leaderboard
-        if challenge.status == 'completed':
-            # For completed challenges, sort by rank (with accepted participants first)
-            leaderboard.sort(key=lambda x: (
-                x['invitation_status'] != 'accepted',  # Accepted participants first
-                x['rank'] if x['rank'] is not None else float('inf')  # Then by rank
-            ))
-        else:
-            # For active challenges, sort by average daily screen time (lowest first)
-            # Note: average_daily_minutes is always a number (0.0 if no logs)
-            leaderboard.sort(key=lambda x: x['average_daily_minutes'])
-        
         return challenge, leaderboard
 
+    @staticmethod
+    def get_leaderboard_payload(
+        challenge_id: int,
+        user_id: int,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> bytes:
+        """
+        Get the encoded leaderboard response body for a challenge.
+
+        Full bodies are cached per challenge for ``LEADERBOARD_CACHE_TIMEOUT``
+        seconds and dropped by ``invalidate_leaderboards`` whenever stats
+        or membership change; cached bodies are served after a single
+        indexed membership check (see ``is_participant``). Pages are
+        built fresh, since they only read ``limit`` rows, and also report
+        ``total_count``.
+
+        Args:
+            challenge_id: ID of the challenge
+            user_id: ID of the requesting user
+            limit: Optional maximum number of entries to return
+            offset: Number of leading entries to skip
+
+        Returns:
+            JSON bytes of ``{"challenge", "owner_username", "leaderboard"}``
+
+        Raises:
+            ValidationError: If user is not a participant
+        """
+        paginated = limit is not None or offset > 0
+        key = CHALLENGE_LEADERBOARD_CACHE_KEY.format(challenge_id)
+        if not paginated:
+            body = cache.get(key)
+            if body is not None and ChallengesService.is_participant(challenge_id, user_id):
+                return body
+
+        challenge, leaderboard = ChallengesService.get_leaderboard(
+            challenge_id, user_id, limit, offset
+        )
+        payload = {
+            'challenge': challenge.to_dict(),
+            'owner_username': challenge.owner.username if challenge.owner else 'Unknown',
+            'leaderboard': leaderboard
+        }
+        if paginated:
+            payload['total_count'] = db.session.scalar(
+                select(func.count()).where(
+                    ChallengeParticipant.challenge_id == challenge_id
+                )
+            )
+            return current_app.json.dumps_bytes(payload)
+
+        body = current_app.json.dumps_bytes(payload)
+        cache.set(key, body, timeout=current_app.config["LEADERBOARD_CACHE_TIMEOUT"])
+        return body
+
+    @staticmethod
+    def is_participant(challenge_id: int, user_id: int) -> bool:
+        """
+        Check whether a user has any participant row in a challenge.
+
+        Args:
+            challenge_id: ID of the challenge
+            user_id: ID of the user
+
+        Returns:
+            True if the user was ever invited to or joined the challenge
+        """
+        return db.session.scalar(select(exists().where(
+            ChallengeParticipant.challenge_id == challenge_id,
+            ChallengeParticipant.user_id == user_id,
+        )))
+
+    @staticmethod
+    def invalidate_leaderboards(challenge_ids: List[int]) -> None:
+        """
+        Drop cached leaderboard bodies for challenges whose data changed.
+
+        Args:
+            challenge_ids: IDs of the affected challenges
+        """
+        if challenge_ids:
+            cache.delete_many(*(
+                CHALLENGE_LEADERBOARD_CACHE_KEY.format(challenge_id)
+                for challenge_id in challenge_ids
+            ))
+
     @staticmethod
     def invite_users(challenge_id: int, user_ids: List[int], current_user_id: int) -> int:
         """
@@ -478,13 +691,14 @@ class ChallengesService:
             Count of successfully invited users
             
         Raises:
+            OwnershipError: If the requester is not the owner
             ValidationError: If validation fails
         """
-        challenge = Challenge.query.get_or_404(challenge_id)
+        challenge = db.get_or_404(Challenge, challenge_id)
         
         # Only owner can invite
         if challenge.owner_id != current_user_id:
-            raise ValidationError('Only the challenge owner can invite members')
+            raise OwnershipError('Only the challenge owner can invite members')
         
         # Can't invite to completed or deleted challenges
         if challenge.status in ['completed', 'deleted']:
@@ -493,25 +707,55 @@ class ChallengesService:
         # Validate all user IDs exist
         ChallengesService.validate_user_ids(user_ids)
         
-        invited_count = 0
-        for user_id in user_ids:
-            # Check if already participating
-            existing = ChallengeParticipant.query.filter_by(
-                challenge_id=challenge_id,
-                user_id=user_id
-            ).first()
-            
-            if not existing:
-                participant = ChallengeParticipant(
-                    challenge_id=challenge_id,
-                    user_id=user_id
-                )
-                db.session.add(participant)
-                invited_count += 1
-        
+        invited = ChallengesService._add_pending_participants(challenge_id, user_ids)
         db.session.commit()
+        ChallengesService.invalidate_leaderboards([challenge_id])
         
-        return invited_count
+        return invited
+
+    @staticmethod
+    def _add_pending_participants(challenge_id: int, user_ids: List[int]) -> int:
+        """
+        Add pending participants for users not yet in a challenge, without committing.
+
+        Args:
+            challenge_id: ID of the challenge
+            user_ids: User IDs to invite; duplicates and members are skipped
+
+        Returns:
+            Count of participants added
+        """
+        rows = [
+            {'challenge_id': challenge_id, 'user_id': user_id, 'invitation_status': 'pending'}
+            for user_id in dict.fromkeys(user_ids)
+        ]
+        if not rows:
+            return 0
+
+        dialect = db.session.get_bind().dialect.name
+        if dialect in _UPSERT_INSERTS:
+            # One INSERT; uq_challenge_participant skips existing members,
+            # so concurrent invites cannot add the same user twice
+            result = db.session.execute(
+                _UPSERT_INSERTS[dialect](ChallengeParticipant).values(rows)
+                .on_conflict_do_nothing(index_elements=['challenge_id', 'user_id'])
+            )
+            return result.rowcount
+
+        # Fetch everyone already participating in one query
+        existing_ids = set(db.session.scalars(
+            select(ChallengeParticipant.user_id).where(
+                ChallengeParticipant.challenge_id == challenge_id,
+                ChallengeParticipant.user_id.in_(user_ids)
+            )
+        ))
+        new_rows = [row for row in rows if row['user_id'] not in existing_ids]
+        
+        if new_rows:
+            # Single bulk INSERT instead of one session.add per invitee
+            db.session.execute(insert(ChallengeParticipant), new_rows)
+
+        return len(new_rows)
 
     @staticmethod
     def leave_challenge(challenge_id: int, user_id: int) -> None:
@@ -523,24 +767,28 @@ class ChallengesService:
             user_id: ID of the user leaving
             
         Raises:
-            ValidationError: If user is not a participant or is the owner
+            OwnershipError: If the user is the owner
+            ValidationError: If user is not a participant
         """
-        # Find user's participation
-        participation = ChallengeParticipant.query.filter_by(
-            challenge_id=challenge_id,
-            user_id=user_id
-        ).first()
-        
-        if not participation:
-            raise ValidationError('You are not a participant in this challenge')
-        
         # Don't allow owner to leave (they should delete instead)
-        if participation.challenge.owner_id == user_id:
-            raise ValidationError('Challenge owner cannot leave. Delete the challenge instead.')
-        
-        # Remove participation
-        db.session.delete(participation)
+        owner_id = db.session.scalar(
+            select(Challenge.owner_id).where(Challenge.challenge_id == challenge_id)
+        )
+        if owner_id == user_id:
+            raise OwnershipError('Challenge owner cannot leave. Delete the challenge instead.')
+        
+        # Remove participation with one DELETE instead of loading it first
+        result = db.session.execute(
+            delete(ChallengeParticipant).where(
+                ChallengeParticipant.challenge_id == challenge_id,
+                ChallengeParticipant.user_id == user_id
+            ),
+            execution_options={'synchronize_session': False}
+        )
+        if not result.rowcount:
+            raise ValidationError('You are not a participant in this challenge')
         db.session.commit()
+        ChallengesService.invalidate_leaderboards([challenge_id])
 
     @staticmethod
     def delete_challenge(challenge_id: int, user_id: int) -> None:
@@ -552,17 +800,18 @@ class ChallengesService:
             user_id: ID of the user making the request
             
         Raises:
-            ValidationError: If user is not the owner
+            OwnershipError: If user is not the owner
         """
-        challenge = Challenge.query.get_or_404(challenge_id)
+        challenge = db.get_or_404(Challenge, challenge_id)
         
         # Only owner can delete
         if challenge.owner_id != user_id:
-            raise ValidationError('Only the challenge owner can delete it')
+            raise OwnershipError('Only the challenge owner can delete it')
         
         # Mark as deleted instead of actually deleting (preserve data)
         challenge.status = 'deleted'
         db.session.commit()
+        ChallengesService.invalidate_leaderboards([challenge_id])
 
     @staticmethod
     def check_and_complete_challenge(challenge: Challenge) -> None:
@@ -580,51 +829,172 @@ class ChallengesService:
         
         # Auto-complete if end_date has passed and still active
         if today > challenge.end_date and challenge.status == 'active':
-            # Get all accepted participants
-            participants = ChallengeParticipant.query.filter_by(
-                challenge_id=challenge.challenge_id,
-                invitation_status='accepted'
-            ).all()
-            
-            if participants:
-                # Calculate average daily screen time for each participant
-                # For zero-hour challenges (target 0), users with no logs (0 avg) should win
-                participant_averages = []
-                for p in participants:
-                    if p.days_logged > 0:
-                        avg = p.total_screen_time_minutes / p.days_logged
-                    else:
-                        # No logs means 0 average (perfect for zero-target challenges)
-                        avg = 0.0
-                    participant_averages.append((p, avg))
-                
-                # Sort by average daily screen time (lowest wins)
-                participant_averages.sort(key=lambda x: x[1])
-                
-                # Find the minimum average daily screen time
-                min_avg = participant_averages[0][1]
-                
-                # Assign ranks with proper skipping for ties
-                current_rank = 1
-                for i, (participant, avg) in enumerate(participant_averages):
-                    # If not first and average differs from previous, update rank
-                    if i > 0 and avg != participant_averages[i-1][1]:
-                        current_rank = i + 1
-                    
-                    participant.final_rank = current_rank
-                    participant.is_winner = (avg == min_avg)
-                    participant.challenge_completed = True
-            
-            # Mark challenge as completed
-            challenge.status = 'completed'
-            challenge.completed_at = current_time_utc()
+            completed_ids, winner_ids = ChallengesService._complete_challenges(
+                [challenge.challenge_id]
+            )
             db.session.commit()
-            
-            # Check and award badges for all winners
+            if not completed_ids:
+                # Another request or worker completed it first
+                return
+            ChallengesService.invalidate_leaderboards(completed_ids)
+
+            ChallengesService._award_winner_badges(winner_ids)
+            ChallengesService._notify_completion(completed_ids)
+
+    @staticmethod
+    def complete_expired_challenges(user_id: Optional[int] = None) -> int:
+        """
+        Complete every expired active challenge, or only those a user accepted.
+
+        All expired challenges are ranked and closed by the same two UPDATE
+        statements and committed together, instead of one participant
+        query and one commit per expired challenge. Challenges a concurrent
+        call closed first are skipped, so their winners are not awarded or
+        emailed twice.
+
+        Args:
+            user_id: ID of a participating user, or None for all challenges
+
+        Returns:
+            Number of challenges completed
+        """
+        query = select(Challenge.challenge_id).where(
+            Challenge.status == 'active',
+            Challenge.end_date < date.today(),
+        )
+        if user_id is not None:
+            query = query.join(ChallengeParticipant).where(
+                ChallengeParticipant.user_id == user_id,
+                ChallengeParticipant.invitation_status == 'accepted',
+            )
+        expired_ids = list(db.session.scalars(query))
+        if not expired_ids:
+            return 0
+
+        completed_ids, winner_ids = ChallengesService._complete_challenges(expired_ids)
+        db.session.commit()
+        if not completed_ids:
+            return 0
+        ChallengesService.invalidate_leaderboards(completed_ids)
+
+        ChallengesService._award_winner_badges(winner_ids)
+        ChallengesService._notify_completion(completed_ids)
+        return len(completed_ids)
+
+    @staticmethod
+    def _complete_challenges(challenge_ids: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        Mark still-active challenges completed and rank them, without committing.
+
+        The status change is guarded on 'active', so when two requests or
+        workers complete the same challenge only the first one moves it;
+        only the challenges this call moved are ranked and returned.
+
+        Ranks are computed in the database with RANK() over each
+        participant's average daily minutes (lowest first, ties share a
+        rank and skip the next), and everyone tied for the lowest average
+        wins. Participants with no logs average 0.
+
+        Args:
+            challenge_ids: IDs of the expired challenges to complete
+
+        Returns:
+            Tuple of (IDs of the challenges this call completed, user IDs of
+            their winner(s), ordered by challenge)
+        """
+        # Session objects are expired by the caller's commit
+        no_sync = {'synchronize_session': False}
+        completed_ids = sorted(db.session.scalars(
+            update(Challenge)
+            .where(
+                Challenge.challenge_id.in_(challenge_ids),
+                Challenge.status == 'active',
+            )
+            .values(status='completed', completed_at=current_time_utc())
+            .returning(Challenge.challenge_id),
+            execution_options=no_sync,
+        ))
+        if not completed_ids:
+            return [], []
+
+        # For zero-hour challenges (target 0), users with no logs (0 avg) should win
+        average = _AVERAGE_DAILY_MINUTES
+        by_challenge = {'partition_by': ChallengeParticipant.challenge_id}
+        ranked = select(
+            ChallengeParticipant.participant_id,
+            func.rank().over(order_by=average, **by_challenge).label('rank'),
+            (average == func.min(average).over(**by_challenge)).label('is_winner'),
+        ).where(
+            ChallengeParticipant.challenge_id.in_(completed_ids),
+            ChallengeParticipant.invitation_status == 'accepted',
+        ).subquery()
+
+        db.session.execute(
+            update(ChallengeParticipant)
+            .where(ChallengeParticipant.participant_id == ranked.c.participant_id)
+            .values(
+                final_rank=ranked.c.rank,
+                is_winner=ranked.c.is_winner,
+                challenge_completed=True,
+            ),
+            execution_options=no_sync,
+        )
+
+        winner_ids = list(db.session.scalars(
+            select(ChallengeParticipant.user_id).where(
+                ChallengeParticipant.challenge_id.in_(completed_ids),
+                ChallengeParticipant.invitation_status == 'accepted',
+                ChallengeParticipant.is_winner.is_(True),
+            ).order_by(
+                ChallengeParticipant.challenge_id, ChallengeParticipant.participant_id
+            )
+        ))
+        return completed_ids, winner_ids
+
+    @staticmethod
+    def _award_winner_badges(winner_ids: List[int]) -> None:
+        """
+        Check and award badges for challenge winners.
+
+        Args:
+            winner_ids: User IDs of the winners, possibly repeated
+        """
+        try:
+            from .badge_achievement_service import BadgeAchievementService
+            for winner_id in dict.fromkeys(winner_ids):
+                BadgeAchievementService.check_and_award_badges(winner_id)
+        except Exception as e:
+            logger.error(f"Error checking badges after completing challenge: {e}")
+
+    @staticmethod
+    def _notify_completion(challenge_ids: List[int]) -> None:
+        """
+        Email every accepted participant their result in completed challenges.
+
+        Recipients and results are read in one query; messages are handed
+        to the mail worker threads, so SMTP never delays the caller.
+
+        Args:
+            challenge_ids: IDs of the challenges that just completed
+        """
+        results = db.session.execute(
+            select(
+                User.email, User.username, Challenge.name,
+                ChallengeParticipant.final_rank, ChallengeParticipant.is_winner,
+            )
+            .join(ChallengeParticipant, ChallengeParticipant.user_id == User.id)
+            .join(Challenge, Challenge.challenge_id == ChallengeParticipant.challenge_id)
+            .where(
+                ChallengeParticipant.challenge_id.in_(challenge_ids),
+                ChallengeParticipant.invitation_status == 'accepted',
+            )
+        ).all()
+
+        for email, username, challenge_name, rank, is_winner in results:
             try:
-                from .badge_achievement_service import BadgeAchievementService
-                for participant in participants:
-                    if participant.is_winner:
-                        BadgeAchievementService.check_and_award_badges(participant.user_id)
+                send_challenge_completed_notification(
+                    email, username, challenge_name, rank, bool(is_winner)
+                )
             except Exception as e:
-                logger.error(f"Error checking badges after completing challenge: {e}")
+                # Log the error but don't fail the completion
+                logger.warning(f"Failed to send challenge result email to {email}: {e}")
@@ -1,8 +1,77 @@
 """Email service for sending notification emails."""
 
-from flask import current_app, render_template
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from flask import Flask, current_app, render_template
 from flask_mail import Message
 
+# SMTP round trips take hundreds of milliseconds, so messages are built in
+# the request and handed to these threads for delivery. The pool is sized
+# by MAIL_SEND_WORKERS on the first background send.
+_mail_pool: Optional[ThreadPoolExecutor] = None
+_mail_pool_lock = threading.Lock()
+
+
+def _get_mail_pool() -> ThreadPoolExecutor:
+    """Return the mail worker pool, creating it on first use.
+
+    The pool is shut down at interpreter exit after queued messages have
+    been sent, so a stopping process does not drop mail mid-send.
+
+    Returns:
+        Shared executor for background sends.
+    """
+    global _mail_pool
+    with _mail_pool_lock:
+        if _mail_pool is None:
+            _mail_pool = ThreadPoolExecutor(
+                max_workers=current_app.config["MAIL_SEND_WORKERS"],
+                thread_name_prefix="mail",
+            )
+            atexit.register(_mail_pool.shutdown, wait=True)
+        return _mail_pool
+
+
+def _send_in_app_context(app: Flask, msg: Message) -> None:
+    """Deliver a message from a worker thread, logging failures.
+
+    Args:
+        app: Application whose mail settings are used.
+        msg: Fully rendered message.
+    """
+    from .. import mail
+
+    with app.app_context():
+        try:
+            mail.send(msg)
+        except Exception:
+            app.logger.exception("Failed to send email to %s", msg.recipients)
+
+
+def _deliver(msg: Message) -> Optional[Future]:
+    """Send a rendered message, in the background unless disabled.
+
+    When ``MAIL_SEND_ASYNC`` is off the message is sent inline and
+    delivery errors reach the caller.
+
+    Args:
+        msg: Fully rendered message.
+
+    Returns:
+        Future for the background send, or None if it was sent inline.
+    """
+    if not current_app.config["MAIL_SEND_ASYNC"]:
+        from .. import mail
+        mail.send(msg)
+        return None
+
+    return _get_mail_pool().submit(
+        _send_in_app_context, current_app._get_current_object(), msg
+    )
+
 
 def send_password_reset_email(email: str, reset_token: str) -> None:
     """Send password reset email to user.
@@ -28,8 +97,7 @@ def send_password_reset_email(email: str, reset_token: str) -> None:
     msg.body = render_template('emails/password_reset.txt', reset_url=reset_url)
     
     # Send email
-    from .. import mail
-    mail.send(msg)
+    _deliver(msg)
 
 
 def send_badge_notification(email: str, username: str, badge_name: str) -> None:
@@ -66,8 +134,50 @@ def send_badge_notification(email: str, username: str, badge_name: str) -> None:
     )
     
     # Send email
-    from .. import mail
-    mail.send(msg)
+    _deliver(msg)
+
+
+def send_challenge_completed_notification(
+    email: str,
+    username: str,
+    challenge_name: str,
+    rank: Optional[int],
+    is_winner: bool
+) -> None:
+    """Send a participant their final result when a challenge completes.
+    
+    Args:
+        email: Participant's email address.
+        username: Participant's username for personalization.
+        challenge_name: Name of the completed challenge.
+        rank: Final rank, or None if the participant was not ranked.
+        is_winner: Whether the participant won the challenge.
+    """
+    # Construct challenges page URL
+    frontend_url = current_app.config.get("FRONTEND_URL", "http://localhost:5173")
+    challenges_url = f"{frontend_url}/challenges"
+    
+    # Create email message
+    subject = "🏆 You won" if is_winner else "🏁 Results are in for"
+    msg = Message(
+        subject=f"{subject} {challenge_name}!",
+        recipients=[email],
+        sender=current_app.config["MAIL_DEFAULT_SENDER"]
+    )
+    
+    # Render templates with the participant's result
+    context = {
+        "username": username,
+        "challenge_name": challenge_name,
+        "rank": rank,
+        "is_winner": is_winner,
+        "challenges_url": challenges_url,
+    }
+    msg.html = render_template('emails/challenge_completed.html', **context)
+    msg.body = render_template('emails/challenge_completed.txt', **context)
+    
+    # Send email
+    _deliver(msg)
 
 
 def send_friend_request_notification(
@@ -108,8 +218,7 @@ def send_friend_request_notification(
     )
     
     # Send email
-    from .. import mail
-    mail.send(msg)
+    _deliver(msg)
 
 
 def send_friend_request_accepted_notification(
@@ -150,8 +259,7 @@ def send_friend_request_accepted_notification(
     )
     
     # Send email
-    from .. import mail
-    mail.send(msg)
+    _deliver(msg)
 
 
 def send_welcome_email(email: str, username: str) -> None:
@@ -185,5 +293,4 @@ def send_welcome_email(email: str, username: str) -> None:
     )
     
     # Send email
-    from .. import mail
-    mail.send(msg)
+    _deliver(msg)
@@ -112,7 +112,7 @@ class FriendshipService:
                 
                 # Send email notification to the target user
                 try:
-                    requester = User.query.get(requester_id)
+                    requester = db.session.get(User, requester_id)
                     if requester and target_user.email:
                         send_friend_request_notification(
                             target_user.email,
@@ -138,7 +138,7 @@ class FriendshipService:
 
         # Send email notification to the target user
         try:
-            requester = User.query.get(requester_id)
+            requester = db.session.get(User, requester_id)
             if requester and target_user.email:
                 send_friend_request_notification(
                     target_user.email,
@@ -169,7 +169,7 @@ class FriendshipService:
             ValidationError: When not found or not pending.
         """
 
-        friendship = Friendship.query.get(friendship_id)
+        friendship = db.session.get(Friendship, friendship_id)
 
         if not friendship or friendship.friend_id != user_id:
             raise ValidationError("Request not found.")
@@ -190,8 +190,8 @@ class FriendshipService:
         
         # Send email notification to the original requester
         try:
-            requester = User.query.get(friendship.user_id)
-            accepter = User.query.get(user_id)
+            requester = db.session.get(User, friendship.user_id)
+            accepter = db.session.get(User, user_id)
             if requester and accepter and requester.email:
                 send_friend_request_accepted_notification(
                     requester.email,
@@ -221,7 +221,7 @@ class FriendshipService:
             ValidationError: When not found or not pending.
         """
 
-        friendship = Friendship.query.get(friendship_id)
+        friendship = db.session.get(Friendship, friendship_id)
 
         if not friendship or friendship.friend_id != user_id:
             raise ValidationError("Request not found.")
@@ -248,7 +248,7 @@ class FriendshipService:
             ValidationError: When not found or not pending.
         """
 
-        friendship = Friendship.query.get(friendship_id)
+        friendship = db.session.get(Friendship, friendship_id)
 
         if not friendship or friendship.user_id != user_id:
             raise ValidationError("Request not found.")
@@ -1,11 +1,36 @@
 """Service layer for leaderboard operations."""
 
+import heapq
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Tuple
 
-from ..models import User, ScreenTimeLog
+from flask import current_app
+from sqlalchemy import case, func, select, update
+
+from .. import cache
+from ..database import db
+from ..models import Goal, User, ScreenTimeLog
 from .streak_service import StreakService
 
+# Cache key prefix for rendered global leaderboard bodies, one per limit
+GLOBAL_LEADERBOARD_CACHE_KEY = "leaderboard_global"
+# Counter folded into the cache key; bumping it orphans every cached body
+GLOBAL_LEADERBOARD_EPOCH_KEY = "leaderboard_global_epoch"
+
+
+def _day_minutes():
+    """Build the per-day minutes aggregate for logs grouped by date.
+
+    Returns:
+        ColumnElement: The "Total" entry if logged, else the sum of all apps
+    """
+    total_app_minutes = func.sum(case(
+        (ScreenTimeLog.app_name == "Total", ScreenTimeLog.screen_time_minutes)
+    ))
+    return func.coalesce(
+        total_app_minutes, func.sum(ScreenTimeLog.screen_time_minutes)
+    )
+
 
 class LeaderboardService:
     """Service class for leaderboard business logic."""
@@ -67,33 +92,28 @@ class LeaderboardService:
         """
         start, end, days = LeaderboardService.get_month_range(reference_date)
 
-        # Get all screen time logs for this user in the month
-        logs = ScreenTimeLog.query.filter(
-            ScreenTimeLog.user_id == user_id,
-            ScreenTimeLog.date >= start,
-            ScreenTimeLog.date <= end
-        ).all()
-
-        # Group by date and sum minutes (using Total or sum of all apps)
-        daily_totals = {}
-        for log in logs:
-            day = log.date
-            if day not in daily_totals:
-                daily_totals[day] = {}
-
-            app = log.app_name
-            daily_totals[day][app] = (
-                daily_totals[day].get(app, 0) + log.screen_time_minutes
+        # One round-trip: per-day totals for the month, each row carrying
+        # the user's first daily goal (as StreakService.calculate_streak)
+        daily_target = (
+            select(Goal.target_minutes)
+            .where(Goal.user_id == user_id, Goal.goal_type == "daily")
+            .order_by(Goal.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        day_rows = db.session.execute(
+            select(ScreenTimeLog.date, _day_minutes(), daily_target)
+            .where(
+                ScreenTimeLog.user_id == user_id,
+                ScreenTimeLog.date >= start,
+                ScreenTimeLog.date <= end,
             )
+            .group_by(ScreenTimeLog.date)
+        ).all()
 
-        # Calculate total for each day
-        day_minutes = {}
-        for day, apps in daily_totals.items():
-            # Use "Total" if available, otherwise sum all apps
-            if "Total" in apps:
-                day_minutes[day] = apps["Total"]
-            else:
-                day_minutes[day] = sum(apps.values())
+        day_minutes = {day: minutes for day, minutes, _ in day_rows}
+        # Without logs there is no streak, with or without a goal
+        target_minutes = day_rows[0][2] if day_rows else None
 
         # Filter out days with 0 minutes
         days_with_data = {d: m for d, m in day_minutes.items() if m > 0}
@@ -103,8 +123,8 @@ class LeaderboardService:
         avg_per_day = total_minutes / days_logged if days_logged > 0 else None
 
         # Calculate streak (consecutive days meeting daily goal)
-        streak = StreakService.calculate_streak(
-            user_id, days, days_with_data
+        streak = StreakService.calculate_streak_for_target(
+            days, days_with_data, target_minutes
         )
 
         return {
@@ -114,6 +134,111 @@ class LeaderboardService:
             "streak": streak,
         }
 
+    @staticmethod
+    def compute_all_monthly_stats() -> List[Dict]:
+        """Compute this month's statistics for every user with logged data.
+
+        Streaks depend on each user's daily goal and on runs of
+        consecutive days, so they cannot be computed in SQL. Instead the
+        month's per-day totals and all daily goals are loaded in two
+        grouped queries (rather than two queries per user).
+
+        Returns:
+            List of dicts with user_id, username and the fields of
+            ``compute_user_monthly_stats``, in no particular order.
+        """
+        start, end, days = LeaderboardService.get_month_range()
+
+        day_rows = db.session.execute(
+            select(
+                ScreenTimeLog.user_id,
+                User.username,
+                ScreenTimeLog.date,
+                _day_minutes(),
+            )
+            .join(User, User.id == ScreenTimeLog.user_id)
+            .where(ScreenTimeLog.date >= start, ScreenTimeLog.date <= end)
+            .group_by(ScreenTimeLog.user_id, User.username, ScreenTimeLog.date)
+        ).all()
+
+        usernames = {}
+        user_days = {}
+        for user_id, username, day, minutes in day_rows:
+            # Filter out days with 0 minutes
+            if minutes > 0:
+                usernames[user_id] = username
+                user_days.setdefault(user_id, {})[day] = minutes
+
+        if not user_days:
+            return []
+
+        # First daily goal per user, matching StreakService.calculate_streak
+        targets = {}
+        for user_id, target_minutes in db.session.execute(
+            select(Goal.user_id, Goal.target_minutes)
+            .where(Goal.goal_type == "daily", Goal.user_id.in_(user_days))
+            .order_by(Goal.id)
+        ):
+            targets.setdefault(user_id, target_minutes)
+
+        user_stats = []
+        for user_id, days_with_data in user_days.items():
+            total_minutes = sum(days_with_data.values())
+            days_logged = len(days_with_data)
+            user_stats.append({
+                "user_id": user_id,
+                "username": usernames[user_id],
+                "avg_per_day": round(total_minutes / days_logged, 1),
+                "total_minutes": total_minutes,
+                "days_logged": days_logged,
+                "streak": StreakService.calculate_streak_for_target(
+                    days, days_with_data, targets.get(user_id)
+                ),
+            })
+
+        return user_stats
+
+    @staticmethod
+    def sync_streak_counts() -> int:
+        """Store every user's current monthly streak in ``User.streak_count``.
+
+        Stats for all users come from ``compute_all_monthly_stats``; users
+        without data this month whose stored streak is non-zero are reset
+        to 0. Everything is written back in one executemany UPDATE keyed
+        by primary key.
+
+        Returns:
+            int: Number of users whose streak was written.
+        """
+        start, end, _ = LeaderboardService.get_month_range()
+
+        streaks = [
+            {"id": stats["user_id"], "streak_count": stats["streak"]}
+            for stats in LeaderboardService.compute_all_monthly_stats()
+        ]
+        # Users with a non-zero day this month, as a subquery rather than
+        # one bound parameter per active user
+        active_ids = (
+            select(ScreenTimeLog.user_id)
+            .where(ScreenTimeLog.date >= start, ScreenTimeLog.date <= end)
+            .group_by(ScreenTimeLog.user_id, ScreenTimeLog.date)
+            .having(_day_minutes() > 0)
+        )
+        stale_ids = db.session.scalars(
+            select(User.id).where(
+                User.id.not_in(active_ids),
+                User.streak_count != 0,
+            )
+        ).all()
+        streaks.extend({"id": user_id, "streak_count": 0} for user_id in stale_ids)
+        if not streaks:
+            return 0
+
+        db.session.execute(update(User), streaks)
+        db.session.commit()
+
+        return len(streaks)
+
     @staticmethod
     def get_global_leaderboard(limit: int = 50) -> List[Dict]:
         """Get the global leaderboard ranked by highest streak.
@@ -121,46 +246,62 @@ class LeaderboardService:
         Tiebreaker: Lower average screen time wins.
         Only includes users with screen time data logged this month.
 
+        Stats come from ``compute_all_monthly_stats`` and only the top
+        ``limit`` users are selected.
+
         Args:
             limit: Maximum number of users to return.
 
         Returns:
             List of user dicts with stats, ordered by rank.
         """
-        # Get all users
-        # Note: Computes stats for ALL users before limiting.
-        # Consider pagination/caching for large user bases.
-        users = User.query.all()
-
-        # Compute stats for each user
-        user_stats = []
-        for user in users:
-            stats = LeaderboardService.compute_user_monthly_stats(user.id)
-            
-            # Only include users with logged data
-            if stats["days_logged"] > 0:
-                user_stats.append({
-                    "user_id": user.id,
-                    "username": user.username,
-                    "avg_per_day": stats["avg_per_day"],
-                    "total_minutes": stats["total_minutes"],
-                    "days_logged": stats["days_logged"],
-                    "streak": stats["streak"],
-                })
+        user_stats = LeaderboardService.compute_all_monthly_stats()
 
         # Sort by:
         # 1. Streak descending (higher streak = better)
         # 2. Avg screen time ascending (lower = better) as tiebreaker
         def sort_key(u):
-            streak = u["streak"] or 0
-            avg = u["avg_per_day"]
-            # Normal case: sort by streak desc, then avg asc
-            return (-streak, avg, u["username"])
+            return (-u["streak"], u["avg_per_day"], u["username"])
 
-        user_stats.sort(key=sort_key)
+        top = heapq.nsmallest(limit, user_stats, key=sort_key)
 
         # Add rank
-        for i, u in enumerate(user_stats):
+        for i, u in enumerate(top):
             u["rank"] = i + 1
 
-        return user_stats[:limit]
+        return top
+
+    @staticmethod
+    def get_global_leaderboard_payload(limit: int = 50) -> bytes:
+        """Get the encoded global leaderboard response body.
+
+        Bodies are cached per ``limit`` for ``LEADERBOARD_CACHE_TIMEOUT``
+        seconds, so repeat requests skip both the per-user stats
+        computation and JSON encoding.
+
+        Args:
+            limit: Maximum number of users to return.
+
+        Returns:
+            JSON bytes of ``{"leaderboard": [...], "scope": "global"}``.
+        """
+        epoch = cache.get(GLOBAL_LEADERBOARD_EPOCH_KEY) or 0
+        key = f"{GLOBAL_LEADERBOARD_CACHE_KEY}:{epoch}:{limit}"
+
+        body = cache.get(key)
+        if body is None:
+            leaderboard = LeaderboardService.get_global_leaderboard(limit=limit)
+            body = current_app.json.dumps_bytes({
+                "leaderboard": leaderboard,
+                "scope": "global",
+            })
+            cache.set(
+                key, body, timeout=current_app.config["LEADERBOARD_CACHE_TIMEOUT"]
+            )
+        return body
+
+    @staticmethod
+    def invalidate_global_leaderboard() -> None:
+        """Drop cached global leaderboard bodies after new screen time data."""
+        # Flask-Caching does not proxy ``inc``; use the backend directly
+        cache.cache.inc(GLOBAL_LEADERBOARD_EPOCH_KEY)
@@ -4,14 +4,29 @@ from datetime import date, datetime, timezone, timedelta
 from typing import Dict, Optional, Tuple, List
 import logging
 
-from sqlalchemy import func, and_
+from sqlalchemy import and_, case, extract, func, select
 
 from ..database import db
 from ..models import ScreenTimeLog, User
-from ..utils.helpers import canonicalize_app_name, list_allowed_apps
+from ..utils.helpers import canonicalize_app_name, list_allowed_apps, parse_iso_date
+from .challenges_service import ChallengesService
+from .leaderboard_service import LeaderboardService
 
 logger = logging.getLogger(__name__)
 
+# Per dialect: (weekend-day filter, Monday of the date's week) for a date
+# column, so weekend grouping runs in the database
+_WEEKEND_SQL = {
+    "sqlite": lambda day: (
+        func.strftime("%w", day).in_(("0", "6")),
+        func.date(day, "weekday 0", "-6 days"),
+    ),
+    "postgresql": lambda day: (
+        extract("isodow", day).in_((6, 7)),
+        func.date_trunc("week", day),
+    ),
+}
+
 class ValidationError(Exception):
     """Raised when a request payload fails validation rules."""
 
@@ -38,7 +53,7 @@ class ScreenTimeService:
             return None
 
         try:
-            return datetime.strptime(value, "%Y-%m-%d").date()
+            return parse_iso_date(value)
         except ValueError as exc:
             raise ValidationError(
                 f"{field_name} must be formatted as YYYY-MM-DD."
@@ -120,6 +135,7 @@ class ScreenTimeService:
         Side Effects:
             - Updates ChallengeParticipant stats for all active challenges the user is in (days_logged, total_screen_time_minutes, days_passed, days_failed).
             - Triggers badge logic to check and award badges if criteria are met.
+            - Invalidates cached global leaderboard bodies.
             - Commits all changes to the database.
         """
         validated = ScreenTimeService._validate_payload(data)
@@ -167,6 +183,9 @@ class ScreenTimeService:
             db.session.commit()
             log_to_return = new_log
 
+        # New data can change streaks and averages on the global leaderboard
+        LeaderboardService.invalidate_global_leaderboard()
+
         # --- Challenge stats update logic ---
         # Wrapped in try-except to ensure screen time log succeeds even if challenge stats fail
         try:
@@ -230,6 +249,8 @@ class ScreenTimeService:
                     participant.today_passed = stats['today_passed']
             
             db.session.commit()
+            if active_challenges:
+                ChallengesService.invalidate_leaderboards(challenge_ids)
         except Exception as e:
             db.session.rollback()  # Only rolls back challenge stats changes
             logger.error(f"Error updating challenge stats for user {user_id}: {e}")
@@ -364,6 +385,7 @@ class ScreenTimeService:
             participant.today_passed = stats['today_passed']
             
             db.session.commit()
+            ChallengesService.invalidate_leaderboards([challenge_id])
             logger.info(f"Recalculated stats for challenge {challenge_id}, user {user_id}")
             
         except Exception as e:
@@ -432,21 +454,70 @@ class ScreenTimeService:
 
     # Statistical Analysis Methods
     @staticmethod
-    def get_baseline_average(user_id: int) -> Optional[float]:
+    def get_log_summary(user_id: int) -> Dict:
+        """Get the per-user log statistics used by badge checks in one query.
+
+        Averages are per log row, matching ``get_recent_week_average`` and
+        ``get_monthly_average``.
+
+        Args:
+            user_id (int): ID of the user
+
+        Returns:
+            dict: ``log_count``, ``first_date`` and ``min_minutes`` (None
+            without logs), ``recent_week_avg`` and ``monthly_avg`` (None
+            without logs in the last 7 / 30 days)
+        """
+        today = date.today()
+        minutes = ScreenTimeLog.screen_time_minutes
+
+        def _average_since(start: date):
+            return func.avg(
+                case((ScreenTimeLog.date.between(start, today), minutes))
+            )
+
+        row = db.session.execute(
+            select(
+                func.count(ScreenTimeLog.id),
+                func.min(ScreenTimeLog.date),
+                func.min(minutes),
+                _average_since(today - timedelta(days=6)),
+                _average_since(today - timedelta(days=29)),
+            ).where(ScreenTimeLog.user_id == user_id)
+        ).one()
+
+        log_count, first_date, min_minutes, recent_week_avg, monthly_avg = row
+
+        return {
+            "log_count": log_count,
+            "first_date": first_date,
+            "min_minutes": min_minutes,
+            "recent_week_avg": recent_week_avg,
+            "monthly_avg": monthly_avg,
+        }
+
+    @staticmethod
+    def get_baseline_average(
+        user_id: int, first_date: Optional[date] = None
+    ) -> Optional[float]:
         """Get user's baseline average (first week of data).
         
         Args:
             user_id (int): ID of the user
+            first_date (date, optional): Date of the user's first log, if
+                already known; skips looking it up
             
         Returns:
             float or None: Average screen time in minutes for the first week, or None if insufficient data
         """
         try:
-            first_log = ScreenTimeLog.query.filter_by(user_id=user_id).order_by(ScreenTimeLog.date).first()
-            if not first_log:
-                return None
-            
-            baseline_start = first_log.date
+            if first_date is None:
+                first_log = ScreenTimeLog.query.filter_by(user_id=user_id).order_by(ScreenTimeLog.date).first()
+                if not first_log:
+                    return None
+                first_date = first_log.date
+
+            baseline_start = first_date
             baseline_end = baseline_start + timedelta(days=6)
             
             result = db.session.query(func.avg(ScreenTimeLog.screen_time_minutes)).filter(
@@ -559,6 +630,28 @@ class ScreenTimeService:
             bool: True if user has a weekend where both days are under threshold
         """
         try:
+            dialect = db.session.get_bind().dialect.name
+            if dialect in _WEEKEND_SQL:
+                # Group the last 60 logs' weekend days by week in SQL and
+                # return the first week with two logs all under threshold
+                recent = select(
+                    ScreenTimeLog.date, ScreenTimeLog.screen_time_minutes
+                ).where(
+                    ScreenTimeLog.user_id == user_id
+                ).order_by(ScreenTimeLog.date.desc()).limit(60).subquery()
+                is_weekend, week_start = _WEEKEND_SQL[dialect](recent.c.date)
+                qualifying_week = db.session.execute(
+                    select(week_start)
+                    .where(is_weekend)
+                    .group_by(week_start)
+                    .having(and_(
+                        func.count() >= 2,
+                        func.max(recent.c.screen_time_minutes) < threshold_minutes,
+                    ))
+                    .limit(1)
+                ).first()
+                return qualifying_week is not None
+
             # Get recent weekend days (Saturday=5, Sunday=6)
             logs = ScreenTimeLog.query.filter(
                 ScreenTimeLog.user_id == user_id
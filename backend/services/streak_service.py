@@ -1,7 +1,7 @@
 """Service layer for streak calculation operations."""
 
 from datetime import date
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from ..models import Goal
 
@@ -36,7 +36,31 @@ class StreakService:
             goal_type="daily"
         ).first()
 
-        if not goal:
+        return StreakService.calculate_streak_for_target(
+            month_days, day_minutes, goal.target_minutes if goal else None
+        )
+
+    @staticmethod
+    def calculate_streak_for_target(
+        month_days: List[date],
+        day_minutes: Dict[date, int],
+        target_minutes: Optional[int]
+    ) -> int:
+        """Calculate the longest streak for an already-loaded daily goal.
+
+        Callers that have fetched goals for many users at once use this
+        instead of ``calculate_streak`` to avoid one goal query per user.
+
+        Args:
+            month_days: List of days in the month (in order).
+            day_minutes: Dict mapping day to total minutes logged.
+            target_minutes: Daily goal target in minutes, or None if the
+                user has no daily goal.
+
+        Returns:
+            Longest streak count for the month.
+        """
+        if target_minutes is None:
             # No goal set - streak is count of consecutive days with logs
             return StreakService._calculate_streak_without_goal(
                 month_days, day_minutes
@@ -44,7 +68,7 @@ class StreakService:
 
         # With goal: count consecutive days meeting goal
         return StreakService._calculate_streak_with_goal(
-            month_days, day_minutes, goal.target_minutes
+            month_days, day_minutes, target_minutes
         )
 
     @staticmethod
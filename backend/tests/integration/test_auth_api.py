@@ -7,6 +7,9 @@ import unittest
 import json
 from unittest.mock import patch, MagicMock
 
+from flask import g
+from sqlalchemy import event, text
+
 from backend import create_app
 from backend.database import db
 from backend.models import User
@@ -77,6 +80,28 @@ class AuthAPIIntegrationTestCase(unittest.TestCase):
         self.assertEqual(response_data["user"]["email"], self.test_user_data["email"])
         self.assertNotIn("password", response_data["user"])
 
+    def test_register_does_not_reload_new_user(self):
+        """Test that registration skips the post-commit refresh SELECT.
+
+        Returns:
+            None
+        """
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            response = self.client.post("/api/auth/register", json=self.test_user_data)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()["user"]["streak_count"], 0)
+        self.assertEqual(len(statements), 2)  # uniqueness check + INSERT
+        self.assertTrue(statements[-1].startswith("INSERT INTO users"))
+
     def test_register_invalid_content_type(self):
         """Test registration with invalid content type.
 
@@ -93,6 +118,38 @@ class AuthAPIIntegrationTestCase(unittest.TestCase):
         response_data = json.loads(response.data)
         self.assertEqual(response_data["error"], "Content-Type must be application/json")
 
+    def test_register_and_login_reject_non_object_bodies(self):
+        """Test that JSON arrays are treated as missing fields.
+
+        Returns:
+            None
+        """
+        response = self.client.post("/api/auth/register", json=["testuser"])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Missing required fields")
+
+        response = self.client.post("/api/auth/login", json=["existing"])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()["error"], "Username/email and password are required"
+        )
+
+    def test_login_malformed_json(self):
+        """Test login with a JSON content type but an unparsable body.
+
+        Returns:
+            None
+        """
+        response = self.client.post(
+            "/api/auth/login",
+            data="{not json",
+            content_type="application/json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        response_data = json.loads(response.data)
+        self.assertEqual(response_data["error"], "Invalid JSON")
+
     def test_register_missing_fields(self):
         """Test registration with missing required fields.
 
@@ -302,6 +359,47 @@ class AuthAPIIntegrationTestCase(unittest.TestCase):
         response_data = json.loads(response.data)
         self.assertEqual(response_data["error"], "Not authenticated")
 
+    def test_auth_status_anonymous_and_logged_in(self):
+        """Test the login-state endpoint before and after logging in.
+
+        Returns:
+            None
+        """
+        response = self.client.get("/api/auth/status")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Cache-Control"], "no-store, no-cache, must-revalidate")
+        self.assertEqual(json.loads(response.data), {"authenticated": False})
+
+        self.client.post(
+            "/api/auth/login",
+            json={"username": "existing", "password": "existingpassword"},
+        )
+        response_data = json.loads(self.client.get("/api/auth/status").data)
+        self.assertTrue(response_data["authenticated"])
+        self.assertEqual(response_data["user"]["username"], "existing")
+
+    def test_auth_status_reports_deleted_user_signed_out(self):
+        """Test that a deleted user's session is not reported as signed in.
+
+        Returns:
+            None
+        """
+        self.client.post(
+            "/api/auth/login",
+            json={"username": "existing", "password": "existingpassword"},
+        )
+        self.assertTrue(json.loads(self.client.get("/api/auth/status").data)["authenticated"])
+
+        db.session.execute(text("DELETE FROM users WHERE username = 'existing'"))
+        db.session.commit()
+        # The test app context outlives requests; drop the user it cached
+        db.session.expunge_all()
+        g.pop("_login_user", None)
+        g.pop("_session_user", None)
+        response_data = json.loads(self.client.get("/api/auth/status").data)
+        self.assertEqual(response_data, {"authenticated": False})
+
     @patch('backend.services.email_service.send_password_reset_email')
     def test_forgot_password_success(self, mock_send_email):
         """Test successful password reset request.
@@ -598,5 +598,245 @@ class BadgeChallengeIntegrationTestCase(unittest.TestCase):
         self.assertFalse(self._has_badge(self.user3.id, "Community Champion"))
 
 
+    def test_expired_challenges_complete_in_one_commit(self):
+        """Test that listing challenges completes every expired one together."""
+        from unittest.mock import patch
+
+        yesterday = date.today() - timedelta(days=1)
+        week_ago = yesterday - timedelta(days=6)
+        challenge_ids = []
+        for i, (alice_total, bob_total) in enumerate([(200, 300), (300, 200), (250, 250)]):
+            challenge = Challenge(
+                name=f"Expired {i}",
+                owner_id=self.user1.id,
+                target_app="YouTube",
+                target_minutes=60,
+                start_date=week_ago,
+                end_date=yesterday,
+                status="active",
+            )
+            db.session.add(challenge)
+            db.session.flush()
+            db.session.add_all([
+                ChallengeParticipant(
+                    challenge_id=challenge.challenge_id, user_id=self.user1.id,
+                    invitation_status='accepted', days_logged=5,
+                    total_screen_time_minutes=alice_total,
+                ),
+                ChallengeParticipant(
+                    challenge_id=challenge.challenge_id, user_id=self.user2.id,
+                    invitation_status='accepted', days_logged=5,
+                    total_screen_time_minutes=bob_total,
+                ),
+                ChallengeParticipant(
+                    challenge_id=challenge.challenge_id, user_id=self.user3.id,
+                    invitation_status='pending',
+                ),
+            ])
+            challenge_ids.append(challenge.challenge_id)
+        db.session.commit()
+        user_ids = (self.user1.id, self.user2.id, self.user3.id)
+
+        with patch.object(
+            db.session, "commit", wraps=db.session.commit
+        ) as mock_commit, patch.object(
+            ChallengesService, "_award_winner_badges"
+        ) as mock_award:
+            ChallengesService.get_user_challenges(user_ids[0])
+
+        mock_commit.assert_called_once()
+        self.assertEqual(
+            mock_award.call_args.args[0],
+            [user_ids[0], user_ids[1], user_ids[0], user_ids[1]],
+        )
+        for challenge_id, expected_ranks in zip(
+            challenge_ids, [(1, 2, None), (2, 1, None), (1, 1, None)]
+        ):
+            self.assertEqual(db.session.get(Challenge, challenge_id).status, "completed")
+            ranks = {
+                p.user_id: p.final_rank
+                for p in ChallengeParticipant.query.filter_by(challenge_id=challenge_id)
+            }
+            self.assertEqual(tuple(ranks[uid] for uid in user_ids), expected_ranks)
+
+    def test_completion_ranks_with_set_based_updates(self):
+        """Test that ranking issues the same statements for any participant count."""
+        from sqlalchemy import event
+
+        yesterday = date.today() - timedelta(days=1)
+        challenge = Challenge(
+            name="Crowded",
+            owner_id=self.user1.id,
+            target_app="YouTube",
+            target_minutes=60,
+            start_date=yesterday - timedelta(days=6),
+            end_date=yesterday,
+            status="active",
+        )
+        db.session.add(challenge)
+        db.session.flush()
+        totals = {self.user1.id: 300, self.user2.id: 100, self.user3.id: 100, self.user4.id: 0}
+        db.session.add_all([
+            ChallengeParticipant(
+                challenge_id=challenge.challenge_id, user_id=user_id,
+                invitation_status='accepted', days_logged=5 if total else 0,
+                total_screen_time_minutes=total,
+            )
+            for user_id, total in totals.items()
+        ])
+        db.session.commit()
+        challenge_id = challenge.challenge_id
+
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            completed_ids, winner_ids = ChallengesService._complete_challenges(
+                [challenge_id]
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+        db.session.commit()
+
+        self.assertEqual(
+            [s.split()[0] for s in statements], ["UPDATE", "UPDATE", "SELECT"]
+        )
+        self.assertEqual(completed_ids, [challenge_id])
+        self.assertEqual(winner_ids, [self.user4.id])
+        ranks = {
+            p.user_id: p.final_rank
+            for p in ChallengeParticipant.query.filter_by(challenge_id=challenge_id)
+        }
+        self.assertEqual(ranks, {
+            self.user4.id: 1, self.user2.id: 2, self.user3.id: 2, self.user1.id: 4,
+        })
+
+    def test_completion_emails_accepted_participants(self):
+        """Test that completing a challenge emails each accepted participant once."""
+        from unittest.mock import patch
+
+        yesterday = date.today() - timedelta(days=1)
+        challenge = Challenge(
+            name="Mailed",
+            owner_id=self.user1.id,
+            target_app="YouTube",
+            target_minutes=60,
+            start_date=yesterday - timedelta(days=6),
+            end_date=yesterday,
+            status="active",
+        )
+        db.session.add(challenge)
+        db.session.flush()
+        for user, status, total in [
+            (self.user1, 'accepted', 100),
+            (self.user2, 'accepted', 200),
+            (self.user3, 'pending', 0),
+        ]:
+            db.session.add(ChallengeParticipant(
+                challenge_id=challenge.challenge_id, user_id=user.id,
+                invitation_status=status, days_logged=5 if total else 0,
+                total_screen_time_minutes=total,
+            ))
+        db.session.commit()
+
+        with patch(
+            "backend.services.challenges_service.send_challenge_completed_notification"
+        ) as mock_send:
+            ChallengesService.check_and_complete_challenge(challenge)
+
+        self.assertEqual(
+            sorted(call.args for call in mock_send.call_args_list),
+            [
+                ("alice@test.com", "alice", "Mailed", 1, True),
+                ("bob@test.com", "bob", "Mailed", 2, False),
+            ],
+        )
+
+    def test_completion_race_notifies_once(self):
+        """Test that a challenge completed concurrently is not ranked or emailed again."""
+        from unittest.mock import patch
+        from sqlalchemy import text
+
+        yesterday = date.today() - timedelta(days=1)
+        challenge = Challenge(
+            name="Raced",
+            owner_id=self.user1.id,
+            target_app="YouTube",
+            target_minutes=60,
+            start_date=yesterday - timedelta(days=6),
+            end_date=yesterday,
+            status="active",
+        )
+        db.session.add(challenge)
+        db.session.flush()
+        db.session.add(ChallengeParticipant(
+            challenge_id=challenge.challenge_id, user_id=self.user1.id,
+            invitation_status='accepted', days_logged=5,
+            total_screen_time_minutes=100,
+        ))
+        db.session.commit()
+        challenge_id = challenge.challenge_id
+
+        # Another worker closes the challenge after this one loaded it as active
+        challenge = db.session.get(Challenge, challenge_id)
+        self.assertEqual(challenge.status, "active")
+        db.session.execute(
+            text("UPDATE challenges SET status = 'completed' WHERE challenge_id = :id"),
+            {"id": challenge_id},
+        )
+
+        with patch(
+            "backend.services.challenges_service.send_challenge_completed_notification"
+        ) as mock_send, patch.object(
+            ChallengesService, "_award_winner_badges"
+        ) as mock_award:
+            ChallengesService.check_and_complete_challenge(challenge)
+            self.assertEqual(
+                ChallengesService._complete_challenges([challenge_id]), ([], [])
+            )
+
+        mock_send.assert_not_called()
+        mock_award.assert_not_called()
+        participant = ChallengeParticipant.query.filter_by(
+            challenge_id=challenge_id
+        ).one()
+        self.assertIsNone(participant.final_rank)
+
+    def test_scheduled_completion_covers_all_users(self):
+        """Test that the CLI job completes challenges reads no longer touch."""
+        yesterday = date.today() - timedelta(days=1)
+        challenge = Challenge(
+            name="Nightly",
+            owner_id=self.user2.id,
+            target_app="YouTube",
+            target_minutes=60,
+            start_date=yesterday - timedelta(days=6),
+            end_date=yesterday,
+            status="active",
+        )
+        db.session.add(challenge)
+        db.session.flush()
+        db.session.add(ChallengeParticipant(
+            challenge_id=challenge.challenge_id, user_id=self.user2.id,
+            invitation_status='accepted', days_logged=5,
+            total_screen_time_minutes=200,
+        ))
+        db.session.commit()
+        challenge_id = challenge.challenge_id
+
+        self.app.config["COMPLETE_CHALLENGES_ON_READ"] = False
+        ChallengesService.get_user_challenges(self.user2.id)
+        self.assertEqual(db.session.get(Challenge, challenge_id).status, "active")
+
+        result = self.app.test_cli_runner().invoke(args=["complete-challenges"])
+        self.assertIn("Completed 1 challenges.", result.output)
+        db.session.expire_all()
+        self.assertEqual(db.session.get(Challenge, challenge_id).status, "completed")
+        self.assertEqual(ChallengesService.complete_expired_challenges(), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
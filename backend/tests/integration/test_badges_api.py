@@ -50,6 +50,53 @@ class BadgesAPITestCase(unittest.TestCase):
         data = resp.get_json()
         self.assertIsInstance(data, list)
 
+    def test_get_all_badges_cached_until_initialize(self):
+        from backend.models import Badge
+        from backend.services import BadgeService
+
+        from unittest.mock import patch
+        from backend import cache
+
+        self.app.config["BADGE_CATALOG_CACHE_TIMEOUT"] = 45
+        with patch.object(cache, "set", wraps=cache.set) as mock_set:
+            first = self.client.get("/api/badges").get_json()
+        self.assertEqual(mock_set.call_args.kwargs["timeout"], 45)
+
+        # Rows added behind the cache are not visible until invalidation
+        db.session.add(Badge(name="Cache Probe", description="probe", badge_type="streak"))
+        db.session.commit()
+        self.assertEqual(self.client.get("/api/badges").get_json(), first)
+
+        BadgeService.initialize_badges()
+        names = [b["name"] for b in self.client.get("/api/badges").get_json()]
+        self.assertIn("Cache Probe", names)
+
+    def test_get_all_badges_not_modified(self):
+        first = self.client.get("/api/badges")
+        etag = first.headers.get("ETag")
+        self.assertIsNotNone(etag)
+
+        resp = self.client.get("/api/badges", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.data, b"")
+
+    def test_get_user_badges_not_modified(self):
+        user = self._get_current_user()
+        url = f"/api/users/{user.id}/badges"
+        first = self.client.get(url)
+        etag = first.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        self.assertEqual(first.headers.get("Cache-Control"), "private, no-cache")
+
+        resp = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+
+        # A newly awarded badge changes the body and therefore the ETag
+        self.client.post(url, json={"badge_name": "Fresh Start"})
+        resp = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers.get("ETag"), etag)
+
     def test_initialize_requires_admin(self):
         # Normal user should be forbidden
         resp = self.client.post("/api/badges/initialize")
@@ -76,6 +123,7 @@ class BadgesAPITestCase(unittest.TestCase):
         # Attempt to get other user's badges should be forbidden
         resp = self.client.get(f"/api/users/{other.id}/badges")
         self.assertEqual(resp.status_code, 403)
+        self.assertEqual(resp.get_json(), {"error": "Access denied"})
 
     def test_award_badge_to_self(self):
         # Initialize badges as admin
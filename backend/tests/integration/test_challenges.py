@@ -3,9 +3,12 @@
 import unittest
 from datetime import date, timedelta
 
-from backend import create_app
+from sqlalchemy import event, text
+
+from backend import create_app, init_db
 from backend.database import db
 from backend.models import Challenge, ChallengeParticipant, User
+from backend.services.challenges_service import ChallengesService, ValidationError
 
 
 class ChallengesAPITestCase(unittest.TestCase):
@@ -101,6 +104,37 @@ class ChallengesAPITestCase(unittest.TestCase):
         participants = ChallengeParticipant.query.filter_by(challenge_id=challenge_id).all()
         self.assertEqual(len(participants), 3)
 
+    def test_create_challenge_inserts_participants_together(self):
+        """Test that the owner and invitees are added by one INSERT."""
+        today = date.today()
+        owner_id, invited = self.user1.id, [self.user2.id, self.user3.id, self.user2.id]
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            challenge = ChallengesService.create_challenge(
+                "Batch", None, owner_id, "TikTok", 30,
+                today + timedelta(days=1), today + timedelta(days=7),
+                "upcoming", invited,
+            )
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        participant_inserts = [
+            s for s in statements if s.startswith("INSERT INTO challenge_participants")
+        ]
+        self.assertEqual(len(participant_inserts), 1)
+        statuses = {
+            p.user_id: p.invitation_status
+            for p in ChallengeParticipant.query.filter_by(challenge_id=challenge.challenge_id)
+        }
+        self.assertEqual(statuses, {
+            owner_id: "accepted", invited[0]: "pending", invited[1]: "pending",
+        })
+
     def test_create_challenge_starts_today(self):
         """Test that a challenge starting today gets 'active' status."""
         today = date.today()
@@ -220,6 +254,28 @@ class ChallengesAPITestCase(unittest.TestCase):
             self.assertIn("user_stats", challenge)
             self.assertEqual(challenge["user_stats"]["user_id"], self.user1.id)
 
+    def test_get_challenges_matches_model_serialization(self):
+        """Test that projected challenge rows match the models' to_dict output."""
+        today = date.today()
+        payload = {
+            "name": "Projection Check",
+            "description": "Compared against to_dict",
+            "target_app": "TikTok",
+            "target_minutes": 30,
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=3)).isoformat(),
+        }
+        self.client.post("/api/challenges", json=payload)
+
+        response = self.client.get("/api/challenges")
+        self.assertEqual(response.status_code, 200)
+        [challenge_data] = response.get_json()["challenges"]
+
+        participation = ChallengeParticipant.query.filter_by(user_id=self.user1.id).one()
+        expected = participation.challenge.to_dict()
+        expected["user_stats"] = participation.to_dict()
+        self.assertEqual(challenge_data, expected)
+
     def test_get_challenges_excludes_deleted(self):
         """Test that deleted challenges are not returned."""
         today = date.today()
@@ -355,6 +411,38 @@ class ChallengesAPITestCase(unittest.TestCase):
             data["leaderboard"][1]["average_daily_minutes"]
         )
 
+    def test_get_leaderboard_pagination(self):
+        """Test that limit/offset return one ordered page with the total count."""
+        today = date.today()
+        payload = {
+            "name": "Paged",
+            "target_app": "TikTok",
+            "target_minutes": 60,
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=6)).isoformat(),
+            "invited_user_ids": [self.user2.id, self.user3.id],
+        }
+        response = self.client.post("/api/challenges", json=payload)
+        challenge_id = response.get_json()["challenge"]["challenge_id"]
+        url = f"/api/challenges/{challenge_id}/leaderboard"
+        self.client.post("/api/screen-time/", json={
+            "app_name": "TikTok", "hours": 1, "minutes": 0,
+        })
+        full = self.client.get(url).get_json()["leaderboard"]
+        self.assertNotIn("total_count", self.client.get(url).get_json())
+
+        # The caller (slowest, so last) is still allowed to read page one
+        page = self.client.get(f"{url}?limit=2").get_json()
+        self.assertEqual(page["total_count"], 3)
+        self.assertEqual(page["leaderboard"], full[:2])
+
+        page = self.client.get(f"{url}?limit=2&offset=2").get_json()
+        self.assertEqual(page["leaderboard"], full[2:])
+        self.assertEqual(full[2]["user_id"], self.user1.id)
+
+        response = self.client.get(f"{url}?limit=abc")
+        self.assertEqual(response.status_code, 400)
+
     def test_get_leaderboard_non_participant_forbidden(self):
         """Test that non-participants cannot view leaderboard."""
         today = date.today()
@@ -376,6 +464,77 @@ class ChallengesAPITestCase(unittest.TestCase):
         response = self._get_client_for_user(2).get(f"/api/challenges/{challenge_id}/leaderboard")
         self.assertEqual(response.status_code, 403)
 
+    def test_leaderboard_cached_until_stats_change(self):
+        """Test that repeat polls reuse the body until a log or invite changes it."""
+        today = date.today()
+        payload = {
+            "name": "Polled",
+            "target_app": "TikTok",
+            "target_minutes": 60,
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=6)).isoformat(),
+            "invited_user_ids": [self.user2.id],
+        }
+        response = self.client.post("/api/challenges", json=payload)
+        challenge_id = response.get_json()["challenge"]["challenge_id"]
+        url = f"/api/challenges/{challenge_id}/leaderboard"
+
+        first = self.client.get(url)
+        db.session.expire_all()
+        cold = self._count_queries(lambda: self.client.get(url))
+        self.client.get(url)
+        warm = self._count_queries(lambda: self.client.get(url))
+        self.assertLess(warm, cold)
+        self.assertEqual(self.client.get(url).data, first.data)
+
+        # A new log drops the cached body
+        self.client.post("/api/screen-time/", json={
+            "app_name": "TikTok", "hours": 0, "minutes": 45,
+        })
+        rows = {r["user_id"]: r for r in self.client.get(url).get_json()["leaderboard"]}
+        self.assertEqual(rows[self.user1.id]["total_screen_time_minutes"], 45)
+
+        # Cached bodies are never served to non-participants
+        response = self._get_client_for_user(3).get(url)
+        self.assertEqual(response.status_code, 403)
+
+    def test_cached_leaderboard_membership_check(self):
+        """Test that warm polls run one membership query and see every leave."""
+        today = date.today()
+        payload = {
+            "name": "Members",
+            "target_app": "TikTok",
+            "target_minutes": 60,
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=6)).isoformat(),
+            "invited_user_ids": [self.user2.id],
+        }
+        response = self.client.post("/api/challenges", json=payload)
+        challenge_id = response.get_json()["challenge"]["challenge_id"]
+        user2_id = self.user2.id
+
+        body = ChallengesService.get_leaderboard_payload(challenge_id, user2_id)
+        ChallengesService.get_leaderboard_payload(challenge_id, user2_id)
+        warm = self._count_queries(
+            lambda: ChallengesService.get_leaderboard_payload(challenge_id, user2_id)
+        )
+        self.assertEqual(warm, 1)
+        self.assertEqual(
+            ChallengesService.get_leaderboard_payload(challenge_id, user2_id), body
+        )
+
+        # A leave handled by another worker leaves this process's set stale
+        db.session.execute(
+            text(
+                "DELETE FROM challenge_participants"
+                " WHERE challenge_id = :challenge_id AND user_id = :user_id"
+            ),
+            {"challenge_id": challenge_id, "user_id": user2_id},
+        )
+        db.session.commit()
+        with self.assertRaises(ValidationError):
+            ChallengesService.get_leaderboard_payload(challenge_id, user2_id)
+
     # --- Invite Tests ---
 
     def test_invite_to_challenge_success(self):
@@ -497,6 +656,55 @@ class ChallengesAPITestCase(unittest.TestCase):
         data = response.get_json()
         self.assertEqual(data["invited_count"], 1)  # Only user3 invited
 
+    def test_invite_unknown_and_repeated_ids(self):
+        """Test that unknown ids are rejected and repeated ids invite once."""
+        today = date.today()
+        start = today + timedelta(days=1)
+        payload = {
+            "name": "Batch Invite Test",
+            "target_app": "TikTok",
+            "target_minutes": 30,
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=6)).isoformat(),
+        }
+        response = self.client.post("/api/challenges", json=payload)
+        challenge_id = response.get_json()["challenge"]["challenge_id"]
+        url = f"/api/challenges/{challenge_id}/invite"
+
+        response = self.client.post(url, json={"user_ids": [self.user2.id, 9999]})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("[9999]", response.get_json()["error"])
+
+        response = self.client.post(
+            url, json={"user_ids": [self.user2.id, self.user2.id, self.user3.id]}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["invited_count"], 2)
+        self.assertEqual(
+            ChallengeParticipant.query.filter_by(challenge_id=challenge_id).count(), 3
+        )
+
+        # Existing members are skipped by the unique key, not a prior SELECT
+        user_ids = [self.user1.id, self.user2.id]
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            added = ChallengesService._add_pending_participants(challenge_id, user_ids)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+        self.assertEqual(added, 0)
+        self.assertEqual(len(statements), 1)
+        self.assertIn("ON CONFLICT", statements[0])
+        participant = ChallengeParticipant.query.filter_by(
+            challenge_id=challenge_id, user_id=self.user3.id
+        ).one()
+        self.assertEqual(participant.invitation_status, "pending")
+        self.assertIsNotNone(participant.joined_at)
+
     # --- Leave Challenge Tests ---
 
     def test_leave_challenge_success(self):
@@ -521,6 +729,22 @@ class ChallengesAPITestCase(unittest.TestCase):
         response = self._get_client_for_user(2).post(f"/api/challenges/{challenge_id}/leave")
         self.assertEqual(response.status_code, 200)
 
+        # Leaving reads only the owner id and deletes without loading the row
+        user3_id = self.user3.id
+        db.session.add(ChallengeParticipant(challenge_id=challenge_id, user_id=user3_id))
+        db.session.commit()
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement.split()[0])
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            ChallengesService.leave_challenge(challenge_id, user3_id)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+        self.assertEqual(statements, ["SELECT", "DELETE"])
+
         # Verify user2 is no longer a participant
         participation = ChallengeParticipant.query.filter_by(
             challenge_id=challenge_id,
@@ -1057,6 +1281,14 @@ class ChallengesAPITestCase(unittest.TestCase):
         participants = ChallengeParticipant.query.filter_by(challenge_id=challenge_id).all()
         self.assertEqual(len(participants), 3)  # Owner + 2 invited
 
+        # Existing members and repeated ids are skipped
+        update_payload = {"invited_user_ids": [self.user2.id, self.user3.id, self.user3.id]}
+        response = self.client.patch(f"/api/challenges/{challenge_id}", json=update_payload)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            ChallengeParticipant.query.filter_by(challenge_id=challenge_id).count(), 3
+        )
+
     def test_update_challenge_owner_only(self):
         """Test that only the owner can update a challenge."""
         today = date.today()
@@ -1161,6 +1393,141 @@ class ChallengesAPITestCase(unittest.TestCase):
         self.assertEqual(len(data["invitations"]), 1)
         self.assertEqual(data["invitations"][0]["owner_username"], "alice")
 
+        # Invitations to deleted challenges are filtered out by the query
+        challenge = db.session.get(Challenge, data["invitations"][0]["challenge_id"])
+        challenge.status = "deleted"
+        db.session.commit()
+        invitations = ChallengesService.get_pending_invitations(self.user2.id)
+        self.assertEqual(invitations, [])
+
+    def _count_queries(self, func):
+        """Run ``func`` and return how many SQL statements it executed."""
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            func()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+        return len(statements)
+
+    def test_user_participations_use_index(self):
+        """Test that a user's accepted challenges are found without a table scan."""
+        plan = " ".join(str(row[-1]) for row in db.session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT challenge_id FROM challenge_participants "
+                "WHERE user_id = :u AND invitation_status = 'accepted'"
+            ),
+            {"u": self.user1.id},
+        ).all())
+
+        self.assertIn("ix_challenge_participants_user_status", plan)
+
+    def test_init_db_adds_participant_index_to_existing_table(self):
+        """Test that init_db upgrades databases created before the index."""
+        db.session.execute(text("DROP INDEX ix_challenge_participants_user_status"))
+        db.session.commit()
+
+        init_db()
+
+        names = {
+            row[0] for row in db.session.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' "
+                "AND tbl_name = 'challenge_participants'"
+            ))
+        }
+        self.assertIn("ix_challenge_participants_user_status", names)
+
+    def test_leaderboard_ordered_by_average_in_sql(self):
+        """Test that active leaderboards order by average, no logs counting as 0."""
+        today = date.today()
+        challenge = Challenge(
+            name="Ordered", owner_id=self.user1.id, target_app="TikTok",
+            target_minutes=60, start_date=today, end_date=today, status="active",
+        )
+        db.session.add(challenge)
+        db.session.flush()
+        for user, total, days in [
+            (self.user1, 100, 2), (self.user2, 90, 3), (self.user3, 0, 0),
+        ]:
+            db.session.add(ChallengeParticipant(
+                challenge_id=challenge.challenge_id, user_id=user.id,
+                invitation_status="accepted",
+                total_screen_time_minutes=total, days_logged=days,
+            ))
+        db.session.commit()
+
+        _, leaderboard = ChallengesService.get_leaderboard(
+            challenge.challenge_id, self.user1.id
+        )
+        self.assertEqual(
+            [(row["user_id"], row["average_daily_minutes"]) for row in leaderboard],
+            [(self.user3.id, 0.0), (self.user2.id, 30.0), (self.user1.id, 50.0)],
+        )
+
+    def test_list_endpoints_query_count_independent_of_size(self):
+        """Test that challenge lists eager load instead of querying per row."""
+        today = date.today()
+        start = today + timedelta(days=1)
+        end = start + timedelta(days=6)
+        client2 = self._get_client_for_user(2)
+
+        def create_challenges(count):
+            for i in range(count):
+                self.client.post("/api/challenges", json={
+                    "name": f"Challenge {i}",
+                    "target_app": "Instagram",
+                    "target_minutes": 30,
+                    "start_date": start.isoformat(),
+                    "end_date": end.isoformat(),
+                    "invited_user_ids": [self.user2.id],
+                })
+            db.session.expire_all()
+
+        create_challenges(1)
+        one_invite = self._count_queries(lambda: client2.get("/api/challenges/invitations"))
+        one_owned = self._count_queries(lambda: self.client.get("/api/challenges"))
+
+        create_challenges(4)
+        many_invites = self._count_queries(lambda: client2.get("/api/challenges/invitations"))
+        many_owned = self._count_queries(lambda: self.client.get("/api/challenges"))
+
+        self.assertEqual(one_invite, many_invites)
+        self.assertEqual(one_owned, many_owned)
+
+    def test_leaderboard_query_count_independent_of_participants(self):
+        """Test that the leaderboard loads participants and users together."""
+        today = date.today()
+        payload = {
+            "name": "Crowded",
+            "target_app": "TikTok",
+            "target_minutes": 60,
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=6)).isoformat(),
+            "invited_user_ids": [self.user2.id],
+        }
+        response = self.client.post("/api/challenges", json=payload)
+        challenge_id = response.get_json()["challenge"]["challenge_id"]
+        url = f"/api/challenges/{challenge_id}/leaderboard"
+        db.session.expire_all()
+
+        two_participants = self._count_queries(lambda: self.client.get(url))
+
+        self.client.post(
+            f"/api/challenges/{challenge_id}/invite",
+            json={"user_ids": [self.user3.id]},
+        )
+        db.session.expire_all()
+        three_participants = self._count_queries(lambda: self.client.get(url))
+
+        self.assertEqual(
+            len(self.client.get(url).get_json()["leaderboard"]), 3
+        )
+        self.assertEqual(two_participants, three_participants)
+
     def test_accept_invitation_with_stats_recalculation(self):
         """Test that accepting an invitation triggers stats recalculation.
         
@@ -4,6 +4,7 @@ import logging
 import unittest
 from unittest.mock import patch
 from flask import Flask
+from flask_mail import Message
 from werkzeug.security import generate_password_hash
 
 from backend import create_app
@@ -11,6 +12,7 @@ from backend.database import db
 from backend.models import User, Friendship
 from backend.services.badge_service import BadgeService
 from backend.services.badge_achievement_service import BadgeAchievementService
+from backend.services.email_service import _deliver
 from backend.services.friendship_service import FriendshipService
 
 # Disable logging output during tests
@@ -24,6 +26,7 @@ class TestEmailIntegration(unittest.TestCase):
         """Set up test fixtures."""
         self.app = create_app()
         self.app.config['TESTING'] = True
+        self.app.config['MAIL_SEND_ASYNC'] = False
         self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
         self.client = self.app.test_client()
         
@@ -206,6 +209,21 @@ class TestEmailIntegration(unittest.TestCase):
             # Verify multiple emails sent (one per badge)
             self.assertEqual(mock_mail.send.call_count, len(awarded_badges))
 
+    @patch('backend.mail')
+    def test_async_delivery_runs_off_the_request(self, mock_mail):
+        """Test that async mode hands sends to a worker and logs failures."""
+        mock_mail.send.side_effect = Exception("SMTP Error")
+        self.app.config['MAIL_SEND_ASYNC'] = True
+
+        with self.app.test_request_context():
+            msg = Message(subject="Hi", recipients=["user1@example.com"],
+                          sender="test@example.com")
+            future = _deliver(msg)
+
+        # The worker swallows and logs the SMTP error
+        self.assertIsNone(future.result(timeout=5))
+        mock_mail.send.assert_called_once_with(msg)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -183,6 +183,21 @@ class FriendshipAPITestCase(unittest.TestCase):
         self.assertEqual(len(data["outgoing"]), 0)
         self.assertEqual(len(data["friends"]), 0)
 
+    def test_unknown_request_action_not_found(self):
+        """Ensure actions outside accept/reject/cancel are not routed.
+
+        Returns:
+            None
+        """
+        send_resp = self.client.post(
+            "/api/friendships/request",
+            json={"username": self.user2["username"]},
+        )
+        friendship_id = send_resp.get_json()["friendship"]["id"]
+
+        response = self.client.post(f"/api/friendships/{friendship_id}/block")
+        self.assertEqual(response.status_code, 404)
+
     def test_cannot_friend_self(self):
         """Ensure self-friending is rejected with 400.
 
@@ -296,6 +296,7 @@ class TestGlobalLeaderboardEndpoint(LeaderboardAPITestCase):
         response = self.client.options("/api/leaderboard/global")
 
         self.assertEqual(response.status_code, 200)
+        self.assertIn("GET", response.headers.get("Allow", ""))
 
     def test_response_contains_required_fields(self):
         """Verify that response contains all required fields for each user.
@@ -429,5 +430,41 @@ class TestLeaderboardEdgeCases(LeaderboardAPITestCase):
         self.assertEqual(entry["streak"], 1)
 
 
+class TestGlobalLeaderboardCache(LeaderboardAPITestCase):
+    """Tests for caching of rendered global leaderboard bodies."""
+
+    def test_cached_until_new_screen_time_entry(self):
+        """Verify cached bodies are reused and dropped after a new entry.
+
+        Returns:
+            None
+        """
+        user = self._create_user("alice", "alice@test.com")
+        self._add_screen_time(user.id, date.today(), 120)
+
+        first = self.client.get("/api/leaderboard/global").get_json()
+        self.assertEqual(len(first["leaderboard"]), 1)
+
+        # Written directly, so the cached body is still served
+        bob = self._create_user("bob", "bob@test.com")
+        self._add_screen_time(bob.id, date.today(), 60)
+        cached = self.client.get("/api/leaderboard/global").get_json()
+        self.assertEqual(cached, first)
+
+        # Logging through the service invalidates the cache
+        self.client.post("/api/auth/register", json={
+            "username": "carol",
+            "email": "carol@test.com",
+            "password": "password123",
+        })
+        self.client.post("/api/screen-time/", json={
+            "app_name": "Total",
+            "hours": 1,
+            "minutes": 0,
+        })
+        fresh = self.client.get("/api/leaderboard/global").get_json()
+        self.assertEqual(len(fresh["leaderboard"]), 3)
+
+
 if __name__ == "__main__":
     unittest.main()
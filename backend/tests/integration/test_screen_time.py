@@ -1,7 +1,9 @@
 import unittest
 from datetime import date
 
-from backend import create_app
+from sqlalchemy import inspect, text
+
+from backend import create_app, init_db
 from backend.database import db
 
 
@@ -128,6 +130,28 @@ class ScreenTimeAPITestCase(unittest.TestCase):
         body = response.get_json()
         self.assertIn("App name must be one of", body["error"])
 
+    def test_unparsable_bodies_are_rejected(self):
+        """Bad JSON and non-JSON bodies should yield client errors, not 500s.
+
+        Returns:
+            None
+        """
+
+        response = self.client.post(
+            "/api/screen-time/", data="{oops", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Invalid JSON")
+
+        response = self.client.post(
+            "/api/screen-time/", data="minutes=5", content_type="text/plain"
+        )
+        self.assertEqual(response.status_code, 415)
+
+        response = self.client.post("/api/screen-time/")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Request body is required.")
+
     def test_allowed_apps_endpoint_lists_dropdown_values(self):
         """The apps endpoint should return the canonical dropdown options.
 
@@ -141,6 +165,41 @@ class ScreenTimeAPITestCase(unittest.TestCase):
         self.assertIn("Total", apps)
         self.assertIn("YouTube", apps)
 
+    def test_allowed_apps_endpoint_supports_revalidation(self):
+        """The apps list should be cacheable and answer If-None-Match with 304.
+
+        Returns:
+            None
+        """
+
+        first = self.client.get("/api/screen-time/apps")
+        etag = first.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        self.assertIn("max-age=3600", first.headers.get("Cache-Control"))
+
+        response = self.client.get(
+            "/api/screen-time/apps", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+
+
+    def test_init_db_adds_missing_indexes(self):
+        """Ensure init_db creates indexes missing from existing tables.
+
+        Returns:
+            None
+        """
+
+        db.session.execute(text("DROP INDEX ix_screen_time_logs_user_date"))
+        db.session.commit()
+
+        init_db()
+        init_db()
+
+        names = {ix["name"] for ix in inspect(db.engine).get_indexes("screen_time_logs")}
+        self.assertIn("ix_screen_time_logs_user_date", names)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 from backend import create_app
 from backend.database import db
 from backend.models import User
+from sqlalchemy import event
 from backend.services import AuthService
 
 
@@ -136,6 +137,34 @@ class TestRegistrationValidation(AuthServiceTestCase):
         self.assertFalse(is_valid)
         self.assertEqual(error, "Password is required")
 
+    def test_overlong_password_fails(self):
+        """Verify that passwords over the maximum length fail validation.
+
+        Returns:
+            None
+        """
+        is_valid, error = AuthService.validate_registration_data(
+            "testuser", "test@example.com", "x" * 1025
+        )
+
+        self.assertFalse(is_valid)
+        self.assertEqual(error, "Password must be at most 1024 characters")
+
+    def test_malformed_email_fails(self):
+        """Verify that emails without a dotted domain or with spaces fail.
+
+        Returns:
+            None
+        """
+        for email in ("a@b", "a.b@c", "a b@example.com", "a@@example.com", "a@example."):
+            with self.subTest(email=email):
+                is_valid, error = AuthService.validate_registration_data(
+                    "testuser", email, "password123"
+                )
+
+                self.assertFalse(is_valid)
+                self.assertEqual(error, "Invalid email format")
+
 
 class TestUserExistenceCheck(AuthServiceTestCase):
     """Test checking if users already exist."""
@@ -219,6 +248,25 @@ class TestUserExistenceCheck(AuthServiceTestCase):
         self.assertTrue(exists)
         self.assertEqual(field, "username")
 
+    def test_username_precedence_across_different_users(self):
+        """Verify username wins when username and email match different users.
+
+        Returns:
+            None
+        """
+        db.session.add_all([
+            User(username="first", email="first@example.com", password_hash="hash"),
+            User(username="second", email="second@example.com", password_hash="hash"),
+        ])
+        db.session.commit()
+
+        exists, field = AuthService.check_user_exists(
+            username="second", email=" First@Example.com "
+        )
+
+        self.assertTrue(exists)
+        self.assertEqual(field, "username")
+
 
 class TestUserCreation(AuthServiceTestCase):
     """Test user creation functionality."""
@@ -244,6 +292,23 @@ class TestUserCreation(AuthServiceTestCase):
         self.assertIsNotNone(db_user)
         self.assertEqual(db_user.id, user.id)
 
+    def test_create_user_uses_configured_hash_method(self):
+        """Verify that passwords are hashed with PASSWORD_HASH_METHOD.
+
+        Returns:
+            None
+        """
+        self.app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:2000"
+
+        user = AuthService.create_user(
+            "testuser", "test@example.com", "password123"
+        )
+
+        self.assertTrue(user.password_hash.startswith("pbkdf2:sha256:2000$"))
+        authenticated, error = AuthService.authenticate_user("testuser", "password123")
+        self.assertEqual(authenticated, user)
+        self.assertIsNone(error)
+
 
 class TestUserAuthentication(AuthServiceTestCase):
     """Test user authentication functionality."""
@@ -278,10 +343,27 @@ class TestUserAuthentication(AuthServiceTestCase):
             None
         """
         user, error = AuthService.authenticate_user("nonexistent", "password123")
-        
+
         self.assertIsNone(user)
         self.assertEqual(error, "Invalid username/email or password")
 
+    def test_authenticate_unknown_user_still_verifies_a_hash(self):
+        """Verify that unknown accounts pay the same hash cost as known ones.
+
+        Returns:
+            None
+        """
+        with patch(
+            "backend.services.auth_service.check_password_hash", return_value=False
+        ) as mock_check:
+            user, _ = AuthService.authenticate_user("nonexistent", "password123")
+
+        self.assertIsNone(user)
+        mock_check.assert_called_once()
+        dummy_hash, password = mock_check.call_args.args
+        self.assertTrue(dummy_hash.startswith(self.app.config["PASSWORD_HASH_METHOD"] + "$"))
+        self.assertEqual(password, "password123")
+
     def test_authenticate_invalid_password(self):
         """Verify that invalid password fails authentication.
 
@@ -289,10 +371,60 @@ class TestUserAuthentication(AuthServiceTestCase):
             None
         """
         user, error = AuthService.authenticate_user("testuser", "wrongpassword")
-        
+
+        self.assertIsNone(user)
+        self.assertEqual(error, "Invalid username/email or password")
+
+    def test_authenticate_upgrades_outdated_hash(self):
+        """Verify that a successful login rehashes with the configured method.
+
+        Returns:
+            None
+        """
+        old_hash = self.test_user.password_hash
+        self.app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:2000"
+
+        user, _ = AuthService.authenticate_user("testuser", "password123")
+
+        self.assertNotEqual(user.password_hash, old_hash)
+        self.assertTrue(user.password_hash.startswith("pbkdf2:sha256:2000$"))
+        self.assertFalse(AuthService.needs_rehash(user.password_hash))
+
+        # A failed login leaves the stored hash alone
+        self.app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:3000"
+        upgraded_hash = user.password_hash
+        AuthService.authenticate_user("testuser", "wrongpassword")
+        self.assertEqual(self.test_user.password_hash, upgraded_hash)
+
+    def test_argon2_hashing_and_legacy_upgrade(self):
+        """Verify Argon2id hashing and the upgrade of Werkzeug hashes.
+
+        Returns:
+            None
+        """
+        self.app.config["PASSWORD_HASH_METHOD"] = "argon2id"
+
+        user, _ = AuthService.authenticate_user("testuser", "password123")
+
+        self.assertTrue(user.password_hash.startswith("$argon2id$"))
+        self.assertFalse(AuthService.needs_rehash(user.password_hash))
+        self.assertTrue(AuthService.verify_password(user.password_hash, "password123"))
+        self.assertFalse(AuthService.verify_password(user.password_hash, "wrongpassword"))
+
+        user, error = AuthService.authenticate_user("testuser", "password123")
+        self.assertEqual(user, self.test_user)
+        self.assertIsNone(error)
+        user, error = AuthService.authenticate_user("testuser", "wrongpassword")
         self.assertIsNone(user)
         self.assertEqual(error, "Invalid username/email or password")
 
+        # Switching back to a Werkzeug method upgrades Argon2 hashes too
+        self.app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:2000"
+        self.assertTrue(AuthService.needs_rehash(self.test_user.password_hash))
+        self.assertTrue(AuthService.rehash_if_needed(self.test_user, "password123"))
+        self.assertTrue(self.test_user.password_hash.startswith("pbkdf2:sha256:2000$"))
+        self.assertFalse(AuthService.rehash_if_needed(self.test_user, "password123"))
+
     def test_authenticate_empty_username(self):
         """Verify that empty username fails authentication.
 
@@ -311,10 +443,26 @@ class TestUserAuthentication(AuthServiceTestCase):
             None
         """
         user, error = AuthService.authenticate_user("testuser", "")
-        
+
         self.assertIsNone(user)
         self.assertEqual(error, "Username/email and password are required")
 
+    def test_authenticate_rejects_impossible_lengths_without_hashing(self):
+        """Verify that out-of-range passwords fail before any hash check.
+
+        Returns:
+            None
+        """
+        with patch("backend.services.auth_service.check_password_hash") as mock_check:
+            for password in ("short", "x" * 1025):
+                with self.subTest(length=len(password)):
+                    user, error = AuthService.authenticate_user("testuser", password)
+
+                    self.assertIsNone(user)
+                    self.assertEqual(error, "Invalid username/email or password")
+
+        mock_check.assert_not_called()
+
 
 class TestPasswordResetTokens(AuthServiceTestCase):
     """Test password reset token functionality."""
@@ -367,6 +515,54 @@ class TestPasswordResetTokens(AuthServiceTestCase):
         self.assertIsNone(token)
         self.assertIsNone(error)  # Don't reveal if email exists
 
+    def test_generate_reset_token_skips_user_load(self):
+        """Verify that issuing a token reads columns without loading a User.
+
+        Returns:
+            None
+        """
+        user_id = self.test_user.id
+        db.session.remove()
+
+        token, _ = AuthService.generate_reset_token("  Test@Example.com ")
+
+        self.assertEqual(len(db.session.identity_map), 0)
+        user, error = AuthService.validate_reset_token(token)
+        self.assertIsNone(error)
+        self.assertEqual(user.id, user_id)
+
+    def test_reset_token_is_single_use(self):
+        """Verify that a token stops working once the password changes.
+
+        Returns:
+            None
+        """
+        token, _ = AuthService.generate_reset_token("test@example.com")
+
+        success, _ = AuthService.reset_password(token, "newpassword123")
+        self.assertTrue(success)
+
+        success, error = AuthService.reset_password(token, "anotherpassword")
+        self.assertFalse(success)
+        self.assertEqual(error, "Invalid or expired reset token")
+
+    def test_reset_token_expiry_and_tampering(self):
+        """Verify that old or altered tokens are rejected without a lookup.
+
+        Returns:
+            None
+        """
+        token, _ = AuthService.generate_reset_token("test@example.com")
+
+        with patch("backend.services.auth_service.RESET_TOKEN_MAX_AGE", -1):
+            user, error = AuthService.validate_reset_token(token)
+        self.assertIsNone(user)
+        self.assertEqual(error, "Reset token has expired")
+
+        user, error = AuthService.validate_reset_token(token[:-2] + "xx")
+        self.assertIsNone(user)
+        self.assertEqual(error, "Invalid or expired reset token")
+
     def test_reset_password_valid_token(self):
         """Verify that password reset works with valid token.
 
@@ -392,6 +588,32 @@ class TestPasswordResetTokens(AuthServiceTestCase):
         self.assertIsNone(user)
         self.assertIsNotNone(auth_error)
 
+    def test_reset_password_locks_and_reads_user_once(self):
+        """Verify that a reset reads the user once, under a row lock.
+
+        Returns:
+            None
+        """
+        token, _ = AuthService.generate_reset_token("test@example.com")
+        db.session.remove()
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            with patch.object(db.session, "get", wraps=db.session.get) as mock_get:
+                success, _ = AuthService.reset_password(token, "newpassword123")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertTrue(success)
+        self.assertTrue(mock_get.call_args.kwargs["with_for_update"])
+        self.assertEqual(
+            [statement.split()[0] for statement in statements], ["SELECT", "UPDATE"]
+        )
+
     def test_reset_password_invalid_token(self):
         """Verify that password reset fails with invalid token.
 
@@ -10,7 +10,10 @@ from datetime import datetime, timedelta, date
 from backend import create_app
 from backend.database import db
 from backend.models import User, ScreenTimeLog, Badge, UserBadge, Friendship
-from backend.services.badge_achievement_service import BadgeAchievementService
+from backend.services.badge_achievement_service import (
+    BadgeAchievementService,
+    _STREAK_TIERS,
+)
 
 
 class BadgeAchievementServiceTestCase(unittest.TestCase):
@@ -106,6 +109,26 @@ class BadgeAchievementServiceTestCase(unittest.TestCase):
         # Should return some badges (exact badges depend on implementation)
         self.assertIsInstance(badges, list)
 
+    def test_award_tiers_awards_every_reached_threshold(self):
+        """Verify tier lookup awards thresholds up to and including the value.
+
+        Returns:
+            None
+        """
+        self.test_user.streak_count = 14
+        db.session.commit()
+
+        badges = BadgeAchievementService._check_streak_badges(self.test_user)
+
+        self.assertEqual(badges, ['Fresh Start', '7-Day Focus', 'Habit Builder'])
+        # Already-earned tiers are not reported again
+        self.assertEqual(
+            BadgeAchievementService._award_tiers(
+                self.test_user.id, _STREAK_TIERS, 30
+            ),
+            ['Unstoppable'],
+        )
+
     def test_check_reduction_badges_qualification(self):
         """Test reduction badge qualification.
 
@@ -130,6 +153,46 @@ class BadgeAchievementServiceTestCase(unittest.TestCase):
         # Should return a list (may be empty)
         self.assertIsInstance(badges, list)
 
+    def test_activity_counts_in_one_query(self):
+        """Verify friend and challenge counts come back from one statement.
+
+        Returns:
+            None
+        """
+        from sqlalchemy import event
+
+        friend = User(username="friend", email="friend@example.com", password_hash="x")
+        pending = User(username="pending", email="pending@example.com", password_hash="x")
+        db.session.add_all([friend, pending])
+        db.session.flush()
+        db.session.add_all([
+            Friendship(user_id=friend.id, friend_id=self.test_user.id, status="accepted"),
+            Friendship(user_id=self.test_user.id, friend_id=pending.id, status="pending"),
+        ])
+        db.session.commit()
+        user_id = self.test_user.id
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            counts = BadgeAchievementService._get_activity_counts(user_id)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(counts, {
+            "friend_count": 1,
+            "accepted_challenges": 0,
+            "has_won_challenge": False,
+        })
+        self.assertEqual(
+            BadgeAchievementService._check_social_badges(self.test_user, counts),
+            ['Team Player'],
+        )
+
     def test_check_leaderboard_badges_qualification(self):
         """Test leaderboard badge qualification.
 
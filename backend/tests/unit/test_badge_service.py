@@ -119,6 +119,24 @@ class TestGetAllBadges(BadgeServiceTestCase):
         self.assertEqual(len(badges), 0)
 
 
+class TestGetBadgeCatalog(BadgeServiceTestCase):
+    """Test the column-projected badge catalog."""
+
+    def test_catalog_matches_to_dict(self):
+        """Verify that catalog rows match the model serialization.
+
+        Returns:
+            None
+        """
+        catalog = BadgeService.get_badge_catalog()
+        expected = [badge.to_dict() for badge in BadgeService.get_all_badges()]
+
+        self.assertEqual(
+            sorted(catalog, key=lambda b: b["id"]),
+            sorted(expected, key=lambda b: b["id"]),
+        )
+
+
 class TestGetUserBadges(BadgeServiceTestCase):
     """Test getting badges for a specific user."""
 
@@ -150,13 +168,49 @@ class TestGetUserBadges(BadgeServiceTestCase):
         db.session.add(user_badge2)
         db.session.commit()
 
-        user_badges = BadgeService.get_user_badges(self.test_user.id)
+        from sqlalchemy import event
+
+        user_id = self.test_user.id
+        db.session.expire_all()
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            user_badges = BadgeService.get_user_badges(user_id)
+            names = [user_badge.badge.name for user_badge in user_badges]
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
         
         self.assertEqual(len(user_badges), 2)
-        # Verify eager loading works
-        for user_badge in user_badges:
-            self.assertIsNotNone(user_badge.badge)
-            self.assertIn(user_badge.badge.name, ["First Steps", "Week Warrior"])
+        # Verify eager loading works: badges come from the same SELECT
+        self.assertEqual(len(statements), 1)
+        for name in names:
+            self.assertIn(name, ["First Steps", "Week Warrior"])
+
+    def test_badge_list_matches_to_dict(self):
+        """Verify that joined badge rows match the model serialization.
+
+        Returns:
+            None
+        """
+        db.session.add_all([
+            UserBadge(user_id=self.test_user.id, badge_id=self.badge1.id),
+            UserBadge(user_id=self.test_user.id, badge_id=self.badge2.id),
+        ])
+        db.session.commit()
+
+        expected = [
+            user_badge.to_dict()
+            for user_badge in BadgeService.get_user_badges(self.test_user.id)
+        ]
+
+        self.assertEqual(
+            BadgeService.get_user_badge_list(self.test_user.id),
+            sorted(expected, key=lambda b: b["id"]),
+        )
 
     def test_get_user_badges_different_user(self):
         """Verify that only specific user's badges are returned.
@@ -212,6 +266,31 @@ class TestAwardBadge(BadgeServiceTestCase):
         self.assertIsNotNone(user_badge)
         self.assertIsNotNone(user_badge.earned_at)
 
+    def test_award_badge_inserts_without_existence_check(self):
+        """Verify that an award is one conflict-tolerant INSERT.
+
+        Returns:
+            None
+        """
+        from sqlalchemy import event
+
+        user = db.session.get(User, self.test_user.id)
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            BadgeService.award_badge(user.id, "First Steps")
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertFalse(any("FROM user_badges" in stmt for stmt in statements))
+        inserts = [stmt for stmt in statements if stmt.startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+        self.assertIn("ON CONFLICT", inserts[0])
+
     def test_award_badge_nonexistent(self):
         """Verify that awarding nonexistent badge fails.
 
@@ -531,6 +610,23 @@ class TestInitializeBadges(BadgeServiceTestCase):
         # Should not create duplicates
         self.assertEqual(initial_count, second_count)
 
+    def test_initialize_badges_restores_missing_badge(self):
+        """Verify that only missing default badges are re-inserted.
+
+        Returns:
+            None
+        """
+        Badge.query.filter_by(name="Fresh Start").delete()
+        db.session.commit()
+        self.assertEqual(Badge.query.count(), 22)
+
+        BadgeService.initialize_badges()
+
+        self.assertEqual(Badge.query.count(), 23)
+        fresh_start = Badge.query.filter_by(name="Fresh Start").first()
+        self.assertIsNotNone(fresh_start)
+        self.assertIsNotNone(fresh_start.created_at)
+
 
 if __name__ == "__main__":
     unittest.main()
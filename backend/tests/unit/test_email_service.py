@@ -9,6 +9,7 @@ from flask_mail import Mail
 from backend.services.email_service import (
     send_password_reset_email,
     send_badge_notification,
+    send_challenge_completed_notification,
     send_friend_request_notification,
     send_friend_request_accepted_notification,
     send_welcome_email
@@ -33,6 +34,7 @@ class TestEmailService(unittest.TestCase):
         self.app.config['MAIL_PASSWORD'] = 'testpassword'
         self.app.config['MAIL_DEFAULT_SENDER'] = 'test@example.com'
         self.app.config['FRONTEND_URL'] = 'http://localhost:5173'
+        self.app.config['MAIL_SEND_ASYNC'] = False
         
         # Initialize Flask-Mail
         self.mail = Mail(self.app)
@@ -189,6 +191,27 @@ class TestEmailService(unittest.TestCase):
         self.assertIsNotNone(sent_message.body)
         self.assertIn(badge_name, sent_message.body)
 
+    @patch('backend.mail')
+    def test_send_challenge_completed_notification(self, mock_mail):
+        """Test sending a challenge result to the winner and to others."""
+        send_challenge_completed_notification(
+            'winner@example.com', 'winner', 'No TikTok Week', 1, True
+        )
+        sent_message = mock_mail.send.call_args[0][0]
+        self.assertEqual(sent_message.recipients, ['winner@example.com'])
+        self.assertIn('You won', sent_message.subject)
+        self.assertIn('No TikTok Week', sent_message.subject)
+        self.assertIn('Rank #1', sent_message.body)
+        self.assertIn('http://localhost:5173/challenges', sent_message.html)
+
+        send_challenge_completed_notification(
+            'other@example.com', 'other', 'No TikTok Week', 3, False
+        )
+        sent_message = mock_mail.send.call_args[0][0]
+        self.assertIn('Results are in', sent_message.subject)
+        self.assertIn('Rank #3', sent_message.html)
+        self.assertNotIn('You won', sent_message.body)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,102 @@
+"""Unit tests for the orjson-backed JSON provider.
+
+This module checks that ``jsonify`` and request parsing go through
+``OrjsonProvider`` and that its output stays compatible with Flask's
+default provider.
+"""
+import unittest
+from unittest.mock import patch
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import jsonify
+
+from backend import create_app
+from backend.utils import OrjsonProvider
+from backend.utils.helpers import api_json
+
+
+class OrjsonProviderTestCase(unittest.TestCase):
+    """Test case for the application JSON provider."""
+
+    def setUp(self):
+        """Create the app and push an app context.
+
+        Returns:
+            None
+        """
+        self.app = create_app("testing")
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+
+    def tearDown(self):
+        """Pop the app context.
+
+        Returns:
+            None
+        """
+        self.app_context.pop()
+
+    def test_app_uses_orjson_provider(self):
+        """Verify that the factory installs the provider.
+
+        Returns:
+            None
+        """
+        self.assertIsInstance(self.app.json, OrjsonProvider)
+
+    def test_jsonify_round_trip(self):
+        """Verify that jsonify output decodes back to the same payload.
+
+        Returns:
+            None
+        """
+        payload = {"apps": ["YouTube", "TikTok"], "minutes": 42, "ok": True}
+        response = jsonify(payload)
+
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(self.app.json.loads(response.get_data()), payload)
+
+    def test_native_and_fallback_types(self):
+        """Verify dates encode as ISO strings and Decimal uses the fallback.
+
+        Returns:
+            None
+        """
+        encoded = self.app.json.dumps({
+            "day": date(2024, 1, 2),
+            "at": datetime(2024, 1, 2, 3, 4, 5),
+            "amount": Decimal("1.50"),
+            1: "non-string key",
+        })
+
+        self.assertEqual(
+            self.app.json.loads(encoded),
+            {
+                "day": "2024-01-02",
+                "at": "2024-01-02T03:04:05",
+                "amount": "1.50",
+                "1": "non-string key",
+            },
+        )
+
+    def test_api_json_encodes_without_str_round_trip(self):
+        """Verify api_json bodies are the provider's bytes with API headers.
+
+        Returns:
+            None
+        """
+        payload = [{"id": 1, "name": "Tiny Wins", "earned_at": None}]
+
+        with patch.object(
+            self.app.json, "dumps", side_effect=AssertionError("str encode")
+        ):
+            response = api_json(payload, 201)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_data(), self.app.json.dumps_bytes(payload))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,8 @@ covering global leaderboard functionality and user ranking.
 import unittest
 from datetime import date, timedelta
 
+from sqlalchemy import event
+
 from backend import create_app
 from backend.database import db
 from backend.models import User, ScreenTimeLog, Goal
@@ -288,6 +290,137 @@ class TestGetGlobalLeaderboard(LeaderboardServiceTestCase):
         self.assertEqual(entry["username"], "alice")
         self.assertEqual(entry["streak"], 1)  # Only day 1 counts
 
+    def test_get_global_leaderboard_matches_per_user_stats(self):
+        """Verify batched stats match compute_user_monthly_stats.
+
+        Covers a day summed across apps and a day where "Total" wins.
+
+        Returns:
+            None
+        """
+        today = date.today()
+        db.session.add_all([
+            ScreenTimeLog(user_id=self.user1.id, app_name="YouTube",
+                          screen_time_minutes=30, date=today),
+            ScreenTimeLog(user_id=self.user1.id, app_name="TikTok",
+                          screen_time_minutes=20, date=today),
+            ScreenTimeLog(user_id=self.user2.id, app_name="YouTube",
+                          screen_time_minutes=90, date=today),
+            ScreenTimeLog(user_id=self.user2.id, app_name="Total",
+                          screen_time_minutes=60, date=today),
+        ])
+        db.session.commit()
+
+        leaderboard = LeaderboardService.get_global_leaderboard()
+
+        for entry in leaderboard:
+            stats = LeaderboardService.compute_user_monthly_stats(entry["user_id"])
+            for key, value in stats.items():
+                self.assertEqual(entry[key], value)
+        self.assertEqual(
+            [(e["username"], e["total_minutes"]) for e in leaderboard],
+            [("alice", 50), ("bob", 60)],
+        )
+
+    def test_get_global_leaderboard_query_count_independent_of_users(self):
+        """Verify that stats are loaded in a fixed number of queries.
+
+        Returns:
+            None
+        """
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        today = date.today()
+        self._add_screen_time(self.user1.id, today, 100)
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            LeaderboardService.get_global_leaderboard()
+            one_user = len(statements)
+
+            self._add_screen_time(self.user2.id, today, 110)
+            self._add_screen_time(self.user3.id, today, 120)
+            statements.clear()
+            LeaderboardService.get_global_leaderboard()
+            three_users = len(statements)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(one_user, three_users)
+
+
+    def test_compute_user_monthly_stats_uses_one_query(self):
+        """Verify that a user's goal and logs are read in one round-trip.
+
+        Returns:
+            None
+        """
+        today = date.today()
+        user_id = self.user1.id
+        db.session.add(Goal(user_id=user_id, goal_type="daily", target_minutes=100))
+        self._add_screen_time(user_id, today, 80)
+        db.session.commit()
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            stats = LeaderboardService.compute_user_monthly_stats(user_id)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(stats["streak"], 1)
+        self.assertEqual(stats["total_minutes"], 80)
+
+        # Over the goal the day no longer counts toward the streak
+        self._add_screen_time(user_id, today, 150)
+        self.assertEqual(
+            LeaderboardService.compute_user_monthly_stats(user_id)["streak"], 0
+        )
+
+
+    def test_sync_streak_counts_bulk_updates_users(self):
+        """Verify streaks are written for every user in fixed statements.
+
+        Returns:
+            None
+        """
+        today = date.today()
+        alice_id, bob_id, charlie_id = self.user1.id, self.user2.id, self.user3.id
+        self._add_screen_time(alice_id, today, 80)
+        self._add_screen_time(bob_id, today, 90)
+        self.user3.streak_count = 5  # Stale: charlie has no logs this month
+        db.session.commit()
+        statements = []
+
+        selects = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement.split()[0], executemany))
+            if "streak_count !=" in statement:
+                selects.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", _record)
+        try:
+            updated = LeaderboardService.sync_streak_counts()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _record)
+
+        self.assertEqual(updated, 3)
+        self.assertEqual([s for s in statements if s[0] == "UPDATE"], [("UPDATE", True)])
+        # Active users are excluded by a subquery, not one bind per user
+        self.assertEqual(len(selects), 1)
+        self.assertIn("NOT IN (SELECT", selects[0])
+        self.assertEqual(
+            {u.id: u.streak_count for u in User.query.all()},
+            {alice_id: 1, bob_id: 1, charlie_id: 0},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,9 @@ covering screen time entry creation, validation, and retrieval.
 """
 import unittest
 from datetime import date, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import text
 
 from backend import create_app
 from backend.database import db
@@ -78,6 +81,18 @@ class TestCreateEntry(ScreenTimeServiceTestCase):
         self.assertEqual(entry_dict["hours"], 1)
         self.assertEqual(entry_dict["minutes"], 30)
 
+    def test_create_entry_app_name_is_case_insensitive(self):
+        """Verify that app names are matched case-insensitively.
+
+        Returns:
+            None
+        """
+        data = {"app_name": "  tiktok ", "minutes": 15}
+
+        entry = ScreenTimeService.create_entry(self.test_user.id, data)
+
+        self.assertEqual(entry.app_name, "TikTok")
+
     def test_create_entry_without_app_name_defaults_to_total(self):
         """Verify that entry without app name defaults to 'Total'.
 
@@ -339,6 +354,54 @@ class TestGetEntries(ScreenTimeServiceTestCase):
         
         self.assertIn("date must be formatted as YYYY-MM-DD", str(context.exception))
 
+    def test_get_entries_rejects_other_iso_date_forms(self):
+        """Verify that only the YYYY-MM-DD ISO form is accepted.
+
+        Returns:
+            None
+        """
+        for value in ("20240102", "2024-W01-2", "2024-1-02"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    ScreenTimeService.get_entries(
+                        self.test_user.id,
+                        start_date_str=value
+                    )
+
+    def test_user_date_range_lookup_uses_index(self):
+        """Verify that per-user date range reads do not scan the table.
+
+        Returns:
+            None
+        """
+        plan = db.session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT * FROM screen_time_logs "
+                "WHERE user_id = :u AND date >= :start AND date <= :end"
+            ),
+            {"u": self.test_user.id, "start": "2024-01-01", "end": "2024-01-31"},
+        ).all()
+
+        self.assertIn("ix_screen_time_logs_user_date", " ".join(str(row[-1]) for row in plan))
+
+    def test_newest_first_scan_reads_index_backwards(self):
+        """Verify ``ORDER BY date DESC`` per user needs no separate sort.
+
+        Returns:
+            None
+        """
+        plan = " ".join(str(row[-1]) for row in db.session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT date, screen_time_minutes "
+                "FROM screen_time_logs WHERE user_id = :u "
+                "ORDER BY date DESC LIMIT 60"
+            ),
+            {"u": self.test_user.id},
+        ).all())
+
+        self.assertIn("ix_screen_time_logs_user_date", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
     def test_get_entries_different_user(self):
         """Verify that entries are filtered by user.
 
@@ -359,6 +422,98 @@ class TestGetEntries(ScreenTimeServiceTestCase):
         self.assertEqual(len(entries), 0)
 
 
+class TestLogSummary(ScreenTimeServiceTestCase):
+    """Test the combined per-user log statistics."""
+
+    def test_summary_matches_individual_statistics(self):
+        """Verify the single-query summary agrees with the per-stat methods.
+
+        Returns:
+            None
+        """
+        today = date.today()
+        db.session.add_all([
+            ScreenTimeLog(user_id=self.test_user.id, app_name="Total",
+                          screen_time_minutes=minutes, date=today - timedelta(days=offset))
+            for offset, minutes in ((0, 100), (3, 50), (10, 200), (40, 300))
+        ])
+        db.session.commit()
+
+        summary = ScreenTimeService.get_log_summary(self.test_user.id)
+
+        self.assertEqual(summary["log_count"], 4)
+        self.assertEqual(summary["first_date"], today - timedelta(days=40))
+        self.assertEqual(summary["min_minutes"], 50)
+        self.assertAlmostEqual(
+            summary["recent_week_avg"],
+            ScreenTimeService.get_recent_week_average(self.test_user.id),
+        )
+        self.assertAlmostEqual(
+            summary["monthly_avg"],
+            ScreenTimeService.get_monthly_average(self.test_user.id),
+        )
+        self.assertEqual(
+            ScreenTimeService.get_baseline_average(
+                self.test_user.id, first_date=summary["first_date"]
+            ),
+            ScreenTimeService.get_baseline_average(self.test_user.id),
+        )
+
+    def test_summary_without_logs(self):
+        """Verify that a user without logs gets zero counts and no averages.
+
+        Returns:
+            None
+        """
+        summary = ScreenTimeService.get_log_summary(self.test_user.id)
+
+        self.assertEqual(summary, {
+            "log_count": 0,
+            "first_date": None,
+            "min_minutes": None,
+            "recent_week_avg": None,
+            "monthly_avg": None,
+        })
+
+
+class TestWeekendAchievement(ScreenTimeServiceTestCase):
+    """Test the Saturday-and-Sunday goal check."""
+
+    def test_sql_grouping_matches_python_fallback(self):
+        """Verify SQL weekend grouping agrees with the portable Python path.
+
+        Returns:
+            None
+        """
+        cases = {
+            "weekend across new year": [("2022-12-31", 100), ("2023-01-01", 100)],
+            "sunday over threshold": [("2023-01-07", 100), ("2023-01-08", 200)],
+            "saturday only": [("2023-01-06", 50), ("2023-01-07", 100)],
+            "days in different weeks": [("2023-01-08", 100), ("2023-01-14", 100)],
+        }
+        expected = {"weekend across new year": True}
+
+        for name, logs in cases.items():
+            with self.subTest(name):
+                ScreenTimeLog.query.delete()
+                db.session.add_all([
+                    ScreenTimeLog(user_id=self.test_user.id, app_name="Total",
+                                  screen_time_minutes=minutes,
+                                  date=date.fromisoformat(day))
+                    for day, minutes in logs
+                ])
+                db.session.commit()
+
+                in_sql = ScreenTimeService.check_weekend_achievement(self.test_user.id)
+                with patch("backend.services.screen_time_service._WEEKEND_SQL", {}):
+                    in_python = ScreenTimeService.check_weekend_achievement(
+                        self.test_user.id
+                    )
+
+                self.assertEqual(in_sql, expected.get(name, False))
+                self.assertEqual(in_sql, in_python)
+
+
 class TestGetAllowedApps(ScreenTimeServiceTestCase):
     """Test allowed apps functionality."""
 
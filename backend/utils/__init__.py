@@ -4,12 +4,22 @@ from .helpers import (
     canonicalize_app_name,
     list_allowed_apps,
     current_time_utc,
+    parse_iso_date,
     add_api_headers,
+    api_json,
+    api_json_bytes,
+    require_json,
 )
+from .json_provider import OrjsonProvider
 
 __all__ = [
     'canonicalize_app_name',
     'list_allowed_apps',
     'current_time_utc',
+    'parse_iso_date',
     'add_api_headers',
+    'api_json',
+    'api_json_bytes',
+    'require_json',
+    'OrjsonProvider',
 ]
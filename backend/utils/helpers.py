@@ -1,8 +1,12 @@
 """Utility functions and constants for the Screen Time backend."""
 
-from datetime import datetime, timezone
+import hashlib
+from datetime import date, datetime, timezone
+from functools import wraps
 from typing import List, Tuple
 
+from flask import current_app, request
+
 DEFAULT_APP_NAME = "Total"
 
 # Canonical set of apps exposed to the frontend dropdown.
@@ -18,6 +22,10 @@ ALLOWED_APPS: Tuple[str, ...] = (
     "Other",
 )
 
+# Case-insensitive lookup table and error text, built once for validators
+_ALLOWED_APPS_BY_KEY = {app.lower(): app for app in ALLOWED_APPS}
+_INVALID_APP_MESSAGE = "App name must be one of: " + ", ".join(ALLOWED_APPS)
+
 
 def current_time_utc() -> datetime:
     """Return a timezone-aware UTC timestamp.
@@ -29,6 +37,33 @@ def current_time_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def parse_iso_date(value: str) -> date:
+    """Parse a strict ``YYYY-MM-DD`` string into a ``date``.
+
+    Uses the C-level ``date.fromisoformat`` instead of ``strptime``, after
+    rejecting the other ISO 8601 forms it accepts (``20240102``,
+    ``2024-W01-2``).
+
+    Args:
+        value (str): Date string supplied by the client.
+
+    Returns:
+        date: Parsed calendar date.
+
+    Raises:
+        ValueError: If the value is not a ``YYYY-MM-DD`` string.
+    """
+
+    if (
+        not isinstance(value, str)
+        or len(value) != 10
+        or value[4] != "-"
+        or value[7] != "-"
+    ):
+        raise ValueError(f"Invalid date: {value!r}")
+    return date.fromisoformat(value)
+
+
 def list_allowed_apps() -> List[str]:
     """Expose the allowed screen-time apps for dropdowns.
 
@@ -60,29 +95,128 @@ def canonicalize_app_name(raw_name: str | None) -> str:
     if not candidate:
         return DEFAULT_APP_NAME
 
-    lower_candidate = candidate.lower()
-    for allowed in ALLOWED_APPS:
-        if lower_candidate == allowed.lower():
-            return allowed
+    try:
+        return _ALLOWED_APPS_BY_KEY[candidate.lower()]
+    except KeyError:
+        raise ValueError(_INVALID_APP_MESSAGE) from None
+
+
+# Standard headers for JSON API responses, applied at construction time
+_API_HEADERS: Tuple[Tuple[str, str], ...] = (
+    ("Content-Type", "application/json"),
+    ("Cache-Control", "no-store, no-cache, must-revalidate"),
+    ("Pragma", "no-cache"),
+)
+
+
+# Pre-encoded bodies for the constant errors returned by ``require_json``
+_NEED_JSON_BODY = b'{"error":"Content-Type must be application/json"}'
+_INVALID_JSON_BODY = b'{"error":"Invalid JSON"}'
+
+
+def api_json_bytes(body: bytes, status: int = 200):
+    """Build a JSON API response from an already encoded body.
+
+    A fresh response is built per request because after-request hooks
+    (CORS, sessions) mutate headers in place, but constant bodies skip
+    serialization entirely.
+
+    Args:
+        body (bytes): Encoded JSON document
+        status (int): HTTP status code
+
+    Returns:
+        Response: JSON response carrying the standard API headers
+    """
+    return current_app.response_class(body, status=status, headers=_API_HEADERS)
+
+
+def api_json(payload, status: int = 200):
+    """Build a JSON API response with the standard headers already set.
+
+    Equivalent to ``add_api_headers(make_response(jsonify(payload), status))``
+    without mutating the headers one by one after construction. The body
+    is encoded straight to bytes by the app's orjson provider, skipping
+    the ``str`` decode and re-encode.
+
+    Args:
+        payload: JSON-serializable response body
+        status (int): HTTP status code
+
+    Returns:
+        Response: JSON response carrying the standard API headers
+    """
+    return api_json_bytes(current_app.json.dumps_bytes(payload), status)
+
+
+def require_json(error_status: int = 415, allow_empty: bool = False):
+    """Require a JSON body and pass it to the view as ``payload``.
 
-    raise ValueError(
-        "App name must be one of: " + ", ".join(ALLOWED_APPS)
-    )
+    The body is read once, without caching the raw bytes on the request,
+    and decoded with the app's JSON provider.
 
+    Args:
+        error_status (int): Status returned when the Content-Type is not
+            ``application/json``
+        allow_empty (bool): Accept a missing body of any Content-Type and
+            pass an empty dict
+
+    Returns:
+        Callable: Decorator injecting the decoded body as ``payload``
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            has_body = bool(request.content_length)
+            if allow_empty and not has_body:
+                return view(*args, payload={}, **kwargs)
+
+            if request.content_type != "application/json":
+                return api_json_bytes(_NEED_JSON_BODY, error_status)
 
-def add_api_headers(response):
+            try:
+                payload = current_app.json.loads(request.get_data(cache=False))
+            except ValueError:
+                return api_json_bytes(_INVALID_JSON_BODY, 400)
+
+            return view(*args, payload=payload, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def add_api_headers(response, conditional: bool = False):
     """Add standard HTTP headers to API response.
 
     Adds headers for content type and caching control to ensure proper
-    API behavior and security.
+    API behavior and security. Conditional responses get an ETag and may
+    be revalidated by the client instead of re-downloaded.
 
     Args:
         response: Flask Response object to modify
+        conditional (bool): Tag successful GET bodies with an ETag and
+            answer a matching ``If-None-Match`` with 304 Not Modified
 
     Returns:
         Response: Modified response object with added headers
     """
     response.headers["Content-Type"] = "application/json"
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
     response.headers["Pragma"] = "no-cache"
-    return response
+
+    if not (
+        conditional
+        and request.method == "GET"
+        and response.status_code == 200
+        and not response.direct_passthrough
+    ):
+        response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+        return response
+
+    # Private so shared proxies never serve one user's badges to another
+    response.headers["Cache-Control"] = "private, no-cache"
+    if response.get_etag()[0] is None:
+        digest = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+        response.set_etag(digest)
+    return response.make_conditional(request)
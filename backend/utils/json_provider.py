@@ -0,0 +1,85 @@
+"""orjson-backed JSON provider for the Flask app."""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Route ``jsonify`` and ``request.get_json`` through orjson.
+
+    Types orjson cannot encode natively (``Decimal``, ``__html__``) fall
+    back to Flask's default conversion.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        """Build the orjson option flags for the current settings.
+
+        Args:
+            indent (bool): Pretty-print with two-space indentation.
+
+        Returns:
+            int: Bitmask of ``orjson.OPT_*`` flags.
+        """
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """Serialize ``obj`` straight to UTF-8 bytes.
+
+        Args:
+            obj (Any): Value to encode.
+            indent (bool): Pretty-print with two-space indentation.
+
+        Returns:
+            bytes: Encoded JSON document.
+        """
+
+        return orjson.dumps(
+            obj, default=self.default, option=self._options(indent)
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize ``obj`` to a JSON string.
+
+        Args:
+            obj (Any): Value to encode.
+            **kwargs: Accepted for API compatibility; only ``indent`` is used.
+
+        Returns:
+            str: Encoded JSON document.
+        """
+
+        return self.dumps_bytes(obj, indent=bool(kwargs.get("indent"))).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize a JSON document.
+
+        Args:
+            s (str | bytes): Encoded JSON.
+            **kwargs: Ignored; kept for API compatibility.
+
+        Returns:
+            Any: Decoded Python value.
+        """
+
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        """Build a JSON response without the intermediate ``str`` round trip.
+
+        Returns:
+            Response: Response whose body is the orjson-encoded payload.
+        """
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent), mimetype=self.mimetype
+        )